@@ -257,6 +257,7 @@ class AlliedVision(Camera):
     def set_exposure(self, exposure_s):
         """See :meth:`.Camera.set_exposure`."""
         self.cam.ExposureTime.set(float(exposure_s * 1e6))
+        self._update_acquisition_exposure(exposure_s)
 
     def set_woi(self, woi=None):
         """See :meth:`.Camera.set_woi`."""
@@ -3,6 +3,7 @@ Abstract camera functionality.
 """
 
 import time
+import threading
 import numpy as np
 import matplotlib.pyplot as plt
 from scipy.optimize import curve_fit
@@ -40,6 +41,13 @@ class Camera:
         The user is expected to apply this transform to the matrix returned in
         :meth:`get_image()`. Note that WOI changes are applied on the camera hardware
         **before** this transformation.
+    acquisition : dict OR None
+        State of the background acquisition engine started by
+        :meth:`start_acquisition()`, or ``None`` if the engine is not running.
+        Contains the ring buffer ``"images"`` of native-dtype frames and the
+        corresponding ``"frames"`` numbers, ``"timestamps"`` (the start of the
+        exposure, see :meth:`start_acquisition()`), and ``"arrivals"`` (when the frame
+        was returned by :meth:`get_image()`).
     """
 
     def __init__(
@@ -113,6 +121,9 @@ class Camera:
         # Default to None, allow subclass constructors to fill.
         self.exposure_bounds_s = None
 
+        # Background acquisition engine, see start_acquisition().
+        self.acquisition = None
+
     def close(self):
         """
         Abstract method to close the camera and delete related objects.
@@ -167,6 +178,38 @@ class Camera:
         """
         raise NotImplementedError()
 
+    def _update_acquisition_exposure(self, exposure_s):
+        """
+        Keeps the exposure used to timestamp frames of the acquisition engine
+        (see :meth:`start_acquisition()`) current.
+        Subclasses **should** call this at the end of :meth:`set_exposure()`.
+
+        Parameters
+        ----------
+        exposure_s : float
+            The new integration time in seconds.
+        """
+        acquisition = self.acquisition
+        if acquisition is not None:
+            with acquisition["condition"]:
+                acquisition["exposure_s"] = float(exposure_s)
+
+    def _get_image_timestamp(self):
+        """
+        Abstract method to return the start of the exposure of the frame last returned by
+        :meth:`get_image()`, in :meth:`time.perf_counter()` time, from hardware
+        timestamps. Subclasses whose driver provides timestamps synchronized to the host
+        **may** overwrite this. Used by the acquisition engine
+        (see :meth:`start_acquisition()`).
+
+        Returns
+        -------
+        float OR None
+            The start of the exposure, or ``None`` (the default) if unavailable, in
+            which case the start is estimated from the arrival of the frame.
+        """
+        return None
+
     def set_woi(self, woi=None):
         """
         Abstract method to narrow the imaging region to a 'window of interest'
@@ -215,35 +258,435 @@ class Camera:
         """
         raise NotImplementedError()
 
-    def get_images(self, image_count, flush=False):
+    def get_image_after(self, t, timeout_s=1):
+        """
+        Returns the first frame whose exposure starts at or after time ``t``.
+        This pairs a frame with an event (e.g. an SLM write settling at ``t``) without
+        conservative sleeps or stale frames.
+
+        If the acquisition engine is running (see :meth:`start_acquisition()`), the
+        frame is matched by timestamp with :meth:`next_after()`. Otherwise, this waits
+        until ``t``, flushes, and grabs frames until one starts at or after ``t``
+        according to :meth:`_get_image_timestamp()`. Without hardware timestamps, the
+        first frame after the flush is discarded, as it may have been exposing at ``t``.
+        Overwrite this implementation if a camera supports triggering, as is done for
+        :meth:`~slmsuite.hardware.cameras.thorlabs.ThorCam.get_image_after()`.
+
+        Parameters
+        ----------
+        t : float
+            Time from :meth:`time.perf_counter()`.
+        timeout_s : float
+            The time in seconds to wait for the frame after ``t``.
+
+        Returns
+        -------
+        numpy.ndarray
+            Array of shape :attr:`shape`.
+        """
+        if self.acquisition is not None:
+            return self.next_after(t, timeout_s=timeout_s)
+
+        remaining = t - time.perf_counter()
+        if remaining > 0:
+            time.sleep(remaining)
+
+        self.flush()
+
+        previous = -np.inf
+        while True:
+            image = self.get_image(timeout_s=timeout_s)
+            if image is None:
+                return image
+
+            start = self._get_image_timestamp()
+            if start is None:
+                start = previous
+            if start >= t:
+                return image
+            previous = time.perf_counter()
+
+    def get_images(
+        self, image_count, flush=False, out=None, dtype=None, reduce=None, window=None
+    ):
         """
         Grab ``image_count`` images in succession. Overwrite this
         implementation if a camera supports faster batch acquisition.
 
+        Images are kept in the native dtype returned by :meth:`get_image()`
+        (e.g. ``uint16`` for 12-bit cameras) unless ``dtype`` is given. With ``reduce``,
+        frames are accumulated on the fly such that only a single frame is held in
+        memory, regardless of ``image_count``.
+
+        If the acquisition engine is running (see :meth:`start_acquisition()`), the
+        images are instead a view into the ring buffer of native-dtype frames, unless a
+        copy is required by ``out``, ``dtype``, or ``window``.
+        With ``flush=True``, these are the next ``image_count`` frames to start after
+        this call. Otherwise, these are the most recent ``image_count`` frames.
+
         Parameters
         ----------
         image_count : int
             Number of images to grab.
         flush : bool
             Whether to flush before grabbing.
+        out : numpy.ndarray OR None
+            Preallocated array to fill, of the shape of the result (see below).
+            Its dtype takes precedence over ``dtype``.
+        dtype : numpy.dtype OR None
+            Datatype of the result. If ``None``, the native dtype of the camera, except
+            for ``reduce="sum"`` and ``"mean"`` which default to ``numpy.float64``
+            to avoid overflow.
+        reduce : {"sum", "mean", "max"} OR None
+            Reduction over the stack of images, computed as a running sum, mean, or
+            maximum. If ``None``, the full stack is returned.
+        window : array_like OR None
+            Region ``(x, width, y, height)`` centered at ``(x, y)``, in the same
+            convention as :meth:`autoexposure()`, to which the images are cropped.
+            If ``None``, the full camera frame is used.
 
         Returns
         -------
         numpy.ndarray
-            Array of shape ``(image_count, height, width)``.
+            Array of shape ``(image_count, height, width)``, or ``(height, width)`` if
+            ``reduce`` is given, where ``height, width`` are those of ``window``.
         """
-        # Preallocate memory.
-        imlist = np.empty((int(image_count), self.shape[0], self.shape[1]))
+        image_count = int(image_count)
+        crop = self._parse_window(window)
+
+        if reduce not in (None, "sum", "mean", "max"):
+            raise ValueError("Unrecognized reduce '{}'.".format(reduce))
+        if dtype is None and out is None and reduce in ("sum", "mean"):
+            dtype = np.float64
+
+        if self.acquisition is not None:
+            # Find the frames to pull from the ring buffer.
+            if flush:
+                first = self.next_after(time.perf_counter(), return_metadata=True)[1]
+            else:
+                first = self.latest(return_metadata=True)[1] - image_count + 1
+                first = max(first, self.acquisition["count"] - self.acquisition["frame_count"], 0)
 
-        # Flush if desired.
-        if flush:
-            self.flush()
+            # Zero-copy view of the whole stack.
+            if (
+                reduce is None and out is None and dtype is None and window is None
+                and image_count <= self.acquisition["frame_count"]
+            ):
+                return self._get_ring(first, image_count)
 
-        # Grab images.
-        for i in range(image_count):
-            imlist[i] = self.get_image()
+            images = (self._get_ring(first + i, 1)[0] for i in range(image_count))
+        else:
+            if flush:
+                self.flush()
+
+            images = (self.get_image() for _ in range(image_count))
+
+        # Grab images, allocating the result once the native dtype is known.
+        for (i, image) in enumerate(images):
+            image = image[crop]
+
+            if out is None:
+                shape = image.shape if reduce is not None else (image_count,) + image.shape
+                out = np.empty(shape, dtype=image.dtype if dtype is None else dtype)
+
+            if reduce is None:
+                out[i] = image
+            elif i == 0:
+                out[...] = image
+            elif reduce == "max":
+                np.maximum(out, image, out=out, casting="unsafe")
+            else:
+                np.add(out, image, out=out, casting="unsafe")
 
-        return imlist
+        if reduce == "mean" and image_count > 0:
+            np.divide(out, image_count, out=out, casting="unsafe")
+
+        return out
+
+    def _parse_window(self, window):
+        """
+        Converts a centered ``(x, width, y, height)`` window into a tuple of slices.
+        See :meth:`get_images()`.
+        """
+        if window is None:
+            return (slice(None), slice(None))
+
+        wxi = max(int(window[0] - window[1] / 2), 0)
+        wxf = int(window[0] + window[1] / 2)
+        wyi = max(int(window[2] - window[3] / 2), 0)
+        wyf = int(window[2] + window[3] / 2)
+
+        return (slice(wyi, wyf), slice(wxi, wxf))
+
+    def start_acquisition(self, frame_count=16, timeout_s=1, latency_s=None):
+        """
+        Starts a background thread which continuously pulls frames from
+        :meth:`get_image()` into a preallocated ring buffer. Frames are then
+        accessed without copies or driver latency via :meth:`latest()`,
+        :meth:`next_after()`, and :meth:`get_images()`.
+
+        The camera should be configured to acquire continuously (free-running) rather
+        than on software triggers, and :meth:`get_image()` should not be called
+        by the user while the engine is running.
+
+        Note
+        ~~~~
+        Each frame is stamped with the start of its exposure, from
+        :meth:`_get_image_timestamp()` if the camera provides hardware timestamps.
+        Otherwise, the start is estimated as the arrival of the frame minus the current
+        exposure (kept current by :meth:`set_exposure()`) and minus ``latency_s``,
+        the readout, transfer, and driver queue delay. If unknown, this delay is
+        bounded by the time since the previous frame arrived, as a free-running camera
+        exposes a frame while the previous one is read out. Overestimating the delay
+        only makes :meth:`next_after()` wait for one more frame, while underestimating it
+        could pair an event with a frame exposed before it. As a guard, an estimated
+        start is never later than the arrival of the previous frame, such that the first
+        frame to arrive after an event is never paired with it.
+
+        Caution
+        ~~~~~~~
+        Returned images are views into the ring buffer, which are overwritten after
+        ``frame_count`` further frames. Copy any image which must persist.
+        Stop the engine before changing the WOI (see :meth:`set_woi()`).
+
+        Parameters
+        ----------
+        frame_count : int
+            Number of frames in the ring buffer.
+        timeout_s : float
+            Timeout passed to :meth:`get_image()`.
+        latency_s : float OR None
+            Delay in seconds between the end of an exposure and the arrival of the frame.
+            If ``None``, bounded for each frame by the time since the previous frame.
+        """
+        if self.acquisition is not None:
+            self.stop_acquisition()
+
+        try:
+            exposure_s = float(self.get_exposure())
+        except NotImplementedError:
+            exposure_s = 0
+
+        frame_count = int(frame_count)
+        if frame_count < 1:
+            raise ValueError("frame_count must be positive.")
+
+        # The ring buffer is stored twice in succession such that any run of up to
+        # frame_count consecutive frames is a contiguous view. The native dtype is
+        # only known once the first frame arrives.
+        self.acquisition = {
+            "frame_count": frame_count,
+            "images": None,
+            "frames": np.full(2 * frame_count, -1, dtype=np.int64),
+            "timestamps": np.full(2 * frame_count, np.nan),
+            "arrivals": np.full(2 * frame_count, np.nan),
+            "count": 0,
+            "exposure_s": exposure_s,
+            "latency_s": latency_s,
+            "timeout_s": timeout_s,
+            "condition": threading.Condition(),
+            "stop": threading.Event(),
+            "error": None,
+        }
+        self.acquisition["thread"] = threading.Thread(
+            target=self._acquisition_worker,
+            args=(self.acquisition,),
+            name=str(self.name) + " acquisition",
+            daemon=True,
+        )
+        self.acquisition["thread"].start()
+
+    def stop_acquisition(self):
+        """
+        Stops the background thread started by :meth:`start_acquisition()` and
+        releases the ring buffer. Afterward, :meth:`get_image()` can again be
+        called directly.
+        """
+        acquisition = self.acquisition
+        if acquisition is None:
+            return
+
+        acquisition["stop"].set()
+        acquisition["thread"].join()
+        self.acquisition = None
+
+    def _acquisition_worker(self, acquisition):
+        """Thread target for :meth:`start_acquisition()`."""
+        condition = acquisition["condition"]
+        frame_count = acquisition["frame_count"]
+        previous = time.perf_counter()
+
+        while not acquisition["stop"].is_set():
+            try:
+                image = self.get_image(timeout_s=acquisition["timeout_s"])
+            except Exception as e:
+                with condition:
+                    acquisition["error"] = e
+                    condition.notify_all()
+                return
+
+            if image is None:       # Timeout; keep waiting.
+                continue
+
+            arrival = time.perf_counter()
+
+            # Start of the exposure, from hardware or estimated conservatively.
+            t = self._get_image_timestamp()
+            if t is None:
+                latency_s = acquisition["latency_s"]
+                if latency_s is None:
+                    latency_s = arrival - previous
+                t = min(arrival - acquisition["exposure_s"] - latency_s, previous)
+            previous = arrival
+
+            with condition:
+                if acquisition["images"] is None:
+                    acquisition["images"] = np.empty(
+                        (2 * frame_count,) + np.shape(image), dtype=image.dtype
+                    )
+
+                k = acquisition["count"]
+                for slot in (k % frame_count, k % frame_count + frame_count):
+                    acquisition["images"][slot] = image
+                    acquisition["frames"][slot] = k
+                    acquisition["timestamps"][slot] = t
+                    acquisition["arrivals"][slot] = arrival
+
+                acquisition["count"] = k + 1
+                condition.notify_all()
+
+        with condition:
+            condition.notify_all()
+
+    def _wait_frame(self, k, timeout_s):
+        """
+        Blocks until frame number ``k`` has been acquired by the engine.
+        Must be called while holding the acquisition condition.
+        """
+        acquisition = self.acquisition
+        if acquisition is None:
+            raise RuntimeError("Acquisition is not running. Call start_acquisition() first.")
+
+        def ready():
+            return (
+                acquisition["count"] > k
+                or acquisition["error"] is not None
+                or acquisition["stop"].is_set()
+            )
+
+        if not acquisition["condition"].wait_for(ready, timeout=timeout_s):
+            raise TimeoutError("Timed out waiting for frame {} from the acquisition thread.".format(k))
+        if acquisition["count"] <= k:
+            if acquisition["error"] is not None:
+                raise RuntimeError("Acquisition thread failed.") from acquisition["error"]
+            raise RuntimeError("Acquisition was stopped.")
+
+    def _get_ring(self, first, image_count, timeout_s=1):
+        """
+        Returns a view of ``image_count`` consecutive frames starting at frame number
+        ``first``, waiting for them to be acquired.
+        """
+        acquisition = self.acquisition
+        if acquisition is None:
+            raise RuntimeError("Acquisition is not running. Call start_acquisition() first.")
+        frame_count = acquisition["frame_count"]
+        if image_count > frame_count:
+            raise ValueError(
+                "Cannot view {} images in a ring buffer of {} frames. "
+                "Restart acquisition with a larger frame_count.".format(image_count, frame_count)
+            )
+
+        with acquisition["condition"]:
+            self._wait_frame(first + image_count - 1, timeout_s + image_count * acquisition["exposure_s"])
+
+            if first < acquisition["count"] - frame_count:
+                raise RuntimeError("Requested frames were already overwritten in the ring buffer.")
+
+            slot = first % frame_count
+            return acquisition["images"][slot:slot + image_count]
+
+    def latest(self, timeout_s=1, return_metadata=False):
+        """
+        Returns the most recent frame from the acquisition engine
+        (see :meth:`start_acquisition()`), waiting for the first frame if necessary.
+
+        Parameters
+        ----------
+        timeout_s : float
+            The time in seconds to wait for a first frame, in addition to the exposure.
+        return_metadata : bool
+            Whether to also return the frame number and timestamp.
+
+        Returns
+        -------
+        numpy.ndarray OR (numpy.ndarray, int, float)
+            View of the frame in the ring buffer, of shape :attr:`shape`.
+            If ``return_metadata``, also the frame number (counted from the start of
+            acquisition) and the estimated start time of the exposure
+            (from :meth:`time.perf_counter()`).
+        """
+        acquisition = self.acquisition
+        if acquisition is None:
+            raise RuntimeError("Acquisition is not running. Call start_acquisition() first.")
+
+        with acquisition["condition"]:
+            self._wait_frame(0, timeout_s + acquisition["exposure_s"])
+            slot = (acquisition["count"] - 1) % acquisition["frame_count"]
+            return self._ring_result(slot, return_metadata)
+
+    def next_after(self, t, timeout_s=1, return_metadata=False):
+        """
+        Returns the first frame from the acquisition engine
+        (see :meth:`start_acquisition()`) whose exposure started at or after time ``t``,
+        waiting for it if necessary. Useful to guarantee that a frame reflects a change
+        (e.g. an SLM write) made at ``t``.
+
+        Note
+        ~~~~
+        See :meth:`start_acquisition()` for how the start of the exposure is determined.
+
+        Parameters
+        ----------
+        t : float
+            Time from :meth:`time.perf_counter()`.
+        timeout_s : float
+            The time in seconds to wait for the frame, in addition to the exposure.
+        return_metadata : bool
+            Whether to also return the frame number and timestamp.
+
+        Returns
+        -------
+        numpy.ndarray OR (numpy.ndarray, int, float)
+            See :meth:`latest()`.
+        """
+        acquisition = self.acquisition
+        if acquisition is None:
+            raise RuntimeError("Acquisition is not running. Call start_acquisition() first.")
+        frame_count = acquisition["frame_count"]
+        deadline = time.perf_counter() + timeout_s + acquisition["exposure_s"]
+
+        with acquisition["condition"]:
+            k = max(acquisition["count"] - frame_count, 0)
+
+            while True:
+                self._wait_frame(k, max(deadline - time.perf_counter(), 0))
+
+                k = max(k, acquisition["count"] - frame_count)
+                while k < acquisition["count"]:
+                    slot = k % frame_count
+                    if acquisition["timestamps"][slot] >= t:
+                        return self._ring_result(slot, return_metadata)
+                    k += 1
+
+    def _ring_result(self, slot, return_metadata):
+        """Formats the result of :meth:`latest()` and :meth:`next_after()`."""
+        acquisition = self.acquisition
+        image = acquisition["images"][slot]
+
+        if return_metadata:
+            return image, int(acquisition["frames"][slot]), float(acquisition["timestamps"][slot])
+        else:
+            return image
 
     def autoexposure(
         self,
@@ -270,7 +713,8 @@ class Camera:
             :attr:`exposure_bounds_s`. If this attribute was not set (or not availible on
             a particular camera), then ``None`` instead defaults to unbounded.
         window : array_like or None
-            See :attr:`~slmsuite.hardware.cameras.camera.Camera.window`.
+            Region ``(x, width, y, height)`` centered at ``(x, y)`` over which to
+            evaluate the maximum. See :meth:`get_images()`.
             If ``None``, the full camera frame will be used.
         average_count : int
             Number of frames to average intensity over for noise reduction.
@@ -291,23 +735,11 @@ class Camera:
             else:
                 exposure_bounds_s = self.exposure_bounds_s
 
-        # Parse window
-        if window is None:
-            wxi = 0
-            wxf = self.shape[1]
-            wyi = 0
-            wyf = self.shape[0]
-        else:
-            wxi = int(window[0] - window[1] / 2)
-            wxf = int(window[0] + window[1] / 2)
-            wyi = int(window[2] - window[3] / 2)
-            wyf = int(window[2] + window[3] / 2)
-
         # Initialize loop
         set_val = 0.5 * self.bitresolution
         exp = self.get_exposure()
-        im_mean = np.mean(self.get_images(average_count, flush=True), 0)
-        im_max = np.amax(im_mean[wyi:wyf, wxi:wxf])
+        im_mean = self.get_images(average_count, flush=True, reduce="mean", window=window)
+        im_max = np.amax(im_mean)
 
         # Calculate the error as a percent of the camera's bitresolution
         err = np.abs(im_max - set_val) / self.bitresolution
@@ -319,8 +751,8 @@ class Camera:
             exp = exp / np.amax([0.5, np.amin([(im_max / set_val), 2])])
             exp = np.amax([exposure_bounds_s[0], np.amin([exp, exposure_bounds_s[1]])])
             self.set_exposure(exp)
-            im_mean = np.mean(self.get_images(average_count, flush=True), 0)
-            im_max = np.amax(im_mean[wyi:wyf, wxi:wxf])
+            im_mean = self.get_images(average_count, flush=True, reduce="mean", window=window)
+            im_max = np.amax(im_mean)
             err = np.abs(im_max - set_val) / self.bitresolution
 
             if verbose:
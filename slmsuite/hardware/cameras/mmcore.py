@@ -87,6 +87,7 @@ class MMCore(Camera):
     def set_exposure(self, exposure_s):
         """See :meth:`.Camera.set_exposure`."""
         self.cam.setExposure(1e3 * exposure_s)
+        self._update_acquisition_exposure(exposure_s)
 
     def set_woi(self, woi=None):
         """See :meth:`.Camera.set_woi`."""
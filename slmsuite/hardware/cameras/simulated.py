@@ -0,0 +1,299 @@
+"""
+Simulated camera which images the farfield of a virtual SLM, useful for testing and
+development. Paired with :class:`~slmsuite.hardware.slms.virtual.VirtualSLM`, this
+allows :class:`~slmsuite.hardware.cameraslms.FourierSLM` calibration and feedback to
+run headless.
+"""
+import time
+import numpy as np
+import scipy.fft as spfft
+from scipy.ndimage import affine_transform
+
+from slmsuite.hardware.cameras.camera import Camera
+from slmsuite.holography import toolbox
+
+class SimulatedCamera(Camera):
+    r"""
+    Camera which renders the farfield of an SLM via FFT.
+
+    The nearfield is the :attr:`source_amplitude` modulated by the phase delay currently
+    applied by the SLM (:meth:`~slmsuite.hardware.slms.virtual.VirtualSLM.get_phase()`,
+    including the emulated liquid crystal response) and the :attr:`aberration`.
+    The farfield intensity is computed on a grid padded by :attr:`pad`, and is
+    sampled at each camera pixel :math:`\vec{y}` according to the affine transform
+
+    .. math:: \vec{y} = M \cdot \vec{x} + \vec{b}
+
+    from SLM blaze vectors :math:`\vec{x}` (in ``"kxy"`` units). This is the transform
+    which :meth:`~slmsuite.hardware.cameraslms.FourierSLM.fourier_calibrate()` should
+    recover. Finally, the intensity is scaled by the exposure, noise is added, and the
+    result is saturated at the :attr:`bitdepth` of the camera.
+
+    Attributes
+    ----------
+    slm : :class:`~slmsuite.hardware.slms.slm.SLM`
+        The SLM to image. If it has no ``get_phase()`` method (i.e. it is not a
+        :class:`~slmsuite.hardware.slms.virtual.VirtualSLM`), the phase is
+        inferred from its :attr:`~slmsuite.hardware.slms.slm.SLM.display`.
+    M : numpy.ndarray
+        Linear part of the affine transform, in camera pixels per ``"kxy"`` unit.
+    b : numpy.ndarray
+        Camera pixel of the zeroth order.
+    pad : int
+        Padding factor of the farfield FFT. Larger values render smaller features.
+    aberration : numpy.ndarray or None
+        Phase added to the SLM, of size of the SLM shape.
+    source_amplitude : numpy.ndarray
+        Amplitude illuminating the SLM, of size of the SLM shape, normalized
+        to unit power.
+    exposure_s : float
+        Integration time in seconds.
+    gain : float
+        Counts per second for a pixel receiving all the power.
+    read_noise : float
+        Standard deviation of Gaussian read noise in counts.
+    shot_noise : bool
+        Whether to apply Poissonian shot noise to the counts.
+    latency_s : float
+        Delay in seconds between the end of an exposure and the return of the frame.
+        If positive, :meth:`get_image()` emulates a camera in real time, rendering the
+        SLM at the start of the exposure and blocking for the exposure plus this delay.
+        Otherwise, frames are rendered instantly.
+    sensor_shape : (int, int)
+        Shape of the sensor in pixels, before the orientation transform
+        (see :attr:`~slmsuite.hardware.cameras.camera.Camera.transform`).
+    """
+
+    def __init__(
+        self,
+        slm,
+        width=None,
+        height=None,
+        M=None,
+        b=None,
+        pad=2,
+        aberration=None,
+        source_amplitude=None,
+        exposure_s=1,
+        gain=None,
+        read_noise=0,
+        shot_noise=False,
+        seed=None,
+        latency_s=0,
+        bitdepth=8,
+        name="SimulatedCamera",
+        **kwargs
+    ):
+        """
+        Initialize the simulated camera.
+
+        Parameters
+        ----------
+        slm
+            See :attr:`slm`.
+        width, height : int OR None
+            Size of the camera in pixels. Defaults to the size of the padded farfield.
+        M : array_like OR None
+            See :attr:`M`. Defaults to one camera pixel per pixel of the padded farfield.
+        b : array_like OR None
+            See :attr:`b`. Defaults to the center of the camera.
+        pad
+            See :attr:`pad`.
+        aberration
+            See :attr:`aberration`.
+        source_amplitude : array_like OR None
+            See :attr:`source_amplitude`. Defaults to uniform illumination.
+        exposure_s
+            See :attr:`exposure_s`.
+        gain : float OR None
+            See :attr:`gain`. Defaults to :attr:`bitresolution`, such that a pixel
+            receiving all the power saturates at one second of exposure.
+        read_noise
+            See :attr:`read_noise`.
+        shot_noise
+            See :attr:`shot_noise`.
+        seed : int OR None
+            Seed for the noise.
+        latency_s
+            See :attr:`latency_s`.
+        bitdepth
+            See :attr:`bitdepth`.
+        name
+            See :attr:`name`.
+        kwargs
+            See :meth:`.Camera.__init__` for permissible options.
+        """
+        self.slm = slm
+        self.pad = int(pad)
+        self.fft_shape = (self.pad * slm.shape[0], self.pad * slm.shape[1])
+
+        if width is None:
+            width = self.fft_shape[1]
+        if height is None:
+            height = self.fft_shape[0]
+
+        super().__init__(width, height, bitdepth=bitdepth, name=name, **kwargs)
+
+        # Shape of the sensor, before the orientation transform.
+        self.sensor_shape = (int(height), int(width))
+
+        # Affine transform.
+        knm_conv = np.array([slm.dx * self.fft_shape[1], slm.dy * self.fft_shape[0]])
+
+        if M is None:
+            self.M = np.diag(knm_conv)
+        else:
+            self.M = np.array(M, dtype=float)
+
+        if b is None:
+            self.b = toolbox.format_2vectors([width / 2, height / 2])
+        else:
+            self.b = toolbox.format_2vectors(b)
+
+        # Optics.
+        self.aberration = None if aberration is None else np.array(aberration, dtype=float)
+
+        if source_amplitude is None:
+            source_amplitude = np.ones(slm.shape)
+        self.source_amplitude = np.array(source_amplitude, dtype=float)
+        self.source_amplitude /= np.sqrt(np.sum(np.square(self.source_amplitude)))
+
+        # Sensor.
+        self.exposure_s = exposure_s
+        self.gain = self.bitresolution if gain is None else gain
+        self.read_noise = read_noise
+        self.shot_noise = shot_noise
+        self.rng = np.random.default_rng(seed)
+        self.latency_s = float(latency_s)
+        self._timestamp = None
+
+        self.exposure_bounds_s = (1e-9, np.inf)
+
+    def close(self):
+        """See :meth:`.Camera.close`."""
+        pass
+
+    @staticmethod
+    def info(verbose=True):
+        """
+        Simulated cameras are not discoverable.
+
+        Parameters
+        ----------
+        verbose : bool
+            Whether to print the discovered information.
+
+        Returns
+        --------
+        list of str
+            An empty list.
+        """
+        if verbose: print("SimulatedCamera: no hardware to discover.")
+        return []
+
+    def reset(self):
+        """See :meth:`.Camera.reset`."""
+        pass
+
+    def get_exposure(self):
+        """See :meth:`.Camera.get_exposure`."""
+        return self.exposure_s
+
+    def set_exposure(self, exposure_s):
+        """See :meth:`.Camera.set_exposure`."""
+        self.exposure_s = float(exposure_s)
+        self._update_acquisition_exposure(self.exposure_s)
+
+    def flush(self, timeout_s=1):
+        """See :meth:`.Camera.flush`. Simulated frames are always fresh."""
+        pass
+
+    def _get_image_timestamp(self):
+        """See :meth:`.Camera._get_image_timestamp`. The time the SLM was rendered."""
+        return self._timestamp
+
+    def get_farfield(self, t=None):
+        """
+        Computes the farfield intensity of the SLM on the padded grid, without camera
+        transform, exposure, or noise.
+
+        Parameters
+        ----------
+        t : float OR None
+            Time (from :meth:`time.perf_counter()`) at which to evaluate the SLM phase.
+            If ``None``, the current time.
+
+        Returns
+        -------
+        numpy.ndarray
+            Intensity of shape ``pad * slm.shape`` in the ``"knm"`` basis,
+            normalized to unit total power.
+        """
+        if hasattr(self.slm, "get_phase"):
+            phase = self.slm.get_phase(t)
+        else:
+            phase = (
+                (self.slm.bitresolution - .5 - self.slm.display)
+                * (2 * np.pi / self.slm.bitresolution / self.slm.phase_scaling)
+            )
+
+        if self.aberration is not None:
+            phase = phase + self.aberration
+
+        nearfield = toolbox.pad(self.source_amplitude * np.exp(1j * phase), self.fft_shape)
+        farfield = spfft.fftshift(spfft.fft2(nearfield, norm="ortho"))
+
+        return np.square(np.abs(farfield))
+
+    def get_image(self, timeout_s=1):
+        """
+        Renders the farfield of the SLM as seen by the camera.
+        See :meth:`.Camera.get_image`.
+
+        Parameters
+        ----------
+        timeout_s : float
+            Ignored.
+
+        Returns
+        -------
+        numpy.ndarray
+            Array of shape :attr:`shape`.
+        """
+        t = time.perf_counter()
+        self._timestamp = t
+        intensity = self.get_farfield(t)
+
+        # Camera pixels (x, y) to knm = K (x, y) + c, in numpy (row, column) order.
+        knm_conv = np.array([self.slm.dx * self.fft_shape[1], self.slm.dy * self.fft_shape[0]])
+        K = np.diag(knm_conv) @ np.linalg.inv(self.M)
+        c = np.flip(self.fft_shape)[:, np.newaxis] / 2 - K @ self.b
+
+        image = affine_transform(
+            intensity,
+            np.flip(K),
+            offset=np.flip(np.squeeze(c)),
+            output_shape=self.sensor_shape,
+            order=1,
+        )
+
+        # The affine transform interpolates, so rescale to conserve power per camera pixel.
+        image *= np.abs(np.linalg.det(K))
+
+        # Exposure, noise, and saturation.
+        counts = image * (self.gain * self.exposure_s)
+
+        if self.shot_noise:
+            counts = self.rng.poisson(np.clip(counts, 0, None)).astype(float)
+        if self.read_noise > 0:
+            counts += self.rng.normal(0, self.read_noise, counts.shape)
+
+        np.clip(counts, 0, self.bitresolution - 1, out=counts)
+        image = counts.astype(np.uint8 if self.bitdepth <= 8 else np.uint16)
+
+        if self.latency_s > 0:
+            remaining = t + self.exposure_s + self.latency_s - time.perf_counter()
+            if remaining > 0:
+                time.sleep(remaining)
+
+        return self.transform(image)
@@ -110,6 +110,7 @@ class Template(Camera):
         """See :meth:`.Camera.set_exposure`."""
         raise NotImplementedError()
         self.cam.get_exposure(1e3 * exposure_s)         # TODO: Fill in proper function.
+        self._update_acquisition_exposure(exposure_s)  # Keeps acquisition timestamps current.
 
     def set_woi(self, woi=None):
         """See :meth:`.Camera.set_woi`."""
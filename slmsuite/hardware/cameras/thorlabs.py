@@ -245,6 +245,7 @@ class ThorCam(Camera):
     def set_exposure(self, exposure_s):
         """See :meth:`.Camera.set_exposure`."""
         self.cam.exposure_time_us = int(exposure_s * 1e6)
+        self._update_acquisition_exposure(exposure_s)
 
     def set_binning(self, bx=None, by=None):
         """
@@ -410,6 +411,33 @@ class ThorCam(Camera):
 
         return ret
 
+    def get_image_after(self, t, timeout_s=1):
+        """
+        See :meth:`.Camera.get_image_after`. In the ``"single"`` :attr:`profile`,
+        a software trigger is issued at ``t``, such that the exposure is guaranteed
+        to start afterward without flushing.
+
+        Parameters
+        ----------
+        t : float
+            Time from :meth:`time.perf_counter()`.
+        timeout_s : float
+            The time in seconds to wait for the frame after ``t``.
+
+        Returns
+        -------
+        numpy.ndarray
+            Array of shape :attr:`shape`.
+        """
+        if self.profile != "single" or self.acquisition is not None:
+            return super().get_image_after(t, timeout_s=timeout_s)
+
+        remaining = t - time.perf_counter()
+        if remaining > 0:
+            time.sleep(remaining)
+
+        return self.get_image(timeout_s=timeout_s, trigger=True, grab=True)
+
     def flush(self, timeout_s=1, verbose=False):
         """
         See :meth:`.Camera.flush`.
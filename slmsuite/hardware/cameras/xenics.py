@@ -645,6 +645,7 @@ class Cheetah640(Camera):
                 "\nWarning -- error encountered! Error codes: %d, %d, %d"
                 % (err1, err2, err3)
             )
+        self._update_acquisition_exposure(exposure.value / 1e6)
 
     def set_framerate(self, framerate):
         """
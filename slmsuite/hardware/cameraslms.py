@@ -7,7 +7,6 @@ import time
 import cv2
 import matplotlib.pyplot as plt
 import numpy as np
-from scipy import optimize
 from tqdm.autonotebook import tqdm
 
 from slmsuite.holography import analysis
@@ -15,7 +14,7 @@ from slmsuite.holography import toolbox
 from slmsuite.holography.algorithms import SpotHologram
 from slmsuite.holography.toolbox import imprint, format_2vectors
 from slmsuite.holography.toolbox.phase import blaze
-from slmsuite.misc.files import read_h5, write_h5, generate_path, latest_path
+from slmsuite.misc.files import read_h5, write_h5, append_h5, generate_path, latest_path
 from slmsuite.misc.fitfunctions import cos
 from slmsuite.misc.math import REAL_TYPES
 
@@ -49,6 +48,50 @@ class CameraSLM:
         self.cam = cam
         self.slm = slm
 
+    def write_and_get_image(self, phase, phase_correct=True, settle=True, timeout_s=1):
+        """
+        Writes ``phase`` to the SLM and returns the first camera frame exposed after the
+        SLM settled. Rather than sleeping for the settle time and then flushing the
+        camera, the write is paired with the frame via
+        :meth:`~slmsuite.hardware.cameras.camera.Camera.get_image_after()`, which uses
+        software triggers or the timestamps of the acquisition engine
+        (see :meth:`~slmsuite.hardware.cameras.camera.Camera.start_acquisition()`)
+        where available.
+
+        Parameters
+        ----------
+        phase, phase_correct
+            See :meth:`~slmsuite.hardware.slms.slm.SLM.write()`.
+        settle : bool
+            Whether the frame should be exposed only after the SLM settled, as
+            :meth:`~slmsuite.hardware.slms.slm.SLM.write()` waits: for
+            :attr:`~slmsuite.hardware.slms.slm.SLM.settle_time_s`, or for the time
+            predicted by :attr:`~slmsuite.hardware.slms.slm.SLM.settle_model` for the
+            change in :attr:`~slmsuite.hardware.slms.slm.SLM.display`.
+        timeout_s : float
+            The time in seconds to wait for the frame after settling.
+
+        Returns
+        -------
+        numpy.ndarray
+            Image of shape :attr:`~slmsuite.hardware.cameras.camera.Camera.shape`.
+        """
+        # Keep a sample of the displayed pattern, once queued asynchronous writes are
+        # done, to predict the settle time of the change.
+        if settle and self.slm.settle_model is not None:
+            self.slm._wait_async()
+            previous = self.slm.display[::4, ::4].copy()
+        else:
+            previous = None
+
+        self.slm.write(phase, phase_correct=phase_correct, settle=False)
+
+        t = time.perf_counter()
+        if settle:
+            t += self.slm._get_settle_time(previous, self.slm.display)
+
+        return self.cam.get_image_after(t, timeout_s=timeout_s)
+
 
 class NearfieldSLM(CameraSLM):
     """
@@ -102,69 +145,155 @@ class FourierSLM(CameraSLM):
         basis="kxy",
         size=None,
         times=None,
+        depths=None,
         settle_time_s=1,
+        tolerance=1,
         plot=True
     ):
-        """
-        **(NotImplemented)**
-        Approximates the :math`1/e` settle time of the SLM.
-        This is done by successively removing and applying a blaze to the SLM,
-        measuring the intensity at the first order spot versus time.
+        r"""
+        Characterizes the settle time of the SLM versus the magnitude of the change in
+        :attr:`~slmsuite.hardware.slms.slm.SLM.display`, and sets
+        :attr:`~slmsuite.hardware.slms.slm.SLM.settle_model` accordingly.
+
+        A blaze of reduced depth (the wrapped blaze scaled by each of ``depths``) is
+        stepped to the full blaze, and the power in the first order spot is
+        measured a time ``t`` after the step, for each of ``times``. Shallower
+        starting blazes yield larger steps. The first order efficiency of a blaze with
+        depth :math:`1 - x` is :math:`\text{sinc}^2(x)`, so each measurement
+        is converted to the residual depth :math:`x(t)` relative to the settled signal
+        after the step, and normalized by the residual depth before the step. This
+        residual is fit to an exponential :math:`e^{-t/\tau}` to find the response
+        time :math:`\tau` for the RMS change of the step. See :meth:`~slmsuite.hardware.slms.slm.SLM.predict_settle_time()`
+        for how these are used.
 
         Parameters
         ----------
         vector : array_like
-            Point to TODO
+            Blaze vector determining the first order spot.
         basis : {"ij", "kxy"}
-            Basis of vector. This is the vector TODO
+            Basis of ``vector``. If ``"ij"``, the vector is the camera pixel of the
+            spot, and is converted using the Fourier calibration.
         size : int
             Size in pixels of the integration region. If ``None``, sets to sixteen
             times the approximate size of a diffraction limited spot.
-        times : array_like
-            List of times to sweep over in search of the :math:`1/e` settle time.
+        times : array_like OR None
+            Delays in seconds after the step at which to measure.
+            If ``None``, defaults to logarithmically spaced delays between
+            ``settle_time_s / 200`` and ``settle_time_s / 2``.
+        depths : array_like OR None
+            Fractional depths of the starting blazes, in ``[0, 1)``.
+            If ``None``, defaults to ``[0, .25, .5, .75]``.
         settle_time_s : float
-            Time inbetween measurements to allow the SLM to re-settle without
+            Conservative time in seconds to allow the SLM to re-settle between steps.
+        tolerance : float
+            RMS deviation of :attr:`~slmsuite.hardware.slms.slm.SLM.display`
+            (in integer levels) below which the SLM is considered settled.
         plot : bool
-            Whether to print debug plots.
+            Whether to plot the step responses and fits.
+
+        Returns
+        -------
+        dict
+            The fit :attr:`~slmsuite.hardware.slms.slm.SLM.settle_model`, which also
+            contains the raw ``"times"``, ``"depths"``, and normalized residual depth
+            ``"signal"`` of shape ``(len(depths), len(times))``.
         """
         if basis == "ij":
             vector = self.ijcam_to_kxyslm(vector)
+        elif basis != "kxy":
+            raise ValueError("Unrecognized basis \"{}\".".format(basis))
 
         point = self.kxyslm_to_ijcam(vector)
 
-        blaze = toolbox.blaze(grid=self.slm, vector=vector)
-
-        results = []
-
-        for t in times:
-            self.slm.write(None, settle=False)
-            time.sleep(settle_time_s)
-
-            self.slm.write(blaze, settle=False)
-            time.sleep(t)
-
-            image = self.cam.get_image()
-
-            print(np.sum(image))
-            print(np.max(image))
-            # nonzero = image.ravel()
-            # nonzero = nonzero[nonzero != 0]
-            # print(nonzero)
-
-            _, axs = plt.subplots(1, 2, figsize=(10,4))
-            axs[0].imshow(image)
-            axs[1].imshow(np.squeeze(analysis.take(image, point, size, centered=True, integrate=False)))
-            plt.show()
-
-            results.append(analysis.take(image, point, size, centered=True, integrate=True))
+        if size is None:
+            size = int(16 * np.max(self.get_farfield_spot_size(basis="ij")))
+
+        if times is None:
+            times = np.geomspace(settle_time_s / 200, settle_time_s / 2, 16)
+        times = np.sort(np.ravel(times))
+
+        if depths is None:
+            depths = [0, .25, .5, .75]
+        depths = np.ravel(depths)
+
+        full = np.mod(blaze(grid=self.slm, vector=vector), 2 * np.pi)
+
+        # Inverse of the efficiency sinc^2(x) of a blaze with residual depth x.
+        x = np.linspace(0, 1, 1001)
+        def residual(efficiency):
+            return np.interp(np.sqrt(np.clip(efficiency, 0, 1)), np.sinc(x)[::-1], x[::-1])
+
+        def measure(phase, t=None):
+            # Write phase and integrate the spot t after (or once settled if None).
+            self.slm.write(phase, settle=False)
+            if t is None:
+                t = settle_time_s
+            image = self.cam.get_image_after(time.perf_counter() + t)
+            return float(np.squeeze(
+                analysis.take(image, point, size, centered=True, integrate=True)
+            ))
+
+        rms = np.zeros(len(depths))
+        tau_s = np.zeros(len(depths))
+        signal = np.zeros((len(depths), len(times)))
+
+        for (i, depth) in enumerate(depths):
+            start = depth * full
+
+            # Settled signals before and after the step, and the magnitude of the step.
+            signal_start = measure(start)
+            display_start = self.slm.display.copy()
+            signal_end = measure(full)
+            rms[i] = np.sqrt(np.mean(np.square(
+                np.subtract(self.slm.display, display_start, dtype=np.float64)
+            )))
+
+            for (j, t) in enumerate(times):
+                measure(start)
+                signal[i, j] = measure(full, t)
+
+            # Normalized residual depth of the step, which decays from one to zero.
+            signal[i] = residual(signal[i] / signal_end) / residual(signal_start / signal_end)
+
+            # Fit log(residual) = -(t - delay) / tau over the informative points.
+            valid = (signal[i] > .02) & (signal[i] < .98)
+            if np.sum(valid) >= 2:
+                slope = np.polyfit(times[valid], np.log(signal[i, valid]), 1)[0]
+                tau_s[i] = -1 / slope if slope < 0 else settle_time_s
+            elif np.any(signal[i] <= .02):
+                # Settled faster than the first informative delay; bound tau.
+                tau_s[i] = times[np.argmax(signal[i] <= .02)] / np.log(1 / .02)
+            else:
+                tau_s[i] = settle_time_s
+
+        order = np.argsort(rms)
+        model = {
+            "rms": rms[order],
+            "tau_s": tau_s[order],
+            "tolerance": float(tolerance),
+            "times": times,
+            "depths": depths[order],
+            "signal": signal[order],
+        }
+        self.slm.settle_model = model
 
         if plot:
-            plt.plot(times, np.squeeze(results), 'k*')
-            plt.ylabel("Signal [a.u.]")
+            for (i, depth) in enumerate(model["depths"]):
+                label = r"RMS step = {:.1f}, $\tau$ = {:.3f} s".format(
+                    model["rms"][i], model["tau_s"][i]
+                )
+                line = plt.semilogy(times, model["signal"][i], "*", label=label)
+                plt.semilogy(
+                    times, np.exp(-times / model["tau_s"][i]), color=line[0].get_color()
+                )
+            plt.ylim(1e-3, 2)
+            plt.ylabel("Normalized Residual Depth")
             plt.xlabel("Time [sec]")
+            plt.title("SLM Settle Characterization")
+            plt.legend()
             plt.show()
 
-        return results
+        return model
 
     ### Fourier Calibration ###
 
@@ -550,6 +679,13 @@ class FourierSLM(CameraSLM):
         test_superpixel=None,
         reference_superpixel=None,
         fresh_calibration=True,
+        checkpoint=None,
+        resume=None,
+        include_superpixels=None,
+        refine=0,
+        refine_tolerance=np.pi / 4,
+        refine_exposure_exponent=2,
+        r2_threshold=0.9,
         plot=0,
     ):
         """
@@ -569,10 +705,62 @@ class FourierSLM(CameraSLM):
         If only amplitude calibration is desired,
         set ``phase_steps=0`` to omit the more time consuming phase calibration.
 
+        Tip
+        ~~~
+        If several interference points are given, the calibration is multiplexed:
+        as many target superpixels are probed simultaneously, each blazed to a different
+        interference point, and all points are extracted from the same frame with
+        :meth:`~slmsuite.holography.analysis.take()`. This divides the number of SLM
+        writes by the number of points. The reference superpixel is split between the
+        points. The phase offset this split imparts on each point is computed and
+        removed, and the power of the split reference is measured to rescale the
+        ``"normalization"`` of each point to that of the full reference.
+        Superpixels probed together are strided across the SLM rather than adjacent,
+        limiting crosstalk between their diffracted beams.
+        Points must be separated by at least four times the size of the
+        diffraction-limited spot of a superpixel, and must avoid other diffraction
+        orders.
+
+        Note
+        ~~~~
+        The interference traces of every superpixel are fit at once in closed form
+        (see :meth:`~slmsuite.holography.analysis.fit_phase_steps()`). The raw traces are
+        stored under ``"interference"`` in
+        :attr:`~slmsuite.hardware.cameraslms.FourierSLM.wavefront_calibration_raw`,
+        along with the ``"phase_offset"`` subtracted from each fit phase,
+        such that the fit can be redone over the whole array in post-processing.
+
+        Tip
+        ~~~
+        Aberrations are typically smooth over most of the SLM, such that a uniform grid
+        of fine superpixels spends most of its time on flat regions. If ``refine`` is
+        positive, the calibration proceeds coarse-to-fine: the SLM is first calibrated
+        with superpixels ``2 ** refine`` times larger than ``superpixel_size``, then
+        only the superpixels which fail the fit (see ``r2_threshold``) or whose
+        correction disagrees with that of a neighbor (see ``refine_tolerance``) are
+        split into four and remeasured, down to ``superpixel_size``. Neighbors disagree
+        if their corrections mismatch where they meet, or if their blazes differ such
+        that the wavefront curves across a superpixel (as for defocus, where the
+        mismatch at the edge cancels).
+        Each level is referenced to the larger superpixel containing the reference
+        superpixel, and its phase is aligned to the level above.
+        The result is returned on the grid of ``superpixel_size``, with each superpixel
+        taking the values of the measured superpixel (the quadtree leaf) which contains it,
+        and with the size of that leaf stored under ``"level"``, as the exponent of two
+        in units of ``superpixel_size``.
+        As larger superpixels diffract brighter spots, the exposure is divided by the
+        ratio of superpixel areas to the power ``refine_exposure_exponent`` at each level
+        if ``autoexposure`` is ``False``, and restored afterward. The default of two
+        assumes uniform illumination and resolved spots: the diffracted field scales with
+        the area of a superpixel while its spot shrinks inversely, such that the peak
+        intensity scales with the square of the area (:math:`16` per level).
+
         Parameters
         ----------
-        interference_point : (float, float)
+        interference_point : (float, float) OR array_like of shape ``(2, K)``
             Position in the camera domain where interference occurs.
+            If ``K`` points are given, ``K`` superpixels are measured simultaneously.
+            The first point is used for ``test_superpixel`` and ``autoexposure``.
         field_point : (float, float)
             Position in the camera domain where pixels not included in superpixels are
             blazed toward in order to reduce light in the camera's field. Suggested
@@ -590,9 +778,10 @@ class FourierSLM(CameraSLM):
             The width and height in pixels of each SLM superpixel.
             If this is not a devisor of both dimensions of the SLM's :attr:`shape`,
             then superpixels at the edge of the SLM may be cropped and give undefined results.
-        phase_steps : int
+        phase_steps : int OR None
             The number of phases measured for the interference pattern.
-            If phase_steps is not strictly positive, phase is not measured:
+            At least three are required to fit the phase.
+            If phase_steps is ``None`` or not strictly positive, phase is not measured:
             only amplitude is measured.
         exclude_superpixels : (int, int)
             Optionally exclude superpixels from the margin, in ``(nx, ny)`` form.
@@ -616,6 +805,39 @@ class FourierSLM(CameraSLM):
             calibration. This is useful to determine the quality of a previous
             calibration, as a new calibration should yield zero phase correction needed
             if the previous was perfect.
+        checkpoint : str OR None
+            Path to an h5 file to which each superpixel's measurement is appended
+            (see :meth:`~slmsuite.misc.files.append_h5()`) as soon as it completes,
+            such that an interrupted calibration can be resumed with ``resume``.
+            The file must not already exist. If ``None``, no checkpoint is kept.
+        resume : str OR None
+            Path to the ``checkpoint`` file of an interrupted calibration with the same
+            settings (superpixel grid, reference, interference and field points, spot size,
+            phase steps, and camera exposure). Superpixels already measured are loaded
+            rather than remeasured, and new measurements are appended to the same file.
+            With ``autoexposure``, the exposure of the checkpoint is restored rather than
+            found anew.
+            If ``refine`` is positive, each level is kept in a separate file, with
+            ``"-level<n>"`` appended to the name.
+        include_superpixels : list of (int, int) OR None
+            Superpixels to measure, in ``(nx, ny)`` form, for instance to remeasure
+            superpixels which failed. If given, ``exclude_superpixels`` is ignored and
+            the other superpixels are left zero. If ``None``, all superpixels are measured.
+        refine : int
+            Number of coarse-to-fine levels of adaptive refinement. See the Tip above.
+            If zero, the SLM is uniformly sampled with ``superpixel_size``.
+        refine_tolerance : float
+            Mismatch in radians between the corrections (phase and blaze) of neighboring
+            superpixels, evaluated where they meet, above which both are refined.
+            Also bounds the difference of their blazes, as the phase this difference
+            accumulates across a superpixel.
+        refine_exposure_exponent : float
+            Power of the ratio of superpixel areas by which the exposure is divided at
+            each level, if ``autoexposure`` is ``False``. See the Tip above. For instance,
+            one keeps the integrated power of each spot constant instead of its peak.
+        r2_threshold : float
+            :math:`R^2` of the phase fit below which a superpixel is refined.
+            See :meth:`process_wavefront_calibration()`.
         plot : int or bool
             Whether to provide visual feedback, options are:
 
@@ -635,7 +857,42 @@ class FourierSLM(CameraSLM):
         ------
         AssertionError
             If the fourier plane calibration does not exist.
+        FileExistsError
+            If the ``checkpoint`` file already exists.
+        ValueError
+            If ``phase_steps`` is one or two,
+            if the ``resume`` file was measured with different settings,
+            or if ``refine`` is positive without measuring phase.
         """
+        # Fail before measuring anything if the phase cannot be fit.
+        if phase_steps is None:
+            phase_steps = 0
+        if 0 < phase_steps < 3:
+            raise ValueError(
+                "cameraslms.py: phase_steps must be at least 3 to fit the phase, "
+                "or 0 to measure amplitude only."
+            )
+
+        if refine > 0 and test_superpixel is None:
+            return self._wavefront_calibrate_refined(
+                superpixel_size=superpixel_size,
+                exclude_superpixels=exclude_superpixels,
+                reference_superpixel=reference_superpixel,
+                autoexposure=autoexposure,
+                checkpoint=checkpoint,
+                resume=resume,
+                refine=refine,
+                refine_tolerance=refine_tolerance,
+                refine_exposure_exponent=refine_exposure_exponent,
+                r2_threshold=r2_threshold,
+                interference_point=interference_point,
+                field_point=field_point,
+                field_point_units=field_point_units,
+                phase_steps=phase_steps,
+                fresh_calibration=fresh_calibration,
+                plot=plot,
+            )
+
         # Interpret the plot command.
         return_movie = plot == 3 and test_superpixel is not None
         if return_movie:
@@ -650,13 +907,16 @@ class FourierSLM(CameraSLM):
 
         # Clean the points
         base_point = np.around(self.kxyslm_to_ijcam([0, 0])).astype(int)
-        interference_point = np.around(format_2vectors(interference_point)).astype(int)
+        interference_points = np.around(format_2vectors(interference_point)).astype(int)
+        interference_point = interference_points[:, [0]]
+        multiplex = interference_points.shape[1]
         field_point = format_2vectors(field_point)
 
         # Use the Fourier calibration to help find points/sizes in the imaging plane.
         assert self.fourier_calibration is not None, \
             "Fourier calibration must be done before wavefront calibration."
         interference_blaze = self.ijcam_to_kxyslm(interference_point)
+        interference_blazes = self.ijcam_to_kxyslm(interference_points)
         if field_point_units == "ij":
             field_blaze = self.ijcam_to_kxyslm(field_point)
         else:
@@ -690,6 +950,15 @@ class FourierSLM(CameraSLM):
             )
         )).astype(int)
 
+        for k1 in range(multiplex):
+            for k2 in range(k1):
+                separation = np.abs(interference_points[:, k1] - interference_points[:, k2])
+                if np.all(separation < 4 * np.ravel(interference_size)):
+                    raise ValueError(
+                        "cameraslms.py: Interference points must be separated by at least "
+                        "four times the superpixel spot size {}.".format(np.ravel(interference_size))
+                    )
+
         correction_dict = {
             "NX": NX,
             "NY": NY,
@@ -697,6 +966,7 @@ class FourierSLM(CameraSLM):
             "nyref": nyref,
             "superpixel_size": superpixel_size,
             "interference_point": interference_point,
+            "interference_points": interference_points,
             "interference_size": interference_size,
         }
 
@@ -716,6 +986,11 @@ class FourierSLM(CameraSLM):
             if key not in correction_dict.keys():
                 correction_dict.update({key: np.zeros((NY, NX), dtype=np.float32)})
 
+        # Raw interference traces, such that the fit can be redone in post-processing.
+        if phase_steps > 0:
+            correction_dict["interference"] = np.zeros((NY, NX, phase_steps), dtype=np.float32)
+            correction_dict["phase_offset"] = np.zeros((NY, NX), dtype=np.float32)
+
         # Save the current calibration in case we are just testing (test_superpixel != None)
         measured_amplitude = self.slm.measured_amplitude
         phase_correction = self.slm.phase_correction
@@ -797,7 +1072,8 @@ class FourierSLM(CameraSLM):
             """
             Fits a sine function to the Intensity Vs. phase, and extracts best phase and amplitude
             that give the constructive interference.
-            If fit fails return 0 on all values.
+            The fit is computed in closed form for the equally spaced ``phases``,
+            see :meth:`~slmsuite.holography.analysis.fit_phase_steps()`.
 
             Parameters
             ----------
@@ -817,35 +1093,21 @@ class FourierSLM(CameraSLM):
             contrast :
                 a / (a + c)
             """
-            guess = [
-                phases[np.argmax(intensities)],
-                np.max(intensities) - np.min(intensities),
-                np.min(intensities),
-            ]
-
-            try:
-                popt, _ = optimize.curve_fit(cos, phases, intensities, p0=guess)
-            except BaseException:
-                return 0, 0, 0, 0
+            fit = analysis.fit_phase_steps(intensities)
 
-            # extract phase and amplitude from fit
-            best_phase = popt[0]
-            amp = popt[1]
-            contrast = popt[1] / (popt[1] + popt[2])
-
-            # residual and total sum of squares, producing the R^2 metric.
-            ss_res = np.sum((intensities - cos(phases, *popt)) ** 2)
-            ss_tot = np.sum((intensities - np.mean(intensities)) ** 2)
-            r2 = 1 - (ss_res / ss_tot)
+            best_phase = fit["phase"]
+            amp = fit["amp"]
+            r2 = fit["r2"]
+            contrast = fit["contrast"]
 
             if plot_fits:
+                popt = (best_phase, amp, fit["offset"])
+
                 plt.scatter(phases / np.pi, intensities, color="k", label="Data")
 
                 phases_fine = np.linspace(0, 2 * np.pi, 100)
 
                 plt.plot(phases_fine / np.pi, cos(phases_fine, *popt), "k-", label="Fit")
-                plt.plot(phases_fine / np.pi, cos(phases_fine, *guess), "k--",
-                    label="Guess")
                 plt.plot(best_phase / np.pi, popt[1] + popt[2], "xr", label="Phase")
 
                 plt.legend(loc="best")
@@ -953,8 +1215,8 @@ class FourierSLM(CameraSLM):
                 else:
                     plt.show()
 
-        def find_center(img, plot=False):
-            masked_pic_mode = mask(img, interference_point, 4 * interference_size)
+        def find_center(img, plot=False, point=interference_point):
+            masked_pic_mode = mask(img, point, 4 * interference_size)
 
             if plot_everything or plot:
                 plt.imshow(masked_pic_mode)
@@ -970,34 +1232,32 @@ class FourierSLM(CameraSLM):
             _, _, _, max_loc = cv2.minMaxLoc(masked_pic_mode)
             found_center = (format_2vectors(max_loc)
                             - format_2vectors(np.flip(masked_pic_mode.shape)) / 2
-                            + interference_point)
+                            + point)
 
             return found_center
 
         def measure(index, plot=False):
-            self.cam.flush()
-
             # Step 0: Measure the background.
-            self.slm.write( superpixels(index, reference=None, target=None),
-                            settle=True    )
-            background_image = self.cam.get_image()
+            background_image = self.write_and_get_image(
+                superpixels(index, reference=None, target=None)
+            )
             plot_labeled(background_image, plot=plot, title="Background")
             back = mask(background_image, interference_point,
                         2 * interference_size).sum()
 
             # Step 0.5: Measure the power in the reference mode.
-            self.slm.write( superpixels(index, reference=0, target=None),
-                            settle=True    )
-            normalization_image = self.cam.get_image()
+            normalization_image = self.write_and_get_image(
+                superpixels(index, reference=0, target=None)
+            )
             plot_labeled(normalization_image, plot=plot, title="Reference Diffraction")
             norm = mask(normalization_image, interference_point,
                         2 * interference_size).sum()
 
             # Step 1: Add a blaze to the target mode so that it overlaps with
             # reference mode.
-            self.slm.write( superpixels(index, reference=None, target=0),
-                            settle=True    )
-            position_image = self.cam.get_image()
+            position_image = self.write_and_get_image(
+                superpixels(index, reference=None, target=0)
+            )
             plot_labeled(position_image, plot=plot, title="Base Target Diffraction")
             found_center = find_center(position_image)
 
@@ -1020,10 +1280,10 @@ class FourierSLM(CameraSLM):
                 }
 
             # Step 1.5: Measure the power in the corrected target mode.
-            self.slm.write( superpixels(index, reference=None, target=0,
-                                        target_blaze=target_blaze_fixed),
-                            settle=True)
-            fixed_image = self.cam.get_image()
+            fixed_image = self.write_and_get_image(
+                superpixels(index, reference=None, target=0,
+                            target_blaze=target_blaze_fixed)
+            )
             plot_labeled(fixed_image, plot=plot, title="Corrected Target Diffraction")
             pwr = mask(fixed_image, interference_point, 2 * interference_size).sum()
 
@@ -1042,10 +1302,10 @@ class FourierSLM(CameraSLM):
 
             # Step 3: Measure phase
             for phase in prange:
-                self.slm.write( superpixels(index, reference=0,target=phase,
-                                            target_blaze=target_blaze_fixed),
-                                settle=True)
-                interference_image = self.cam.get_image()
+                interference_image = self.write_and_get_image(
+                    superpixels(index, reference=0, target=phase,
+                                target_blaze=target_blaze_fixed)
+                )
                 results.append(
                     interference_image[
                         int(interference_point[1]), int(interference_point[0])
@@ -1066,10 +1326,10 @@ class FourierSLM(CameraSLM):
             phase_fit, amp_fit, r2_fit, contrast_fit = fit_phase(phases, results)
 
 
-            self.slm.write( superpixels(index, reference=0, target=phase_fit,
-                                        target_blaze=target_blaze_fixed),
-                            settle=True)
-            interference_image = self.cam.get_image()
+            interference_image = self.write_and_get_image(
+                superpixels(index, reference=0, target=phase_fit,
+                            target_blaze=target_blaze_fixed)
+            )
             if plot:
                 plot_labeled(interference_image, plot=plot, title="Best Interference")
 
@@ -1085,19 +1345,153 @@ class FourierSLM(CameraSLM):
                 "amp_fit": amp_fit,
                 "contrast_fit": contrast_fit,
                 "r2_fit": r2_fit,
+                "interference": results,
+                "phase_offset": 0,
+            }
+
+        def reference_split(grid, vectors):
+            """
+            Phase which splits the reference superpixel between the blaze ``vectors``.
+            """
+            field = 0
+            for k in range(vectors.shape[1]):
+                field = field + np.exp(1j * blaze(grid, vector=vectors[:, k]))
+            return np.angle(field)
+
+        def superpixels_multiplexed(indices, reference=False, target=None, target_blazes=None):
+            """
+            Multiplexed version of :meth:`superpixels()`. The reference superpixel
+            is split between all the interference points, and each target superpixel
+            in ``indices`` is blazed toward the corresponding interference point.
+            """
+            matrix = blaze(self.slm, field_blaze)
+
+            if target_blazes is None:
+                target_blazes = interference_blazes
+
+            if reference:
+                imprint(
+                    matrix,
+                    np.array([nxref, 1, nyref, 1]) * superpixel_size,
+                    reference_split,
+                    self.slm,
+                    vectors=interference_blazes,
+                )
+
+            if target is not None:
+                for (k, index) in enumerate(indices):
+                    imprint(
+                        matrix,
+                        np.array([index[0], 1, index[1], 1]) * superpixel_size,
+                        blaze,
+                        self.slm,
+                        vector=target_blazes[:, k],
+                        offset=target
+                    )
+
+            return matrix
+
+        def integrate(img, count, size=2 * interference_size):
+            """Integrates the regions around the first ``count`` interference points."""
+            return np.ravel(analysis.take(
+                img, interference_points[:, :count], size, centered=True, integrate=True
+            )).astype(float)
+
+        def measure_multiplexed(indices):
+            count = len(indices)
+            points = interference_points[:, :count]
+
+            # Step 0: Measure the background and the power in the split reference.
+            back = integrate(self.write_and_get_image(superpixels_multiplexed(indices)), count)
+            norm = integrate(
+                self.write_and_get_image(superpixels_multiplexed(indices, reference=True)),
+                count
+            )
+
+            # Rescale to the power of the full reference at each point.
+            norm = back + (norm - back) / reference_share[:count]
+
+            # Step 1: Find the positions of the target modes.
+            position_image = self.write_and_get_image(
+                superpixels_multiplexed(indices, target=0)
+            )
+            found_center = np.hstack([
+                find_center(position_image, point=points[:, [k]]) for k in range(count)
+            ])
+
+            blaze_difference = self.ijcam_to_kxyslm(found_center) - interference_blazes[:, :count]
+            target_blazes_fixed = interference_blazes[:, :count] - blaze_difference
+
+            # Step 1.25: Stop here if we don't need to measure the phase.
+            if phase_steps <= 0:
+                nan = np.full(count, np.nan)
+                return {
+                    "power": integrate(position_image, count),
+                    "normalization": norm,
+                    "background": back,
+                    "phase": nan,
+                    "kx": nan,
+                    "ky": nan,
+                    "amp_fit": nan,
+                    "contrast_fit": nan,
+                    "r2_fit": nan,
+                }
+
+            # Step 1.5: Measure the power in the corrected target modes.
+            fixed_image = self.write_and_get_image(
+                superpixels_multiplexed(indices, target=0, target_blazes=target_blazes_fixed)
+            )
+            pwr = integrate(fixed_image, count)
+
+            # Step 2: Measure interference at all points in each frame.
+            phases = np.linspace(0, 2 * np.pi, phase_steps, endpoint=False)
+            results = np.zeros((count, phase_steps))
+
+            for (i, phase) in enumerate(phases):
+                interference_image = self.write_and_get_image(
+                    superpixels_multiplexed(
+                        indices, reference=True, target=phase, target_blazes=target_blazes_fixed
+                    )
+                )
+                results[:, i] = integrate(interference_image, count, size=1)
+
+            # Step 3: Fit all points at once, removing the phase offset of the split reference.
+            if plot_fits:
+                fits = np.array([fit_phase(phases, results[k]) for k in range(count)]).T
+            else:
+                fit = analysis.fit_phase_steps(results)
+                fits = (fit["phase"], fit["amp"], fit["r2"], fit["contrast"])
+
+            return {
+                "power": pwr,
+                "normalization": norm,
+                "background": back,
+                "phase": np.mod(fits[0] - reference_offset[:count], 2 * np.pi),
+                "kx": -blaze_difference[0],
+                "ky": -blaze_difference[1],
+                "amp_fit": fits[1],
+                "contrast_fit": fits[3],
+                "r2_fit": fits[2],
+                "interference": results,
+                "phase_offset": reference_offset[:count],
             }
 
         # Correct exposure and position of the reference mode.
-        self.slm.write( superpixels((0, 0), reference=0, target=None),
-                        settle=True)
-        self.cam.flush()
+        base_image = self.write_and_get_image(
+            superpixels((0, 0), reference=0, target=None)
+        )
 
-        if autoexposure:
-            window = [  interference_point[0], 2 * interference_size[0],
-                        interference_point[1], 2 * interference_size[1] ]
-            self.cam.autoexposure(set_fraction=0.1, window=window)
+        resumed = None if resume is None else read_h5(resume)
 
-        base_image = self.cam.get_image()
+        if autoexposure:
+            if resumed is not None and "exposure_s" in resumed["settings"]:
+                # Measure at the exposure of the checkpoint, such that data are consistent.
+                self.cam.set_exposure(resumed["settings"]["exposure_s"])
+            else:
+                window = [  interference_point[0], 2 * interference_size[0],
+                            interference_point[1], 2 * interference_size[1] ]
+                self.cam.autoexposure(set_fraction=0.1, window=window)
+            base_image = self.cam.get_image_after(time.perf_counter())
         plot_labeled(base_image, plot=plot_everything, title="Base Reference Diffraction")
         found_center = find_center(base_image)
 
@@ -1106,10 +1500,10 @@ class FourierSLM(CameraSLM):
         reference_blaze_fixed = interference_blaze - blaze_difference
 
         if plot_fits:
-            self.slm.write( superpixels((0, 0), reference=0, target=None,
-                                        reference_blaze=reference_blaze_fixed),
-                            settle=True)
-            fixed_image = self.cam.get_image()
+            fixed_image = self.write_and_get_image(
+                superpixels((0, 0), reference=0, target=None,
+                            reference_blaze=reference_blaze_fixed)
+            )
             plot_labeled(fixed_image, plot=plot_everything, title="Corrected Reference Diffraction")
             found_center = find_center(fixed_image)
 
@@ -1124,30 +1518,361 @@ class FourierSLM(CameraSLM):
             return result
 
         # Otherwise, proceed with all of the superpixels.
-        for n in tqdm(range(NX * NY), position=1, leave=True, desc="calibration"):
-            nx = int(n % NX)
-            ny = int(n / NX)
-
-            # Exclude the reference mode.
-            if nx == nxref and ny == nyref:
-                continue
-
-            # Exclude margin superpixels, if desired.
-            if nx < exclude_superpixels[0]:
-                continue
-            if nx > NX - exclude_superpixels[0]:
-                continue
-            if ny < exclude_superpixels[1]:
-                continue
-            if ny > NY - exclude_superpixels[1]:
-                continue
-
-            # Measure!
-            measurement = measure((nx, ny))
-
-            # Update dictionary.
-            for key in measurement:
-                correction_dict[key][ny, nx] = measurement[key]
+        if include_superpixels is not None:
+            indices = [
+                (int(nx), int(ny)) for (nx, ny) in include_superpixels
+                if not (nx == nxref and ny == nyref)
+            ]
+        else:
+            indices = []
+            for n in range(NX * NY):
+                nx = int(n % NX)
+                ny = int(n / NX)
+
+                # Exclude the reference mode.
+                if nx == nxref and ny == nyref:
+                    continue
+
+                # Exclude margin superpixels, if desired.
+                if nx < exclude_superpixels[0]:
+                    continue
+                if nx > NX - exclude_superpixels[0]:
+                    continue
+                if ny < exclude_superpixels[1]:
+                    continue
+                if ny > NY - exclude_superpixels[1]:
+                    continue
+
+                indices.append((nx, ny))
+
+        if multiplex > 1:
+            # Phase offset imparted by the split reference on each point.
+            window = (
+                slice(nyref * superpixel_size, (nyref + 1) * superpixel_size),
+                slice(nxref * superpixel_size, (nxref + 1) * superpixel_size)
+            )
+            grid = (self.slm.x_grid[window], self.slm.y_grid[window])
+            split = reference_split(grid, interference_blazes)
+            reference_offset = np.array([
+                np.angle(np.sum(np.exp(1j * (split - blaze(grid, vector=interference_blazes[:, k])))))
+                for k in range(multiplex)
+            ])
+
+            # Fraction of the power of the full reference reaching each point when split.
+            back = integrate(self.write_and_get_image(superpixels_multiplexed([])), multiplex)
+            split = integrate(
+                self.write_and_get_image(superpixels_multiplexed([], reference=True)),
+                multiplex
+            )
+            full = np.array([
+                integrate(self.write_and_get_image(
+                    superpixels((0, 0), reference=0, target=None,
+                                reference_blaze=interference_blazes[:, [k]])
+                ), multiplex)[k]
+                for k in range(multiplex)
+            ])
+            reference_share = (split - back) / (full - back)
+
+            # Stride the groups such that superpixels probed together are far apart.
+            n_groups = int(np.ceil(len(indices) / multiplex))
+            groups = [indices[k::n_groups] for k in range(n_groups)]
+        else:
+            groups = [[index] for index in indices]
+
+        # Keep every measurement on disk as it completes, and skip those already there.
+        settings = {
+            key: correction_dict[key]
+            for key in [
+                "NX", "NY", "nxref", "nyref", "superpixel_size",
+                "interference_points", "interference_size",
+            ]
+        }
+        settings["field_point"] = field_point
+        settings["phase_steps"] = phase_steps
+        try:
+            settings["exposure_s"] = float(self.cam.get_exposure())
+        except NotImplementedError:
+            settings["exposure_s"] = np.nan
+
+        if resume is not None:
+            data = resumed
+
+            for key in settings:
+                previous = data["settings"].get(key, None)
+                if previous is None or not np.array_equal(previous, settings[key], equal_nan=True):
+                    raise ValueError(
+                        "cameraslms.py: Cannot resume from '{}', which was measured with "
+                        "{} = {} rather than {}.".format(resume, key, previous, settings[key])
+                    )
+
+            records = data.get("records", {})
+            for (i, (nx, ny)) in enumerate(records.get("index", [])):
+                for key in records:
+                    if key != "index":
+                        correction_dict[key][ny, nx] = records[key][i]
+
+            measured = set((int(nx), int(ny)) for (nx, ny) in records.get("index", []))
+            groups = [
+                [index for index in group if index not in measured] for group in groups
+            ]
+            groups = [group for group in groups if len(group)]
+
+            checkpoint = resume
+        elif checkpoint is not None:
+            if os.path.exists(checkpoint):
+                raise FileExistsError(
+                    "cameraslms.py: Checkpoint '{}' already exists. "
+                    "Pass it as resume to continue it.".format(checkpoint)
+                )
+            write_h5(checkpoint, {"settings": settings})
+
+        try:
+            for group in tqdm(groups, position=1, leave=True, desc="calibration"):
+                # Measure!
+                if multiplex > 1:
+                    measurement = measure_multiplexed(group)
+                else:
+                    measurement = measure(group[0])
+                    measurement = {key: [measurement[key]] for key in measurement}
+
+                # Update dictionary and checkpoint.
+                for (k, (nx, ny)) in enumerate(group):
+                    for key in measurement:
+                        correction_dict[key][ny, nx] = measurement[key][k]
+
+                    if checkpoint is not None:
+                        record = {key: measurement[key][k] for key in measurement}
+                        record["index"] = (nx, ny)
+                        append_h5(checkpoint, {"records": record})
+        finally:
+            # Keep partial results if interrupted.
+            self.wavefront_calibration_raw = correction_dict
+
+        return correction_dict
+
+    def _wavefront_calibrate_refined(
+        self,
+        superpixel_size,
+        exclude_superpixels,
+        reference_superpixel,
+        autoexposure,
+        checkpoint,
+        resume,
+        refine,
+        refine_tolerance,
+        refine_exposure_exponent,
+        r2_threshold,
+        **kwargs
+    ):
+        """
+        Coarse-to-fine wavefront calibration. See the ``refine`` option of
+        :meth:`wavefront_calibrate()`, which this calls once per level with
+        ``include_superpixels`` set to the superpixels of that level to measure.
+        """
+        if kwargs.get("phase_steps", 10) <= 0:
+            raise ValueError("cameraslms.py: Refinement requires phase measurement (phase_steps > 0).")
+
+        [NY, NX] = np.ceil(np.array(self.slm.shape) / superpixel_size).astype(int)
+
+        if reference_superpixel is None:
+            [nxref, nyref] = np.floor(np.flip(self.slm.shape) / superpixel_size / 2).astype(int)
+        else:
+            (nxref, nyref) = reference_superpixel
+
+        # Superpixels to calibrate, excluding the margin as in wavefront_calibrate().
+        (ny, nx) = np.indices((NY, NX))
+        included = (
+              (nx >= exclude_superpixels[0]) & (nx <= NX - exclude_superpixels[0])
+            & (ny >= exclude_superpixels[1]) & (ny <= NY - exclude_superpixels[1])
+        )
+        included[nyref, nxref] = False
+
+        # Normalized SLM coordinates along each axis, to evaluate corrections at points.
+        def coordinates(i, j):
+            return (
+                np.interp(i, np.arange(self.slm.shape[1]), self.slm.x_grid[0, :]),
+                np.interp(j, np.arange(self.slm.shape[0]), self.slm.y_grid[:, 0]),
+            )
+
+        def correction(data, index, point):
+            """Correction (blaze and phase) of the superpixels ``index`` at ``point``."""
+            return (
+                2 * np.pi * (data["kx"][index] * point[0] + data["ky"][index] * point[1])
+                + data["phase"][index]
+            )
+
+        def blocks(array, n):
+            """Reshapes superpixel ``array`` into (NY/n, n, NX/n, n) blocks, padding with False."""
+            shape = (int(np.ceil(NY / n)), int(np.ceil(NX / n)))
+            padded = np.zeros((shape[0] * n, shape[1] * n), dtype=bool)
+            padded[:NY, :NX] = array
+            return padded.reshape(shape[0], n, shape[1], n)
+
+        if checkpoint is not None or resume is not None:
+            (root, extension) = os.path.splitext(checkpoint if resume is None else resume)
+
+        exposure_s = self.cam.get_exposure()
+        levels = []
+        candidates = None
+
+        try:
+            for level in range(refine, -1, -1):
+                n = 2 ** level
+                size = superpixel_size * n
+
+                # Measure the blocks of this level which are entirely to be calibrated.
+                measurable = blocks(included, n).all(axis=(1, 3))
+                relevant = blocks(included, n).any(axis=(1, 3))
+
+                if candidates is None:
+                    candidates = np.ones_like(measurable)
+                else:
+                    candidates = np.kron(candidates, np.ones((2, 2), dtype=bool))
+                    candidates = candidates[:measurable.shape[0], :measurable.shape[1]]
+
+                measure = candidates & measurable
+                (by, bx) = np.nonzero(measure)
+
+                if len(bx) == 0:
+                    candidates = candidates & relevant
+                    continue
+
+                level_checkpoint = None
+                level_resume = None
+                if checkpoint is not None or resume is not None:
+                    path = "{}-level{}{}".format(root, level, extension)
+                    if resume is not None and os.path.exists(path):
+                        level_resume = path
+                    else:
+                        level_checkpoint = path
+
+                if not autoexposure:
+                    # Peak intensity scales with the area ratio to refine_exposure_exponent.
+                    area_ratio = (size / superpixel_size) ** 2
+                    self.cam.set_exposure(exposure_s / area_ratio ** refine_exposure_exponent)
+
+                data = self.wavefront_calibrate(
+                    superpixel_size=size,
+                    exclude_superpixels=(0, 0),
+                    reference_superpixel=(nxref // n, nyref // n),
+                    include_superpixels=list(zip(bx, by)),
+                    autoexposure=autoexposure,
+                    checkpoint=level_checkpoint,
+                    resume=level_resume,
+                    **kwargs
+                )
+
+                # Align the phase of this level to the level above, comparing the
+                # field summed over the children of each parent to the parent.
+                if len(levels):
+                    (_, parent_measure, parent) = levels[-1]
+                    parents = (by // 2, bx // 2)
+                    valid = parent_measure[parents] & (parent["r2_fit"][parents] >= r2_threshold)
+
+                    pwr = data["power"] - data["background"]
+                    norm = data["normalization"] - data["background"]
+                    amp = np.sqrt(np.clip(pwr[by, bx] / norm[by, bx], 0, None))
+
+                    center = coordinates((bx + .5) * size - .5, (by + .5) * size - .5)
+                    parent_center = coordinates(
+                        (parents[1] + .5) * 2 * size - .5, (parents[0] + .5) * 2 * size - .5
+                    )
+                    difference = (
+                        correction(data, (by, bx), center)
+                        - correction(parent, parents, parent_center)
+                    )
+                    alignment = np.angle(np.nansum((amp * np.exp(1j * difference))[valid]))
+
+                    data["phase"][measure] = np.mod(data["phase"][measure] - alignment, 2 * np.pi)
+                    data["phase_offset"][measure] += alignment
+
+                levels.append((level, measure, data))
+
+                # Refine blocks which failed, or whose correction disagrees with a
+                # neighbor where they meet or curves away from it.
+                refined = measure & ~(data["r2_fit"] >= r2_threshold)
+
+                (j, i) = np.indices(measure.shape)
+                for axis in [0, 1]:
+                    first = tuple(slice(None, -1) if a == axis else slice(None) for a in [0, 1])
+                    second = tuple(slice(1, None) if a == axis else slice(None) for a in [0, 1])
+
+                    if axis == 0:
+                        point = coordinates((i[first] + .5) * size - .5, (j[first] + 1) * size - .5)
+                    else:
+                        point = coordinates((i[first] + 1) * size - .5, (j[first] + .5) * size - .5)
+
+                    mismatch = np.angle(np.exp(1j * (
+                        correction(data, first, point) - correction(data, second, point)
+                    )))
+
+                    # The edge mismatch cancels for curvature symmetric about the edge
+                    # (e.g. defocus), so also bound the phase which the blaze difference
+                    # accumulates across a block.
+                    curvature = 2 * np.pi * size * np.maximum(
+                        np.abs(data["kx"][first] - data["kx"][second]) * self.slm.dx,
+                        np.abs(data["ky"][first] - data["ky"][second]) * self.slm.dy,
+                    )
+
+                    mismatch = measure[first] & measure[second] & (
+                        (np.abs(mismatch) > refine_tolerance) | (curvature > refine_tolerance)
+                    )
+
+                    refined[first] |= mismatch
+                    refined[second] |= mismatch
+
+                # Blocks which were not measurable (e.g. containing the reference) are
+                # always split.
+                candidates = candidates & relevant & (refined | ~measurable)
+        finally:
+            if not autoexposure:
+                self.cam.set_exposure(exposure_s)
+
+        # Assemble the quadtree leaves onto the grid of the finest superpixels,
+        # with finer levels overwriting the coarser levels they refine.
+        data = levels[-1][2]
+        keys = [
+            "power",
+            "normalization",
+            "background",
+            "phase",
+            "kx",
+            "ky",
+            "amp_fit",
+            "contrast_fit",
+            "r2_fit",
+            "interference",
+            "phase_offset",
+        ]
+        correction_dict = {
+            "NX": NX,
+            "NY": NY,
+            "nxref": nxref,
+            "nyref": nyref,
+            "superpixel_size": superpixel_size,
+            "interference_point": data["interference_point"],
+            "interference_points": data["interference_points"],
+            "interference_size": np.around(np.array(
+                self.get_farfield_spot_size(
+                    (superpixel_size * self.slm.dx, superpixel_size * self.slm.dy),
+                    basis="ij"
+                )
+            )).astype(int),
+            "level": np.zeros((NY, NX), dtype=int),
+        }
+
+        for (level, measure, data) in levels:
+            n = 2 ** level
+            leaves = np.repeat(np.repeat(measure, n, axis=0), n, axis=1)[:NY, :NX]
+
+            for key in keys:
+                if key not in correction_dict:
+                    correction_dict[key] = np.zeros((NY, NX) + data[key].shape[2:], dtype=data[key].dtype)
+
+                values = np.repeat(np.repeat(data[key], n, axis=0), n, axis=1)[:NY, :NX]
+                correction_dict[key][leaves] = values[leaves]
+
+            correction_dict["level"][leaves] = level
 
         self.wavefront_calibration_raw = correction_dict
 
@@ -1157,6 +1882,7 @@ class FourierSLM(CameraSLM):
             self,
             smooth=True,
             r2_threshold=0.9,
+            zernike_order=None,
             apply=True,
             plot=False
         ):
@@ -1164,6 +1890,25 @@ class FourierSLM(CameraSLM):
         Processes :attr:`~slmsuite.hardware.cameraslms.FourierSLM.wavefront_calibration_raw`
         into the desired phase correction and amplitude measurement. Applies these
         parameters to the respective variables in the SLM if ``apply`` is ``True``.
+        For adaptive calibrations (see the ``refine`` option of
+        :meth:`wavefront_calibrate()`), the correction is built from the leaves of the
+        quadtree, each imprinted over its full size.
+
+        Tip
+        ~~~
+        The correction is otherwise a patchwork of per-superpixel blazes. If
+        ``zernike_order`` is given, it is instead a global least-squares fit of
+        Zernike polynomials to the blaze and phase of every superpixel, weighted by
+        :math:`R^2` (see :meth:`~slmsuite.holography.toolbox.phase.zernike_fit()`).
+        This is smoother, and is described by the handful of coefficients returned
+        under ``"zernike"``, from which the correction can be regenerated with
+        :meth:`~slmsuite.holography.toolbox.phase.zernike_sum()` and
+        ``aperture="cropped"`` for any resolution of the SLM. As the coefficients are
+        phases at the calibration wavelength, they scale inversely with wavelength
+        (neglecting dispersion). The coefficients are also kept in
+        :attr:`wavefront_calibration_raw`, such that
+        :meth:`save_wavefront_calibration()` stores them and later processing (e.g. by
+        :meth:`load_wavefront_calibration()`) regenerates the same correction.
 
         Parameters
         ----------
@@ -1173,6 +1918,12 @@ class FourierSLM(CameraSLM):
             Threshold for a "good fit". Proxy for whether a datapoint should be used or
             ignored in the final data, depending upon the rsquared value of the fit.
             Should be within [0, 1].
+        zernike_order : int OR None
+            If not ``None``, the highest degree of Zernike polynomials to fit to the
+            correction. See the Tip above. Smoothing does not apply to this fit.
+            If ``None``, the ``"zernike"`` coefficients of a previous fit are used if
+            present in :attr:`wavefront_calibration_raw`. Delete them to revert to the
+            per-superpixel correction.
         apply : bool
             Whether to apply the processed calibration to the associated SLM.
             Otherwise, this function only returns and maybe
@@ -1185,6 +1936,7 @@ class FourierSLM(CameraSLM):
         dict
             A dictionary consisting of the ``measured_amplitude`` and
             ``phase_correction``. With the same names as keys.
+            Also contains the ``"zernike"`` coefficients if ``zernike_order`` is given.
         """
         # Step 0: Initialize helper variables and functions.
         data = self.wavefront_calibration_raw
@@ -1284,72 +2036,115 @@ class FourierSLM(CameraSLM):
         kx[r2s < r2_threshold] = 0
         ky[r2s < r2_threshold] = 0
         offset[r2s < r2_threshold] = 0
-        pathing = 0 * r2s
-
-        # Step 3.5: Infer phase for superpixels which do satisfy the R^2 threshold.
-        # For each row...
-        for ny in range(NY):
-            # Go forward and then back along each row.
-            for nx in list(range(NX)) + list(range(NX-1, -1, -1)):
-                if r2s[ny, nx] >= r2_threshold:
-                    # Superpixels exceeding the threshold need no correction.
-                    pass
-                else:
-                    # Otherwise, do a majority-vote with adjacent superpixels.
-                    kx2 = []
-                    ky2 = []
-                    offset2 = []
-
-                    # Loop through the adjacent superpixels (including diagonals).
-                    for (ax, ay) in [(1,  0), (-1,  0), (0, 1), (0, -1),
-                                     (1, -1), (-1, -1), (1, 1), (-1, 1)]:
-                        (tx, ty) = (nx + ax, ny + ay)
-                        (dx, dy) = (
-                            2 * np.pi * (nx - nxref) * superpixel_size * self.slm.dx,
-                            2 * np.pi * (ny - nyref) * superpixel_size * self.slm.dy)
-
-                        # Make sure our adjacent pixel under test is within range and above threshold.
-                        if (tx >= 0 and tx < NX and ty >= 0 and ty < NY and
-                            (r2s[ty, tx] >= r2_threshold)): # or pathing[ty, tx] == ny)):
-
-                            kx3 = kx[ty, tx]
-                            ky3 = ky[ty, tx]
-
-                            kx2.append(kx3)
-                            ky2.append(ky3)
-                            offset2.append(offset[ty, tx] + dx * kx3 + dy * ky3)
-
-                    # Do a majority vote (within std) for the phase.
-                    if len(kx2) > 0:
-                        kx[ny, nx] = 0 #np.mean(kx2)
-                        ky[ny, nx] = 0 #np.mean(ky2)
-
-                        minstd = np.inf
-                        for phi in range(4):
-                            shift = phi * np.pi / 2
-                            offset3 = np.mod(np.array(offset2) + shift, 2 * np.pi)
-
-                            if minstd > np.std(offset3):
-                                minstd = np.std(offset3)
-                                offset[ny, nx] = np.mod(np.mean(offset3) - shift,
-                                                        2 * np.pi)
-
-                        pathing[ny, nx] = ny
-
-        # Step 3.75: Make the SLM-sized correction using the compressed data from each superpixel.
-        phase = np.zeros(self.slm.shape)
-        for nx in range(NX):
-            for ny in range(NY):
-                imprint(
-                    phase,
-                    np.array([nx, 1, ny, 1]) * superpixel_size,
-                    blaze,
-                    self.slm,
-                    vector=(kx[ny, nx], ky[ny, nx]),
-                    offset=offset[ny, nx],
-                )
 
-        if smooth:
+        # Step 3.5: Infer phase for superpixels which do not satisfy the R^2 threshold.
+        # Only superpixels exceeding the threshold vote, so all superpixels are
+        # processed at once. Stack the eight adjacent superpixels (including diagonals)
+        # of each superpixel along a new axis, padding the edges with non-voters.
+        def neighbors(matrix, fill):
+            padded = np.pad(matrix, 1, mode="constant", constant_values=fill)
+            return np.stack([
+                padded[1 + ay:1 + ay + NY, 1 + ax:1 + ax + NX]
+                for (ax, ay) in [(1,  0), (-1,  0), (0, 1), (0, -1),
+                                 (1, -1), (-1, -1), (1, 1), (-1, 1)]
+            ], axis=-1)
+
+        voters = neighbors(r2s >= r2_threshold, False)
+        count = np.sum(voters, axis=-1)
+        failed = ~(r2s >= r2_threshold) & (count > 0)
+
+        # Neighboring phases, propagated by their blaze across the distance from the
+        # reference superpixel to the failed superpixel.
+        (ny, nx) = np.indices((NY, NX))
+        dx = 2 * np.pi * (nx - nxref) * superpixel_size * self.slm.dx
+        dy = 2 * np.pi * (ny - nyref) * superpixel_size * self.slm.dy
+        votes = (
+            neighbors(offset, 0)
+            + dx[:, :, np.newaxis] * neighbors(kx, 0)
+            + dy[:, :, np.newaxis] * neighbors(ky, 0)
+        )
+
+        # Do a majority vote (within std) for the phase, trying four shifts to avoid
+        # the 2pi wrap.
+        count = np.maximum(count, 1)
+        means = []
+        stds = []
+        for phi in range(4):
+            shift = phi * np.pi / 2
+            votes_shifted = np.mod(votes + shift, 2 * np.pi)
+
+            mean = np.sum(np.where(voters, votes_shifted, 0), axis=-1) / count
+            deviation = np.where(voters, votes_shifted - mean[:, :, np.newaxis], 0)
+            variance = np.sum(np.square(deviation), axis=-1) / count
+
+            means.append(np.mod(mean - shift, 2 * np.pi))
+            stds.append(np.sqrt(variance))
+
+        best = np.argmin(stds, axis=0)
+        best_offset = np.take_along_axis(np.array(means), best[np.newaxis], axis=0)[0]
+
+        kx[failed] = 0
+        ky[failed] = 0
+        offset[failed] = best_offset[failed]
+
+        zernike = data.get("zernike", None) if zernike_order is None else None
+
+        if zernike is not None:
+            # Step 3.75: Regenerate the correction from the coefficients of a previous fit.
+            zernike = np.array(zernike, dtype=float)
+            phase = toolbox.phase.zernike_sum(self.slm, zernike, aperture="cropped")
+        elif zernike_order is None:
+            # Step 3.75: Make the SLM-sized correction using the compressed data from each superpixel.
+            # Upsample the blaze and offset of each superpixel to the SLM, and evaluate them all
+            # at once. For adaptive calibrations, each leaf of the quadtree takes the values of
+            # its first superpixel.
+            level = data["level"] if "level" in data else np.zeros((NY, NX), dtype=int)
+            leaf = 2 ** level.astype(int)
+            leaf = (ny - ny % leaf, nx - nx % leaf)
+
+            (iy, ix) = np.ix_(
+                np.arange(self.slm.shape[0]) // superpixel_size,
+                np.arange(self.slm.shape[1]) // superpixel_size,
+            )
+            leaf = (leaf[0][iy, ix], leaf[1][iy, ix])
+
+            phase = (
+                2 * np.pi * (kx[leaf] * self.slm.x_grid + ky[leaf] * self.slm.y_grid)
+                + offset[leaf]
+            )
+        else:
+            # Step 3.75: Fit the correction of every superpixel, evaluated at its center,
+            # with Zernike polynomials. Failed superpixels and the reference are ignored.
+            (x, y) = np.meshgrid(
+                np.interp(
+                    (np.arange(NX) + .5) * superpixel_size - .5,
+                    np.arange(self.slm.shape[1]),
+                    self.slm.x_grid[0, :]
+                ),
+                np.interp(
+                    (np.arange(NY) + .5) * superpixel_size - .5,
+                    np.arange(self.slm.shape[0]),
+                    self.slm.y_grid[:, 0]
+                ),
+            )
+
+            weights = np.where(r2s >= r2_threshold, r2s, 0)
+            weights[nyref, nxref] = 0
+
+            zernike = toolbox.phase.zernike_fit(
+                self.slm,
+                points=(x.ravel(), y.ravel()),
+                gradients=(2 * np.pi * kx.ravel(), 2 * np.pi * ky.ravel()),
+                phases=(2 * np.pi * (kx * x + ky * y) + offset).ravel(),
+                weights=weights.ravel(),
+                order=zernike_order,
+                aperture="cropped",
+            )
+
+            phase = toolbox.phase.zernike_sum(self.slm, zernike, aperture="cropped")
+            data["zernike"] = zernike
+
+        if smooth and zernike is None:
             # Iterative smoothing helps to preserve slopes while avoiding superpixel boundaries.
             # Consider, for instance, a fine blaze.
             for _ in range(16):
@@ -1397,6 +2192,9 @@ class FourierSLM(CameraSLM):
                                     "measured_amplitude":amp_large,
                                     "r2":r2}
 
+        if zernike is not None:
+            wavefront_calibration["zernike"] = zernike
+
         # Step 4: Load the correction to the SLM
         if apply:
             self.slm.phase_correction = phase_fin
@@ -1447,7 +2245,10 @@ class FourierSLM(CameraSLM):
     def save_wavefront_calibration(self, path=".", name=None):
         """
         Saves :attr:`~slmsuite.hardware.cameraslms.FourierSLM.wavefront_calibration_raw`
-        to a file like ``"path/name_id.h5"``.
+        to a file like ``"path/name_id.h5"``. The dense phase correction is never saved:
+        it is regenerated upon loading, from the ``"zernike"`` coefficients if the
+        correction was fit with ``zernike_order``
+        (see :meth:`process_wavefront_calibration()`).
 
         Parameters
         ----------
@@ -1484,6 +2285,9 @@ class FourierSLM(CameraSLM):
             Whether to immediately process the wavefront calibration.
             See
             :meth:`~slmsuite.hardware.cameraslms.FourierSLM.process_wavefront_calibration`.
+            If the file holds ``"zernike"`` coefficients, the phase correction is
+            regenerated from them with
+            :meth:`~slmsuite.holography.toolbox.phase.zernike_sum()`.
         **kwargs
             Passed to :meth:`~slmsuite.hardware.cameraslms.FourierSLM.process_wavefront_calibration`,
             if ``process`` is true.
@@ -209,6 +209,7 @@ class Meadowlark(SLM):
         """
         See :meth:`.SLM.close`.
         """
+        super().close()
         self.slm_lib.Delete_SDK()
 
     def _write_hw(self, display):
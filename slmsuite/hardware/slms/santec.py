@@ -343,6 +343,7 @@ class Santec(SLM):
 
     def close(self):
         """See :meth:`.SLM.close`."""
+        super().close()
         slm_funcs.SLM_Disp_Close(self.display_number)
         slm_funcs.SLM_Ctrl_Close(self.slm_number)
 
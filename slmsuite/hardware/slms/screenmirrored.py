@@ -99,6 +99,8 @@ class ScreenMirrored(SLM):
     texture : pyglet.gl.GLuint
         Identifier for the texture loaded into ``OpenGL`` memory.
     """
+    # The OpenGL context is current only in the thread which created it.
+    _write_hw_threadsafe = False
 
     def __init__(self, display_number, bitdepth=8, verbose=True, **kwargs):
         """
@@ -301,6 +303,7 @@ class ScreenMirrored(SLM):
 
     def close(self):
         """Closes frame. See :class:`.SLM`."""
+        super().close()
         self.window.close()
 
     @staticmethod
@@ -3,6 +3,8 @@ Abstract functionality for SLMs.
 """
 
 import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 from PIL import Image
 
@@ -10,6 +12,70 @@ from slmsuite.holography import toolbox
 from slmsuite.misc.math import INTEGER_TYPES
 from slmsuite.holography import analysis
 
+# Try to import cupy for GPU-resident phase data, but revert to base numpy upon ImportError.
+try:
+    import cupy as cp
+except ImportError:
+    cp = np
+
+# Fused phase -> grayscale conversion for GPU-resident phase data. See SLM._phase2gray().
+# mode 0: phase_scaling is one; bitwise integer modulo.
+# mode 1: phase_scaling is not one; whether the data must be wrapped is read from the
+#         device flag wrap, set by _phase2gray_wrap_kernel without synchronizing the host.
+if cp != np:
+    _phase2gray_kernel = cp.ElementwiseKernel(
+        "T phase, float64 correction, float64 factor, int64 bitresolution, "
+        "float64 phase_scaling, int32 mode, raw int32 wrap",
+        "float64 stored, U out",
+        """
+        stored = (double)phase + correction;
+        double v = factor * stored;
+
+        if (mode == 0) {
+            long long g = (long long)ceil(v) - 1;
+            out = (U)(g & (bitresolution - 1));
+        } else if (wrap[0] == 0) {
+            out = (U)(v + (bitresolution - 1));
+        } else {
+            double period = bitresolution * phase_scaling;
+            v -= 1;
+            v -= period * floor(v / period);
+            v += bitresolution * (1 - phase_scaling);
+            if (phase_scaling > 1 && v < 0) {
+                v = bitresolution - 1;
+            }
+            out = (U)v;
+        }
+        """,
+        "slmsuite_phase2gray",
+    )
+    # Whether any scaled phase is outside the SLM range, in a single reduction.
+    _phase2gray_wrap_kernel = cp.ReductionKernel(
+        "T phase, float64 correction, float64 factor, int64 bitresolution",
+        "int32 wrap",
+        "(factor * ((double)phase + correction) <= -bitresolution"
+        " || factor * ((double)phase + correction) > 0) ? 1 : 0",
+        "max(a, b)",
+        "wrap = a",
+        "0",
+        "slmsuite_phase2gray_wrap",
+    )
+    # Quantize the phase to levels, then gather from the lookup table. See SLM.set_phase_lut().
+    _phase2gray_lut_kernel = cp.ElementwiseKernel(
+        "T phase, float64 correction, raw U table, float64 factor, int64 levels, int64 offset",
+        "float64 stored, U out",
+        """
+        stored = (double)phase + correction;
+        long long level = (long long)floor(factor * stored) & (levels - 1);
+        out = table[offset + level];
+        """,
+        "slmsuite_phase2gray_lut",
+    )
+else:
+    _phase2gray_kernel = None
+    _phase2gray_wrap_kernel = None
+    _phase2gray_lut_kernel = None
+
 
 class SLM:
     """
@@ -51,6 +117,15 @@ class SLM:
         Delay in seconds to allow the SLM to settle. This is mostly useful for applications
         requiring high precision. This delay is applied if the user flags ``settle``
         in :meth:`write()`. Defaults to .3 sec for precision.
+        Superseded by :attr:`settle_model` if it is set.
+    settle_model : dict or None
+        Model of the settle time versus the magnitude of the change in :attr:`display`,
+        fit by :meth:`~slmsuite.hardware.cameraslms.FourierSLM.measure_settle()`.
+        Contains the RMS changes ``"rms"`` (in integer levels) at which the :math:`1/e`
+        response times ``"tau_s"`` were measured, and the ``"tolerance"`` (in integer
+        levels) of RMS deviation below which the SLM is considered settled.
+        See :meth:`predict_settle_time()`. Defaults to ``None``, in which case every
+        settle lasts :attr:`settle_time_s`.
     dx_um : float
         x pixel pitch in um.
     dy_um : float
@@ -76,11 +151,26 @@ class SLM:
         Phase correction devised for the SLM by
         :meth:`~slmsuite.hardware.cameraslms.FourierSLM.wavefront_calibrate`.
         Of size :attr:`shape`. Defaults to ``None`` when no correction is provided.
-    phase : numpy.ndarray
+    phase_lut : numpy.ndarray or None
+        Lookup table from quantized phase to display integers, of shape ``(levels,)``
+        or ``(regions, levels)``. See :meth:`set_phase_lut()`.
+        Defaults to ``None``, in which case the phase is converted arithmetically.
+    phase_lut_regions : numpy.ndarray<int> or None
+        Of size :attr:`shape`. The row of :attr:`phase_lut` used by each pixel.
+        ``None`` if :attr:`phase_lut` is one-dimensional.
+    phase : numpy.ndarray OR cupy.ndarray
         Displayed data in units of phase delay (normalized).
+        If :mod:`cupy` data was last passed to :meth:`write()`, this stays on the GPU.
     display : numpy.ndarray
         Displayed data in SLM units (integers).
+    sequence : numpy.ndarray or numpy.memmap or None
+        Sequence of display frames of shape ``(frames, height, width)``, preloaded by
+        :meth:`preload_sequence()` for playback with :meth:`play_sequence()`.
     """
+    # Whether _write_hw() can be called from a thread other than the one which opened
+    # the SLM. Subclasses bound to a thread (e.g. by an OpenGL context) should set False.
+    _write_hw_threadsafe = True
+
     def __init__(
         self,
         width,
@@ -134,6 +224,7 @@ class SLM:
 
         # time to delay after writing (allows SLM to stabilize).
         self.settle_time_s = settle_time_s
+        self.settle_model = None
 
         # Spatial dimensions
         self.dx_um = dx_um
@@ -151,6 +242,11 @@ class SLM:
         self.phase_correction = None
         self.measured_amplitude = None
 
+        # Lookup table for phase -> integer conversion, disabled by default.
+        self.phase_lut = None
+        self.phase_lut_regions = None
+        self._lut_workspace = None
+
         # Decide dtype
         if self.bitdepth <= 8:
             dtype = np.uint8
@@ -161,9 +257,29 @@ class SLM:
         self.phase = np.zeros(self.shape)
         self.display = np.zeros(self.shape, dtype=dtype)
 
+        # GPU buffers for writing cupy data, allocated upon first use.
+        self._device_buffers = None
+
+        # Writer thread and double buffers for write_async(), allocated upon first use.
+        self._async = None
+
+        # Guards the update of phase and display together after a write.
+        self._display_lock = threading.Lock()
+
+        # Preloaded sequence of display frames. See preload_sequence().
+        self.sequence = None
+        self._sequence_native = False
+
     def close(self):
-        """Abstract method to close the SLM and delete related objects."""
-        raise NotImplementedError()
+        """
+        Closes the SLM and deletes related objects. Subclasses **should** overwrite this
+        to release the hardware, calling ``super().close()`` first such that pending
+        asynchronous writes (see :meth:`write_async()`) finish and the writer thread
+        is shut down.
+        """
+        if self._async is not None:
+            self._async["executor"].shutdown(wait=True)
+            self._async = None
 
     @staticmethod
     def info(verbose=True):
@@ -295,6 +411,10 @@ class SLM:
             important exception that phases (after wrapping) between ``2*pi/phase_scaling`` and
             ``2*pi`` are set to zero. For instance, a sawtooth blaze would be truncated at the tips.
 
+        If a lookup table is set (:attr:`phase_lut`, see :meth:`set_phase_lut()`), all
+        of the above is folded into the table, and the conversion is a single binning and
+        gather pass regardless of :attr:`phase_scaling`.
+
         Caution
         ~~~~~~~
         After scale conversion, data is ``floor()`` ed to integers with ``np.copyto``, rather than
@@ -305,9 +425,20 @@ class SLM:
         a pull request. We have not been able to find an example of ``np.copyto``
         producing undesired behavior, but will change this if such behavior is found.
 
+        Tip
+        ~~~
+        If ``phase`` is a :mod:`cupy` array of floats, the data never leaves the GPU:
+        :attr:`phase_correction` is cached on the GPU, and the correction and integer
+        conversion are applied in a single fused kernel. Only the final
+        :attr:`display` frame is transferred to the host, and :attr:`phase`
+        is kept on the GPU. This is useful for closed-loop feedback (see
+        :meth:`~slmsuite.holography.algorithms.FeedbackHologram.measure()`).
+        The cache is refreshed whenever :attr:`phase_correction` is replaced, but not
+        if it is modified in-place.
+
         Parameters
         ----------
-        phase : numpy.ndarray or None
+        phase : numpy.ndarray or cupy.ndarray or None
             Phase data to display in units of :math:`2\pi`,
             unless the passed data is of integer type and the data is applied directly.
 
@@ -335,7 +466,9 @@ class SLM:
         phase_correct : bool
             Whether or not to add :attr:`~slmsuite.hardware.slms.slm.SLM.phase_correction` to ``phase``.
         settle : bool
-            Whether to sleep for :attr:`~slmsuite.hardware.slms.slm.SLM.settle_time_s`.
+            Whether to sleep for :attr:`~slmsuite.hardware.slms.slm.SLM.settle_time_s`,
+            or for the time predicted by :attr:`settle_model` for the change in
+            :attr:`display` (see :meth:`predict_settle_time()`).
 
         Returns
         -------
@@ -348,22 +481,469 @@ class SLM:
             If integer data is incompatible with the bitdepth or if the passed phase is
             otherwise incompatible (not a 2D array or smaller than the SLM shape, etc).
         """
+        # Do not interleave with queued asynchronous writes.
+        self._wait_async()
+
+        # Keep a sample of the previous frame to predict the settle time.
+        if settle and self.settle_model is not None:
+            previous = self.display[::4, ::4].copy()
+        else:
+            previous = None
+
+        # Convert the data.
+        converted = self._convert(phase, phase_correct, self.display, self.phase)
+        with self._display_lock:
+            self.phase = converted
+
+        # Write!
+        self._write_hw(self.display)
+
+        # Optional delay.
+        if settle:
+            time.sleep(self._get_settle_time(previous, self.display))
+
+        return self.display
+
+    def write_async(
+        self,
+        phase,
+        phase_correct=True,
+        settle=False,
+    ):
+        """
+        Asynchronous variant of :meth:`write()`, returning once ``phase`` is converted
+        to integer data rather than after the hardware write and settle.
+
+        Conversion happens in the calling thread, into one of two display buffers.
+        The hardware write (:meth:`_write_hw()`) and settle happen in a writer thread, in
+        order of submission. :attr:`phase` and :attr:`display` are updated together in
+        the writer thread, once the pattern is written, such that both always describe
+        the displayed pattern rather than the queued one. This way, the computation and
+        conversion of the next pattern overlaps with the write and settle of the current
+        one. A third call waits for the first to complete before reusing its buffer.
+        :meth:`write()` waits for all pending asynchronous writes.
+
+        Tip
+        ~~~
+        The returned future can be awaited in :mod:`asyncio` code with
+        ``await asyncio.wrap_future(slm.write_async(phase, settle=True))``.
+
+        Note
+        ~~~~
+        For SLMs whose :meth:`_write_hw()` is bound to the opening thread (such as
+        :class:`~slmsuite.hardware.slms.screenmirrored.ScreenMirrored`), the hardware
+        write happens in the calling thread once the previous write has settled; only the
+        settle is waited in the writer thread.
+
+        Parameters
+        ----------
+        phase, phase_correct, settle
+            See :meth:`write()`.
+
+        Returns
+        -------
+        concurrent.futures.Future
+            Completes once the data is written to the SLM and, if ``settle``, settled.
+            The result is a copy of the displayed integer data. Errors during the
+            hardware write are raised by :meth:`~concurrent.futures.Future.result()`.
+        """
+        if self._async is None:
+            self._async = {
+                "executor": ThreadPoolExecutor(max_workers=1, thread_name_prefix=self.name),
+                "buffers": [np.zeros_like(self.display), np.zeros_like(self.display)],
+                "phases": [np.zeros(self.shape), np.zeros(self.shape)],
+                "futures": [None, None],
+                "index": 0,
+            }
+        state = self._async
+
+        index = state["index"]
+        buffer = state["buffers"][index]
+        scratch = state["phases"][index]
+
+        # Wait for the previous write from this buffer to finish.
+        (previous, state["futures"][index]) = (state["futures"][index], None)
+        if previous is not None:
+            previous.result()
+
+        # Convert the data while the other buffer is being written. The converted phase
+        # goes to a scratch array, leaving phase to describe the displayed pattern.
+        converted = self._convert(phase, phase_correct, buffer, scratch)
+
+        if converted is not scratch:
+            converted = converted.copy()    # e.g. the reused GPU buffer.
+
+        if self._write_hw_threadsafe:
+            future = state["executor"].submit(
+                self._write_async_worker, buffer, converted, True, settle
+            )
+        else:
+            # Write from this thread, once the previous frame has settled.
+            (previous, state["futures"][1 - index]) = (state["futures"][1 - index], None)
+            if previous is not None:
+                previous.result()
+
+            self._write_hw(buffer)
+            future = state["executor"].submit(
+                self._write_async_worker, buffer, converted, False, settle
+            )
+
+        state["futures"][index] = future
+        state["index"] = 1 - index
+
+        return future
+
+    def _write_async_worker(self, buffer, phase, write, settle):
+        """
+        Runs in the writer thread of :meth:`write_async()`.
+        """
+        if write:
+            self._write_hw(buffer)
+
+        if settle:
+            settle_time_s = self._get_settle_time(self.display, buffer)
+
+        # Copy, as the scratch phase is reused by a later write.
+        phase = phase.copy()
+
+        with self._display_lock:
+            np.copyto(self.display, buffer)
+            self.phase = phase
+
+        # Optional delay.
+        if settle:
+            time.sleep(settle_time_s)
+
+        return buffer.copy()
+
+    def predict_settle_time(self, rms):
+        r"""
+        Predicts the time for the SLM to settle after a change of :attr:`display`.
+
+        If :attr:`settle_model` is set, the residual deviation after a change of
+        RMS magnitude :math:`\Delta` is modeled to decay as
+        :math:`\Delta e^{-t / \tau(\Delta)}`, where the response time
+        :math:`\tau(\Delta)` is interpolated from the measured response times.
+        The SLM is settled when this falls below the tolerance :math:`\epsilon`:
+
+        .. math:: t = \tau(\Delta) \log\left( \frac{\Delta}{\epsilon} \right).
+
+        Small incremental changes, such as those in feedback loops, thus settle much
+        faster than full-frame changes.
+
+        Parameters
+        ----------
+        rms : float
+            RMS change of :attr:`display`, in integer levels.
+
+        Returns
+        -------
+        float
+            Predicted settle time in seconds. If :attr:`settle_model` is ``None``,
+            :attr:`settle_time_s`.
+        """
+        model = self.settle_model
+
+        if model is None:
+            return self.settle_time_s
+
+        rms = float(rms)
+        if rms <= model["tolerance"]:
+            return 0
+
+        tau_s = np.interp(rms, model["rms"], model["tau_s"])
+
+        return float(tau_s * np.log(rms / model["tolerance"]))
+
+    def _get_settle_time(self, previous, display):
+        """
+        Returns the settle time for a change from ``previous`` to ``display``, which are
+        compared on a subsampled grid. See :meth:`predict_settle_time()`.
+        """
+        if self.settle_model is None or previous is None:
+            return self.settle_time_s
+
+        display = display[::4, ::4]
+        if previous.shape != display.shape:
+            previous = previous[::4, ::4]
+
+        delta = np.subtract(display, previous, dtype=np.int32)
+        rms = np.sqrt(np.mean(np.square(delta, dtype=np.float64)))
+
+        return self.predict_settle_time(rms)
+
+    def _wait_async(self):
+        """
+        Waits for all pending :meth:`write_async()` writes to complete.
+        """
+        if self._async is not None:
+            # Clear the futures first, such that errors are only raised once.
+            futures = self._async["futures"]
+            self._async["futures"] = [None, None]
+
+            for future in futures:
+                if future is not None:
+                    future.result()
+
+    def preload_sequence(self, phases, phase_correct=True, memmap=None, n_frames=None):
+        """
+        Converts a sequence of patterns to :attr:`display` format up front, storing
+        them in the contiguous array :attr:`sequence` for playback with
+        :meth:`play_sequence()`. Each pattern is converted exactly as :meth:`write()` does,
+        but :attr:`phase` and :attr:`display` are left describing the displayed pattern.
+
+        If the SLM supports on-board frame memory, the sequence is also uploaded
+        to the device (see :meth:`_preload_sequence_hw()`).
+
+        Parameters
+        ----------
+        phases : array_like OR iterable
+            Patterns to convert, each in any format accepted by :meth:`write()`,
+            including ``None``. A generator can be passed to avoid holding all
+            floating point patterns in memory at once: patterns are converted one at
+            a time as they are yielded.
+        phase_correct : bool
+            See :meth:`write()`.
+        memmap : str OR None
+            If a file path is given, :attr:`sequence` is a :class:`numpy.memmap`
+            stored in this ``.npy`` file, for sequences too large for memory.
+            The file can be reloaded with ``numpy.load(memmap, mmap_mode="r")``.
+        n_frames : int OR None
+            Number of patterns in ``phases``. Defaults to ``len(phases)``. If ``phases``
+            has no length and ``n_frames`` is ``None``, :attr:`sequence` is grown as
+            patterns are yielded, which is not possible with ``memmap``.
+
+        Returns
+        -------
+        numpy.ndarray or numpy.memmap
+            :attr:`sequence`, the preloaded display frames.
+
+        Raises
+        ------
+        ValueError
+            If ``phases`` does not yield ``n_frames`` patterns, or if ``memmap`` is
+            given for ``phases`` of unknown length.
+        """
+        # Do not interleave with queued asynchronous writes.
+        self._wait_async()
+
+        if n_frames is None and hasattr(phases, "__len__"):
+            n_frames = len(phases)
+
+        if n_frames is None:
+            if memmap is not None:
+                raise ValueError("n_frames is required to preload phases of unknown length to memmap.")
+            shape = (16,) + self.shape
+        else:
+            shape = (int(n_frames),) + self.shape
+
+        if memmap is None:
+            sequence = np.zeros(shape, dtype=self.display.dtype)
+        else:
+            sequence = np.lib.format.open_memmap(
+                memmap, mode="w+", dtype=self.display.dtype, shape=shape
+            )
+
+        # Convert into a workspace, leaving phase to describe the displayed pattern.
+        stored = np.zeros(self.shape)
+        count = 0
+
+        for phase in phases:
+            if count == len(sequence):
+                if n_frames is not None:
+                    raise ValueError("phases yields more than n_frames={} patterns.".format(n_frames))
+
+                # Double the buffer for phases of unknown length.
+                grown = np.zeros((2 * len(sequence),) + self.shape, dtype=self.display.dtype)
+                grown[:count] = sequence
+                sequence = grown
+
+            self._convert(phase, phase_correct, sequence[count], stored)
+            count += 1
+
+        if n_frames is None:
+            sequence = sequence[:count].copy()
+        elif count != n_frames:
+            raise ValueError(
+                "phases yields {} patterns rather than n_frames={}.".format(count, n_frames)
+            )
+
+        if memmap is not None:
+            sequence.flush()
+
+        self.sequence = sequence
+        self._sequence_native = bool(self._preload_sequence_hw(self.sequence))
+
+        return self.sequence
+
+    def play_sequence(self, indices=None, period_s=None):
+        """
+        Plays back frames of the preloaded :attr:`sequence` (see :meth:`preload_sequence()`)
+        at a fixed period, without any conversion.
+
+        If the SLM supports on-board frame memory, playback is hardware-timed
+        (see :meth:`_play_sequence_hw()`). Otherwise, playback is software-timed:
+        frames are pushed with :meth:`_write_hw()` at the scheduled times, sleeping in
+        between and spinning for the final millisecond for precision. If a push takes
+        longer than the period, the following frames are pushed as soon as possible
+        rather than skipped.
+
+        Note
+        ~~~~
+        :attr:`display` and :attr:`phase` are not updated frame by frame during
+        playback. Once playback returns, they describe the last frame played, with
+        :attr:`phase` computed from the integer data as when integer data is written.
+
+        Parameters
+        ----------
+        indices : array_like of int OR None
+            Frames of :attr:`sequence` to play, in order. Frames can be repeated.
+            If ``None``, plays the full sequence.
+        period_s : float OR None
+            Time between the start of consecutive frames.
+            If ``None``, defaults to :attr:`settle_time_s`.
+
+        Returns
+        -------
+        numpy.ndarray
+            Times (with respect to the first frame, in seconds) at which each frame
+            was pushed. For hardware-timed playback, the nominal schedule.
+
+        Raises
+        ------
+        RuntimeError
+            If no sequence is preloaded.
+        """
+        if self.sequence is None:
+            raise RuntimeError("No sequence preloaded. Call preload_sequence() first.")
+
+        if indices is None:
+            indices = np.arange(len(self.sequence))
+        else:
+            indices = np.ravel(indices).astype(int)
+
+        if period_s is None:
+            period_s = self.settle_time_s
+
+        # Do not interleave with queued asynchronous writes.
+        self._wait_async()
+
+        if self._sequence_native:
+            self._play_sequence_hw(indices, period_s)
+            times = np.arange(len(indices)) * period_s
+        else:
+            times = np.zeros(len(indices))
+            t0 = time.perf_counter()
+
+            for (i, index) in enumerate(indices):
+                # Coarse sleep, then spin for precision.
+                target = t0 + i * period_s
+                remaining = target - time.perf_counter()
+                if remaining > 1e-3:
+                    time.sleep(remaining - 1e-3)
+                while time.perf_counter() < target:
+                    pass
+
+                times[i] = time.perf_counter() - t0
+                self._write_hw(self.sequence[index])
+
+        # Match the caches to the last frame, as when integer data is written.
+        if len(indices):
+            display = self.sequence[indices[-1]]
+            phase = 2 * np.pi - display * (2 * np.pi / self.phase_scaling / self.bitresolution)
+
+            with self._display_lock:
+                np.copyto(self.display, display)
+                self.phase = phase
+
+        return times
+
+    def _preload_sequence_hw(self, sequence):
+        """
+        Abstract method to upload a sequence of display frames to on-board frame memory.
+        Subclasses with such memory **may** overwrite this and :meth:`_play_sequence_hw()`.
+
+        Parameters
+        ----------
+        sequence : numpy.ndarray
+            See :attr:`sequence`.
+
+        Returns
+        -------
+        bool
+            Whether the sequence was uploaded. If ``False`` (the default),
+            :meth:`play_sequence()` uses software timing.
+        """
+        return False
+
+    def _play_sequence_hw(self, indices, period_s):
+        """
+        Abstract method to play back frames from on-board memory with hardware timing.
+        Only called if :meth:`_preload_sequence_hw()` returned ``True``.
+
+        Parameters
+        ----------
+        indices, period_s
+            See :meth:`play_sequence()`.
+        """
+        raise NotImplementedError()
+
+    def _convert(self, phase, phase_correct, out, stored=None):
+        """
+        Converts ``phase`` to integer data in ``out``. See :meth:`write()`.
+        Neither :attr:`phase` nor :attr:`display` are modified.
+
+        Parameters
+        ----------
+        phase, phase_correct
+            See :meth:`write()`.
+        out : numpy.ndarray
+            Integer array of the shape of :attr:`display` to fill.
+        stored : numpy.ndarray OR None
+            Float array of the SLM shape used as workspace for host data. If ``None``,
+            one is allocated.
+
+        Returns
+        -------
+        numpy.ndarray OR cupy.ndarray
+            The phase describing ``out``, to be stored in :attr:`phase`. This is
+            ``stored`` or, for GPU-resident data, a reused GPU buffer.
+        """
+        # Keep GPU-resident float data on the GPU.
+        if (
+            cp != np and isinstance(phase, cp.ndarray)
+            and not np.issubdtype(phase.dtype, np.integer)
+        ):
+            return self._write_device(phase, phase_correct, out)
+        else:
+            return self._write_host(phase, phase_correct, out, stored)
+
+    def _write_host(self, phase, phase_correct, out, stored=None):
+        """
+        Wrapped by :meth:`_convert()`. Converts host data into ``out``, using ``stored``
+        as workspace for the phase, and returns the phase.
+        """
+        if not isinstance(stored, np.ndarray) or stored.shape != self.shape:
+            stored = np.zeros(self.shape)
+
         # Helper variable to speed the case where phase is None.
         zero_phase = False
 
         # Parse phase.
         if phase is None:
             # Zero the phase pattern.
-            self.phase.fill(0)
+            stored.fill(0)
             zero_phase = True
         else:
             # Make sure the array is an ndarray.
+            if hasattr(phase, "get"):
+                phase = phase.get()
             phase = np.array(phase)
 
         if phase is not None and isinstance(phase, INTEGER_TYPES):
             # Check the type.
-            if phase.dtype != self.display.dtype:
-                raise TypeError("Unexpected integer type {}. Expected {}.".format(phase.dtype, self.display.dtype))
+            if phase.dtype != out.dtype:
+                raise TypeError("Unexpected integer type {}. Expected {}.".format(phase.dtype, out.dtype))
 
             # If integer data was passed, check that we are not out of range.
             if np.any(phase >= self.bitresolution):
@@ -371,42 +951,263 @@ class SLM:
 
             # Copy the pattern and unpad if necessary.
             if phase.shape != self.shape:
-                np.copyto(self.display, toolbox.unpad(phase, self.shape))
+                np.copyto(out, toolbox.unpad(phase, self.shape))
             else:
-                np.copyto(self.display, phase)
+                np.copyto(out, phase)
 
             # Update the phase variable with the integer data that we displayed.
-            self.phase = 2 * np.pi - self.display * (2 * np.pi / self.phase_scaling / self.bitresolution)
+            stored = 2 * np.pi - out * (2 * np.pi / self.phase_scaling / self.bitresolution)
         else:
             # If float data was passed (or the None case).
             # Copy the pattern and unpad if necessary.
             if phase is not None:
-                if self.phase.shape != self.shape:
-                    np.copyto(self.phase, toolbox.unpad(self.phase, self.shape))
+                if phase.shape != self.shape:
+                    np.copyto(stored, toolbox.unpad(phase, self.shape))
                 else:
-                    np.copyto(self.phase, phase)
+                    np.copyto(stored, phase)
 
             # Add phase correction if requested.
             if phase_correct and self.phase_correction is not None:
-                self.phase += self.phase_correction
+                stored += self.phase_correction
                 zero_phase = False
 
-            # Pass the data to self.display.
+            # Pass the data to out.
             if zero_phase:
                 # If None was passed and phase_correct is False, then use a faster method.
-                self.display.fill(0)
+                out.fill(0)
             else:
                 # Turn the floats in phase space to integer data for the SLM.
-                self.display = self._phase2gray(self.phase, out=self.display)
+                if self.phase_lut is None:
+                    self._phase2gray(stored, out=out)
+                else:
+                    self._phase2gray_lut(stored, out=out)
 
-        # Write!
-        self._write_hw(self.display)
+        return stored
 
-        # Optional delay.
-        if settle:
-            time.sleep(self.settle_time_s)
+    def _write_device(self, phase, phase_correct, out):
+        """
+        Wrapped by :meth:`_convert()`. Converts GPU-resident float data into ``out``
+        with a single fused kernel, transferring only the integer result to the host.
+        Returns the phase, which stays on the GPU.
+        """
+        if phase.shape != self.shape:
+            phase = toolbox.unpad(phase, self.shape)
+
+        # Allocate GPU buffers upon first use.
+        if self._device_buffers is None:
+            self._device_buffers = {
+                "phase": cp.zeros(self.shape, dtype=np.float64),
+                "display": cp.zeros(self.shape, dtype=self.display.dtype),
+                "wrap": cp.zeros(1, dtype=np.int32),
+                "correction": (None, None),
+            }
+        buffers = self._device_buffers
+
+        # Cache the phase correction on the GPU, refreshing if the attribute was replaced.
+        if phase_correct and self.phase_correction is not None:
+            (source, correction) = buffers["correction"]
+            if source is not self.phase_correction:
+                correction = cp.array(self.phase_correction, dtype=np.float64)
+                buffers["correction"] = (self.phase_correction, correction)
+        else:
+            correction = 0.
 
-        return self.display
+        if self.phase_lut is not None:
+            (table, offset) = self._get_lut_workspace(device=True)
+
+            _phase2gray_lut_kernel(
+                phase, correction, table, table.shape[-1] / 2 / np.pi, table.shape[-1],
+                0 if offset is None else offset, buffers["phase"], buffers["display"]
+            )
+
+            # Transfer the integer data only.
+            buffers["display"].get(out=out)
+            return buffers["phase"]
+
+        # Decide the conversion mode in the same way as _phase2gray().
+        if self.phase_scaling == 1:
+            factor = -(self.bitresolution / 2 / np.pi)
+            mode = 0
+        else:
+            factor = -(self.bitresolution * self.phase_scaling / 2 / np.pi)
+            mode = 1
+
+            # Only if necessary, modulo the phase to remain within SLM bounds. The
+            # decision stays on the device, avoiding temporaries and host syncs.
+            _phase2gray_wrap_kernel(
+                phase, correction, factor, self.bitresolution, out=buffers["wrap"].reshape(())
+            )
+
+        _phase2gray_kernel(
+            phase, correction, factor, self.bitresolution, self.phase_scaling, mode,
+            buffers["wrap"], buffers["phase"], buffers["display"]
+        )
+
+        # Transfer the integer data only.
+        buffers["display"].get(out=out)
+        return buffers["phase"]
+
+    def set_phase_lut(self, levels=None, nonlinearity=None, regions=None):
+        r"""
+        Enables lookup table (LUT) conversion of phase to display integers in
+        :meth:`write()`, setting :attr:`phase_lut` and :attr:`phase_lut_regions`.
+
+        The phase is binned into ``levels`` equally spaced levels over :math:`2\pi`, and each
+        level is mapped to the integer which :meth:`_phase2gray()` produces for the
+        center of the level. This folds :attr:`phase_scaling` and the bitdepth
+        mask into the table, such that :meth:`write()` only needs one gather pass.
+        For :attr:`phase_scaling` of one, any multiple of :attr:`bitresolution` gives the
+        same result as arithmetic conversion. Otherwise, phases are wrapped by :math:`2\pi`
+        (even if the SLM has more phase range) and are accurate to within one level.
+        To disable the LUT, set :attr:`phase_lut` to ``None``.
+
+        Parameters
+        ----------
+        levels : int OR None
+            Number of phase levels. Must be a power of two.
+            If ``None``, defaults to four times :attr:`bitresolution`.
+        nonlinearity : array_like of int OR None
+            Optional vendor nonlinearity mapping each linear display integer to the
+            integer sent to the hardware, of shape ``(bitresolution,)``. For SLMs with spatially
+            varying response, pass one such row per region, of shape
+            ``(regions, bitresolution)``.
+        regions : array_like of int OR None
+            Of size :attr:`shape`. The row of ``nonlinearity`` to use for each pixel.
+            Required if and only if ``nonlinearity`` is two-dimensional.
+
+        Returns
+        -------
+        numpy.ndarray
+            :attr:`phase_lut`, the lookup table.
+
+        Raises
+        ------
+        ValueError
+            If ``levels`` is not a power of two, or ``nonlinearity`` and ``regions``
+            are incompatible.
+        """
+        if levels is None:
+            levels = 4 * self.bitresolution
+        levels = int(levels)
+
+        if levels < 1 or levels & (levels - 1):
+            raise ValueError("LUT levels must be a power of two; found {}.".format(levels))
+
+        # Convert the center of each level.
+        centers = (np.arange(levels) + .5) * (2 * np.pi / levels)
+        table = self._phase2gray(centers, out=np.zeros(levels, dtype=self.display.dtype))
+
+        if nonlinearity is not None:
+            nonlinearity = np.array(nonlinearity)
+
+            if nonlinearity.shape[-1] != self.bitresolution or nonlinearity.ndim > 2:
+                raise ValueError(
+                    "Expected nonlinearity of shape (bitresolution,) or (regions, bitresolution); "
+                    "found shape {}.".format(nonlinearity.shape)
+                )
+            if np.any(nonlinearity < 0) or np.any(nonlinearity >= self.bitresolution):
+                raise ValueError(
+                    "Nonlinearity must be within the bitdepth ({}-bit) of the SLM."
+                    .format(self.bitdepth)
+                )
+
+            table = nonlinearity.astype(self.display.dtype)[..., table]
+
+        if (table.ndim == 2) != (regions is not None):
+            raise ValueError("regions must be passed if and only if nonlinearity is two-dimensional.")
+
+        if regions is not None:
+            regions = np.array(regions, dtype=int)
+
+            if regions.shape != self.shape:
+                raise ValueError(
+                    "Expected regions of shape {}; found shape {}.".format(self.shape, regions.shape)
+                )
+            if np.any(regions < 0) or np.any(regions >= table.shape[0]):
+                raise ValueError("regions must index the rows of nonlinearity.")
+
+        self.phase_lut = table
+        self.phase_lut_regions = regions
+
+        return self.phase_lut
+
+    def _get_lut_workspace(self, device=False):
+        """
+        Returns the flattened :attr:`phase_lut` and the offset of the row of each pixel
+        into it (``None`` without regions), along with preallocated buffers on the host.
+        These are cached until :attr:`phase_lut` or :attr:`phase_lut_regions` are replaced.
+        """
+        workspace = self._lut_workspace
+
+        if (
+            workspace is None
+            or workspace["phase_lut"] is not self.phase_lut
+            or workspace["phase_lut_regions"] is not self.phase_lut_regions
+        ):
+            table = np.ascontiguousarray(self.phase_lut).ravel()
+
+            if self.phase_lut_regions is None:
+                offset = None
+            else:
+                offset = self.phase_lut_regions.astype(np.int64) * self.phase_lut.shape[-1]
+
+            workspace = self._lut_workspace = {
+                "phase_lut": self.phase_lut,
+                "phase_lut_regions": self.phase_lut_regions,
+                "table": table,
+                "offset": offset,
+                "scaled": np.zeros(self.shape),
+                "index": np.zeros(self.shape, dtype=np.int64),
+                "device": None,
+            }
+
+        if device:
+            if workspace["device"] is None:
+                workspace["device"] = (
+                    cp.array(workspace["table"]),
+                    None if workspace["offset"] is None else cp.array(workspace["offset"]),
+                )
+            return workspace["device"]
+
+        return workspace
+
+    def _phase2gray_lut(self, phase, out=None):
+        r"""
+        Lookup table alternative to :meth:`_phase2gray()`, see :meth:`set_phase_lut()`.
+
+        Parameters
+        ----------
+        phase : numpy.ndarray
+            Array of phases in radians, of size :attr:`shape`. Not modified.
+        out : numpy.ndarray
+            Array to store integer values scaled to SLM voltage.
+            If ``None``, an appropriate array will be allocated.
+
+        Returns
+        -------
+        out
+        """
+        if out is None:
+            out = np.zeros(self.shape, dtype=self.display.dtype)
+
+        workspace = self._get_lut_workspace()
+        levels = self.phase_lut.shape[-1]
+        scaled = workspace["scaled"]
+        index = workspace["index"]
+
+        # Bin the phase to levels, wrapping with bitwise integer modulo.
+        np.multiply(phase, levels / 2 / np.pi, out=scaled)
+        np.floor(scaled, out=scaled)
+        np.copyto(index, scaled, casting="unsafe")
+        np.bitwise_and(index, levels - 1, out=index)
+
+        if workspace["offset"] is not None:
+            index += workspace["offset"]
+
+        # Gather from the table.
+        np.take(workspace["table"], index, out=out)
+
+        return out
 
     def _phase2gray(self, phase, out=None):
         r"""
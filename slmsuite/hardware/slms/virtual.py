@@ -0,0 +1,175 @@
+"""
+Virtual SLM without hardware, useful for testing and development.
+Paired with :class:`~slmsuite.hardware.cameras.simulated.SimulatedCamera`, this allows
+:class:`~slmsuite.hardware.cameraslms.FourierSLM` calibration and feedback to run
+headless.
+"""
+import time
+import numpy as np
+
+from .slm import SLM
+
+class VirtualSLM(SLM):
+    """
+    Stand-in for SLM hardware. Written frames are recorded rather than displayed.
+
+    Attributes
+    ----------
+    frame_memory : int
+        Number of frames of emulated on-board memory for sequence playback
+        (see :meth:`~slmsuite.hardware.slms.slm.SLM.preload_sequence()`).
+        If zero, playback falls back to software timing.
+    history : list of (float, numpy.ndarray)
+        Times (from :meth:`time.perf_counter()`) and copies of frames written to the SLM,
+        if recording is enabled with ``record``. Otherwise, only the times are recorded,
+        with ``None`` in place of the frames.
+    record : bool
+        Whether to store copies of written frames in :attr:`history`.
+    response_time_s : float
+        :math:`1/e` time of the emulated liquid crystal response. After a write, the
+        phase delay relaxes exponentially from the previous delay to the new one.
+        See :meth:`get_phase()`. Defaults to zero (instantaneous).
+    """
+
+    def __init__(
+        self,
+        width,
+        height,
+        bitdepth=8,
+        frame_memory=0,
+        record=False,
+        response_time_s=0,
+        settle_time_s=0,
+        name="VirtualSLM",
+        **kwargs
+    ):
+        r"""
+        Initialize the virtual SLM.
+
+        Parameters
+        ----------
+        width, height, bitdepth
+            See :meth:`.SLM.__init__`.
+        frame_memory
+            See :attr:`frame_memory`.
+        record
+            See :attr:`record`.
+        response_time_s
+            See :attr:`response_time_s`.
+        settle_time_s
+            See :attr:`.SLM.settle_time_s`. Defaults to zero such that simulations run
+            at compute speed.
+        name
+            See :attr:`.SLM.name`.
+        kwargs
+            See :meth:`.SLM.__init__` for permissible options.
+        """
+        super().__init__(
+            width, height, bitdepth=bitdepth, name=name, settle_time_s=settle_time_s, **kwargs
+        )
+
+        self.frame_memory = int(frame_memory)
+        self.record = record
+        self.response_time_s = response_time_s
+        self.history = []
+
+        # Emulated phase delay: previous and new delay, and the time of the change.
+        self._delay = (np.zeros(self.shape), np.zeros(self.shape), -np.inf)
+
+        # Emulated on-board frame memory.
+        self._memory = None
+
+        # Zero the display using the superclass `write()` function.
+        self.write(None)
+
+    def close(self):
+        """Clears the recorded history. See :class:`.SLM`."""
+        super().close()
+        self.history = []
+        self._memory = None
+
+    @staticmethod
+    def info(verbose=True):
+        """
+        Virtual SLMs are not discoverable.
+
+        Parameters
+        ----------
+        verbose : bool
+            Whether to print the discovered information.
+
+        Returns
+        --------
+        list of str
+            An empty list.
+        """
+        if verbose: print("VirtualSLM: no hardware to discover.")
+        return []
+
+    def _write_hw(self, display):
+        """Records the frame and starts the emulated response. See :class:`.SLM`."""
+        t = time.perf_counter()
+        self._set_delay(display, t)
+        self.history.append((t, np.copy(display) if self.record else None))
+
+    def _set_delay(self, display, t):
+        """
+        Starts the emulated response towards the phase delay of integer ``display`` data
+        at time ``t``.
+        """
+        # Invert the integer conversion of SLM._phase2gray() (see the sign convention in SLM.write()).
+        delay = (self.bitresolution - .5 - display) * (2 * np.pi / self.bitresolution / self.phase_scaling)
+        self._delay = (self.get_phase(t), delay, t)
+
+    def get_phase(self, t=None):
+        """
+        Returns the phase delay currently applied by the emulated SLM, including the
+        liquid crystal response (see :attr:`response_time_s`).
+
+        Parameters
+        ----------
+        t : float OR None
+            Time (from :meth:`time.perf_counter()`) at which to evaluate the delay.
+            If ``None``, the current time.
+
+        Returns
+        -------
+        numpy.ndarray
+            Phase delay in radians, of size :attr:`.SLM.shape`.
+            Not wrapped, as the delay relaxes continuously between written values.
+        """
+        (previous, delay, t0) = self._delay
+
+        if t is None:
+            t = time.perf_counter()
+
+        if self.response_time_s <= 0 or t - t0 > 50 * self.response_time_s:
+            return delay
+
+        decay = np.exp(-max(t - t0, 0) / self.response_time_s)
+        return delay + (previous - delay) * decay
+
+    def _preload_sequence_hw(self, sequence):
+        """Stores the sequence if it fits in :attr:`frame_memory`. See :class:`.SLM`."""
+        if len(sequence) > self.frame_memory:
+            self._memory = None
+            return False
+
+        self._memory = np.copy(sequence)
+        return True
+
+    def _play_sequence_hw(self, indices, period_s):
+        """Emulates hardware-timed playback from :attr:`frame_memory`. See :class:`.SLM`."""
+        t0 = time.perf_counter()
+
+        for (i, index) in enumerate(indices):
+            t = t0 + i * period_s
+            self.history.append((t, np.copy(self._memory[index]) if self.record else None))
+
+        # Block for the duration of the sequence, as hardware would.
+        remaining = t0 + len(indices) * period_s - time.perf_counter()
+        if remaining > 0:
+            time.sleep(remaining)
+
+        if len(indices):
+            self._set_delay(self._memory[indices[-1]], t0 + (len(indices) - 1) * period_s)
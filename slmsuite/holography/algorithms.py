@@ -70,8 +70,13 @@ import matplotlib.pyplot as plt
 from mpl_toolkits.axes_grid1 import make_axes_locatable
 import cv2
 from tqdm.autonotebook import tqdm
+import os
+import time
+import hashlib
+import h5py
 import warnings
 import pprint
+from collections import OrderedDict
 
 # Import numpy and scipy dependencies.
 import numpy as np
@@ -87,6 +92,7 @@ try:
     from cupyx.scipy.ndimage import gaussian_filter1d as cp_gaussian_filter1d
     from cupyx.scipy.ndimage import gaussian_filter as cp_gaussian_filter
     from cupyx.scipy.ndimage import affine_transform as cp_affine_transform
+    import cupyx
 except ImportError:
     cp = np
     cpfft = spfft
@@ -95,6 +101,12 @@ except ImportError:
     cp_affine_transform = sp_affine_transform
     print("cupy not installed. Using numpy.")
 
+# Try to import pyFFTW, an optional and faster FFT backend for numpy.
+try:
+    import pyfftw
+except ImportError:
+    pyfftw = None
+
 # Import helper functions
 from slmsuite.holography import analysis, toolbox
 from slmsuite.misc.math import REAL_TYPES
@@ -127,6 +139,250 @@ FEEDBACK_OPTIONS = [
     "external_spot"
 ]
 
+# List of FFT backends. See the documentation for the fft_backend flag in GS().
+FFT_BACKENDS = [
+    "numpy",
+    "scipy",
+    "pyfftw",
+    "cupy"
+]
+
+class _FFTEngine:
+    """
+    Planned two-dimensional FFTs which act in-place on a single preallocated complex
+    :attr:`buffer`. Transforms are applied over the last two axes of :attr:`buffer`
+    and are orthonormalized, as in :meth:`Hologram.GS()`.
+
+    The centered transform ``fftshift(fft2(fftshift(x)))`` is computed without the
+    copies of ``fftshift`` by modulating the data with a checkerboard of signs before and
+    after the transform, which is an equivalent in-place operation for even shapes.
+    Odd shapes fall back to the (copying) shifts.
+
+    Attributes
+    ----------
+    shape : tuple of int
+        Shape of :attr:`buffer`.
+    dtype : numpy.dtype
+        Complex datatype of :attr:`buffer`.
+    backend : str
+        Library used for the transforms. See :data:`FFT_BACKENDS`.
+    workers : int OR None
+        Number of CPU threads used by the ``"scipy"`` and ``"pyfftw"`` backends.
+    buffer : numpy.ndarray OR cupy.ndarray
+        Complex array which is transformed in-place.
+    """
+
+    def __init__(self, shape, dtype, backend=None, workers=None):
+        self.shape = tuple(shape)
+        self.dtype = np.dtype(dtype)
+
+        # Parse the backend.
+        if backend is None:
+            if cp != np:
+                backend = "cupy"
+            elif pyfftw is not None:
+                backend = "pyfftw"
+            else:
+                backend = "scipy"
+
+        if not backend in FFT_BACKENDS:
+            raise ValueError(
+                "algorithms.py: FFT backend '{}' not recognized.\n"
+                "Valid options: {}".format(backend, FFT_BACKENDS)
+            )
+        if (backend == "cupy") != (cp != np):
+            raise ValueError(
+                "algorithms.py: FFT backend '{}' is not compatible with the {} arrays "
+                "used for optimization.".format(backend, "cupy" if cp != np else "numpy")
+            )
+        if backend == "pyfftw" and pyfftw is None:
+            raise ValueError("algorithms.py: FFT backend 'pyfftw' requested, but pyfftw is not installed.")
+
+        self.backend = backend
+        self.workers = workers
+
+        # Centered transforms can be done in-place for even shapes.
+        self._inplace_shift = all(s % 2 == 0 for s in self.shape[-2:])
+        self._shift_sign = (self.shape[-2] // 2 + self.shape[-1] // 2) % 2
+
+        # Allocate the buffer and plan.
+        if backend == "pyfftw":
+            self.buffer = pyfftw.empty_aligned(self.shape, dtype=self.dtype)
+            threads = os.cpu_count() if workers is None or workers < 1 else workers
+            self._plans = [
+                pyfftw.FFTW(
+                    self.buffer, self.buffer,
+                    axes=(-2, -1),
+                    direction=direction,
+                    flags=("FFTW_MEASURE",),
+                    threads=threads,
+                    ortho=True,
+                    normalise_idft=False
+                )
+                for direction in ["FFTW_FORWARD", "FFTW_BACKWARD"]
+            ]
+            self.buffer.fill(0)     # FFTW_MEASURE overwrites the buffer while planning.
+        elif backend == "cupy":
+            self.buffer = cp.zeros(self.shape, dtype=self.dtype)
+            self._plans = cpfft.get_fft_plan(self.buffer, axes=(-2, -1), value_type="C2C")
+        else:
+            self.buffer = np.zeros(self.shape, dtype=self.dtype)
+            self._plans = None
+
+    def matches(self, shape, dtype, backend=None, workers=None):
+        """
+        Whether this engine can be reused for the given parameters.
+        ``backend=None`` accepts any backend.
+        """
+        return (
+            self.shape == tuple(shape)
+            and self.dtype == np.dtype(dtype)
+            and (backend is None or backend == self.backend)
+            and workers == self.workers
+        )
+
+    def _transform(self, inverse):
+        buffer = self.buffer
+
+        if self.backend == "pyfftw":
+            self._plans[int(inverse)]()
+        elif self.backend == "cupy":
+            fft = cpfft.ifft2 if inverse else cpfft.fft2
+            fft(buffer, axes=(-2, -1), norm="ortho", overwrite_x=True, plan=self._plans)
+        elif self.backend == "scipy":
+            fft = spfft.ifft2 if inverse else spfft.fft2
+            workers = -1 if self.workers is None else self.workers
+            result = fft(buffer, axes=(-2, -1), norm="ortho", overwrite_x=True, workers=workers)
+            if result is not buffer:
+                buffer[...] = result
+        else:
+            fft = np.fft.ifft2 if inverse else np.fft.fft2
+            buffer[...] = fft(buffer, axes=(-2, -1), norm="ortho")
+
+    def _modulate(self, sign):
+        # Multiply by the checkerboard (-1)^(n+m), additionally negated if sign is odd.
+        buffer = self.buffer
+        if sign:
+            buffer[..., ::2, ::2] *= -1
+            buffer[..., 1::2, 1::2] *= -1
+        else:
+            buffer[..., ::2, 1::2] *= -1
+            buffer[..., 1::2, ::2] *= -1
+
+    def _centered_transform(self, inverse, shift):
+        if not shift:
+            self._transform(inverse)
+        elif self._inplace_shift:
+            self._modulate(0)
+            self._transform(inverse)
+            self._modulate(self._shift_sign)
+        else:
+            shift_fn = cp.fft.ifftshift if inverse else cp.fft.fftshift
+            self.buffer[...] = shift_fn(self.buffer, axes=(-2, -1))
+            self._transform(inverse)
+            self.buffer[...] = shift_fn(self.buffer, axes=(-2, -1))
+
+        return self.buffer
+
+    def fft2(self, shift=True):
+        """
+        In-place forward transform of :attr:`buffer`.
+
+        Parameters
+        ----------
+        shift : bool
+            If ``True``, computes ``fftshift(fft2(fftshift(buffer)))``.
+
+        Returns
+        -------
+        numpy.ndarray OR cupy.ndarray
+            :attr:`buffer`, now containing the transform.
+        """
+        return self._centered_transform(False, shift)
+
+    def ifft2(self, shift=True):
+        """
+        In-place inverse transform of :attr:`buffer`.
+
+        Parameters
+        ----------
+        shift : bool
+            If ``True``, computes ``ifftshift(ifft2(ifftshift(buffer)))``.
+
+        Returns
+        -------
+        numpy.ndarray OR cupy.ndarray
+            :attr:`buffer`, now containing the transform.
+        """
+        return self._centered_transform(True, shift)
+
+
+# Fused kernels for allocation-free WGS weighting. See Hologram._update_weights_fused().
+_WGS_PREAMBLE = r"""
+template <typename F, typename T>
+__device__ T wgs_ratio(F feedback, T target, T scale) {
+    T c = (T)feedback * scale / target;
+    return (isnan(c) || c == (T)INFINITY) ? (T)1 : c;
+}
+"""
+
+if cp != np:
+    _wgs_nansumsq_kernel = cp.ReductionKernel(
+        "T x", "float64 y",
+        "isnan(x) ? 0.0 : (double)x * (double)x",
+        "a + b", "y = a", "0",
+        "slmsuite_wgs_nansumsq",
+        reduce_type="double"
+    )
+    _wgs_ratio_sum_kernel = cp.ReductionKernel(
+        "F feedback, T target, T scale", "T y",
+        "wgs_ratio(feedback, target, scale)",
+        "a + b", "y = a", "0",
+        "slmsuite_wgs_ratio_sum",
+        preamble=_WGS_PREAMBLE
+    )
+    _wgs_weights_kernel = cp.ElementwiseKernel(
+        "F feedback, T target, T scale, T exponent, T factor, T mean, T wmax, bool nogrette",
+        "T weight",
+        """
+        T c = wgs_ratio(feedback, target, scale);
+        T d = nogrette ? (T)1 / ((T)1 - factor * ((T)1 - c / mean)) : pow(c, -exponent);
+        if (d == (T)INFINITY) d = 1;
+        T w = weight * d;
+        if (isnan(w)) w = (T)0.0001;
+        else if (isinf(w)) w = (w > 0) ? wmax : -wmax;
+        weight = w;
+        """,
+        "slmsuite_wgs_weights",
+        preamble=_WGS_PREAMBLE
+    )
+
+
+def _nansumsq(x, chunk=1 << 16):
+    """
+    Computes ``nansum(square(x))`` for a real array ``x`` without allocating
+    a temporary array of the same size. The sum is accumulated in ``float64``,
+    converting single precision data ``chunk`` elements at a time.
+    """
+    if cp != np:
+        return _wgs_nansumsq_kernel(x)
+
+    flat = x.reshape(-1)
+    if flat.dtype == np.float64:
+        result = np.dot(flat, flat)
+    else:
+        result = np.float64(0)
+        for i in range(0, flat.size, chunk):
+            block = flat[i:i + chunk].astype(np.float64)
+            result += np.dot(block, block)
+
+    # Only fall back to the allocating nansum() if there is something to ignore.
+    if np.isnan(result):
+        result = np.nansum(np.square(x, dtype=np.float64))
+
+    return result
+
+
 class Hologram:
     r"""
     Phase retrieval methods applied to holography.
@@ -257,12 +513,36 @@ class Hologram:
             Whether to store raw stats.
          - ``"blur_ij"`` : ``float``
             See :meth:`~slmsuite.holography.algorithms.FeedbackHologram.ijcam_to_knmslm()`.
+         - ``"fft_backend"`` : ``str``
+            Library used for FFTs. See :meth:`~slmsuite.holography.algorithms.Hologram.GS()`.
+         - ``"fft_workers"`` : ``int``
+            Number of CPU threads used for FFTs.
+            See :meth:`~slmsuite.holography.algorithms.Hologram.GS()`.
+         - ``"fft_unshifted"`` : ``bool``
+            Whether to optimize in the unshifted basis of the FFT.
+            See :meth:`~slmsuite.holography.algorithms.Hologram.GS()`.
+         - ``"stats_every"`` : ``int``
+            Record :attr:`stats` only every this many iterations. Defaults to ``1``.
+            See :meth:`~slmsuite.holography.algorithms.Hologram.optimize()`.
+         - ``"stats_history"`` : ``int`` OR ``None``
+            If not ``None``, only this many of the latest records are kept in :attr:`stats`.
+         - ``"tol_efficiency"``, ``"tol_uniformity"``, ``"tol_weights"``, ``"tol_phase"``,
+           ``"tol_window"``, ``"target_std_err"``, ``"timeout_s"``
+            Convergence criteria.
+            See :meth:`~slmsuite.holography.algorithms.Hologram.optimize()`.
+         - ``"spot_dft"`` : ``bool``
+            Whether to evaluate the far-field only at the spots with a direct
+            discrete Fourier transform.
+            See :meth:`~slmsuite.holography.algorithms.SpotHologram.GS()`.
          - Other user-defined flags.
 
     stats : dict
         Dictionary of useful statistics. data is stored in lists, with indices corresponding
-        to each iteration. Contains:
+        to each record. Contains:
 
+         - ``"iter"`` : ``list of int``
+            Iteration of each record. This is every iteration, unless the ``"stats_every"``
+            or ``"stats_history"`` flags are used.
          - ``"methods"`` : ``list of str``
             Method used for each iteration.
          - ``"flags"`` : ``dict of lists``
@@ -395,6 +675,9 @@ class Hologram:
         # Save the data type.
         self.dtype = dtype
 
+        # Far-field data is stored in the standard (centered) basis outside of GS().
+        self._fft_unshifted = False
+
         # Initialize and normalize near-field amplitude
         if amp is None:     # Uniform amplitude by default (scalar).
             self.amp = 1 / np.sqrt(np.prod(self.slm_shape))
@@ -438,7 +721,10 @@ class Hologram:
         self.method = ""
         if reset_flags:
             self.flags = {}
-        self.stats = {"method": [], "flags": {}, "stats": {}}
+        self.stats = {"iter": [], "method": [], "flags": {}, "stats": {}, "convergence": {}}
+        self._stats_pending = None
+        self._start_convergence()
+        self._unfixed_iterations = 0
 
         # Reset farfield storage.
         self.amp_ff = None
@@ -697,11 +983,36 @@ class Hologram:
         Caution
         ~~~~~~~
         Requesting ``stat_groups`` will slow the speed of optimization due to the
-        overhead of processing and saving statistics, especially in the case of
-        GPU-accelerated optimization where significant time cost is incurred by
-        moving these statistics to the CPU. This is especially apparent in the case
-        of fully-computational holography, where this effect can slow what is otherwise
-        a fully-GPU-contained loop by an order magnitude.
+        overhead of processing and saving statistics. To limit this overhead, statistics
+        computed on the GPU are kept on the device and moved to the CPU
+        asynchronously in one batch per record, arriving in :attr:`stats` one record
+        later (or at the end of optimization). Passing the ``stats_every`` keyword
+        additionally decimates statistics to every ``stats_every`` iterations, and
+        ``stats_history`` limits :attr:`stats` to a ring of the latest records, such
+        that monitoring can remain enabled during long optimizations.
+
+        Tip
+        ~~~
+        Optimization can terminate early once converged. The following keywords
+        set convergence criteria, any of which stops optimization:
+
+        - ``tol_efficiency``, ``tol_uniformity`` : Plateau in the efficiency or
+          uniformity of the last stat group, changing by at most this much over the
+          last ``tol_window`` records (default 3).
+        - ``tol_weights``, ``tol_phase`` : Relative change of :attr:`weights` or
+          root-mean-square change of :attr:`phase` (in radians) between records
+          at most this much for ``tol_window`` records.
+        - ``target_std_err`` : ``std_err`` of the last stat group at or below this value.
+        - ``timeout_s`` : Wall-clock budget of the optimization in seconds.
+
+        Criteria are evaluated on the records of :attr:`stats` (see ``stats_every``), and
+        so are evaluated without additional synchronization of the GPU, at the cost of
+        possibly one extra record of iterations. Stat-based criteria require
+        ``stat_groups``. The changes are stored in ``stats["convergence"]``,
+        and the reason for termination in ``stats["converged"]``.
+        Plateaus are evaluated over the kept records, so ``stats_history`` must be at
+        least ``tol_window + 1`` records (``tol_window`` for ``tol_weights`` and
+        ``tol_phase``); otherwise, a ``ValueError`` is raised.
 
         Tip
         ~~~
@@ -759,6 +1070,34 @@ class Hologram:
             Various weight keywords and values to pass depending on the weight method.
             These are passed into :attr:`flags`. See options documented in the constructor.
         """
+        # 0-1) Check and record method, parse flags.
+        self._optimize_setup(method, feedback, stat_groups, kwargs)
+
+        # 1.4) Print the flags if verbose.
+        if verbose > 1:
+            print("Optimizing with '{}' using the following method-specific flags:".format(self.method))
+            pprint.pprint({
+                key:value for (key, value) in self.flags.items()
+                if key in ALGORITHM_DEFAULTS[method]
+            })
+            print("", end="", flush=True)   # Prevent tqdm conflicts.
+
+        # 2) Prepare the iterations iterable.
+        iterations = range(maxiter)
+
+        # 2.1) Decide whether to use a tqdm progress bar. Don't use a bar for maxiter == 1.
+        if verbose and maxiter > 1:
+            iterations = tqdm(iterations)
+
+        # 3) Switch between optimization methods (currently only GS- or WGS-type is supported).
+        if "GS" in method:
+            self.GS(iterations, callback)
+
+    def _optimize_setup(self, method, feedback, stat_groups, kwargs):
+        """
+        Checks and records the ``method`` and parses the flags passed to :meth:`.optimize()`.
+        See :meth:`.optimize()` for parameter definitions.
+        """
         # 0) Check and record method.
         methods = list(ALGORITHM_DEFAULTS.keys())
         if not method in methods:
@@ -797,25 +1136,23 @@ class Hologram:
                 )
             self.flags["feedback"] = feedback
 
-        # 1.4) Print the flags if verbose.
-        if verbose > 1:
-            print("Optimizing with '{}' using the following method-specific flags:".format(self.method))
-            pprint.pprint({
-                key:value for (key, value) in self.flags.items()
-                if key in ALGORITHM_DEFAULTS[method]
-            })
-            print("", end="", flush=True)   # Prevent tqdm conflicts.
-
-        # 2) Prepare the iterations iterable.
-        iterations = range(maxiter)
-
-        # 2.1) Decide whether to use a tqdm progress bar. Don't use a bar for maxiter == 1.
-        if verbose and maxiter > 1:
-            iterations = tqdm(iterations)
+        # 1.4) Check that enough records are kept to evaluate plateau criteria.
+        history = self.flags.get("stats_history", None)
+        window = max(1, int(self.flags.get("tol_window", 3)))
+        for (flag, records) in [
+            ("tol_efficiency", window + 1),
+            ("tol_uniformity", window + 1),
+            ("tol_weights", window),
+            ("tol_phase", window),
+        ]:
+            if self.flags.get(flag, None) is not None and history is not None and int(history) < records:
+                raise ValueError(
+                    "algorithms.py: '{}' with tol_window={} requires stats_history "
+                    "of at least {} records; found {}.".format(flag, window, records, history)
+                )
 
-        # 3) Switch between optimization methods (currently only GS- or WGS-type is supported).
-        if "GS" in method:
-            self.GS(iterations, callback)
+        # Reset convergence criteria.
+        self._start_convergence()
 
     # Optimization methods (currently only GS- or WGS-type is supported).
     def GS(self, iterations, callback):
@@ -834,15 +1171,33 @@ class Hologram:
 
         Note
         ~~~~
-        FFTs are **not** in-place in this algorithm. In both non-:mod:`cupy` and
-        :mod:`cupy` implementations, :mod:`numpy.fft` does not support in-place
-        operations.  However, :mod:`scipy.fft` does in both. In the future, we may move to the scipy
-        implementation. However, neither :mod:`numpy` or :mod:`scipy` ``fftshift`` support
-        in-place movement (for obvious reasons). For even faster computation, algorithms should
-        consider **not shifting** the FFT result, and instead shifting measurement data / etc to
-        this unshifted basis. We might also implement `get_fft_plan
-        <https://docs.cupy.dev/en/stable/reference/generated/cupyx.scipy.fftpack.get_fft_plan.html>`_
-        for even faster FFTing.
+        FFTs are in-place in this algorithm. The transforms are planned once per
+        :attr:`shape` and act on a single preallocated complex buffer, which is reused
+        across calls to :meth:`.optimize()`. The backend is chosen with the
+        ``"fft_backend"`` flag (see :data:`FFT_BACKENDS`):
+
+         - ``"cupy"`` uses :mod:`cupyx.scipy.fft` with a cached `get_fft_plan
+           <https://docs.cupy.dev/en/stable/reference/generated/cupyx.scipy.fftpack.get_fft_plan.html>`_
+           (the default and only option when :mod:`cupy` is used),
+         - ``"pyfftw"`` uses :mod:`pyfftw` with ``FFTW_MEASURE`` plans
+           (the default for :mod:`numpy` if :mod:`pyfftw` is installed),
+         - ``"scipy"`` uses :mod:`scipy.fft` (the :mod:`numpy` default otherwise),
+         - ``"numpy"`` uses :mod:`numpy.fft`, which is not in-place.
+
+        The number of CPU threads used by ``"scipy"`` and ``"pyfftw"`` is set by
+        the ``"fft_workers"`` flag, defaulting to all cores.
+        The ``fftshift`` of the centered transform is folded into an in-place
+        sign modulation for even :attr:`shape`.
+
+        Tip
+        ~~~
+        If the ``"fft_unshifted"`` flag is ``True``, the loop runs without any shifting
+        whatsoever. Instead, far-field data (:attr:`target`, :attr:`weights`, MRAF noise
+        regions, measured images, and spot positions for :class:`SpotHologram`) are
+        permuted into the unshifted basis of the FFT once at the start of :meth:`GS()`
+        and permuted back once at the end. The near-field is stored such that the
+        result is identical to optimization in the standard basis. Note that
+        ``callback`` sees this data in the unshifted basis.
 
         Parameters
         ----------
@@ -851,60 +1206,170 @@ class Hologram:
         callback : callable OR None
             See :meth:`.optimize()`.
         """
-        # Proxy to initialize nearfield with the correct shape and correct (complex) type.
-        nearfield = cp.zeros(self.shape, dtype=type(1j * self.dtype(1)))
+        # Planned FFTs acting in-place on a preallocated buffer of the correct (complex) type.
+        fft = self._get_fft_engine()
+        nearfield = fft.buffer
 
-        # Precompute MRAF helper variables.
-        mraf_variables = self._mraf_helper_routines()
+        # Move far-field data to the unshifted basis of the FFT, if desired.
+        self._set_fft_basis(self.flags.get("fft_unshifted", False))
+        unshifted = self._fft_unshifted
 
-        # Helper variables for speeding up source phase and amplitude fixing.
-        (i0, i1, i2, i3) = toolbox.unpad(self.shape, self.slm_shape)
+        try:
+            # Precompute MRAF helper variables.
+            mraf_variables = self._mraf_helper_routines()
+
+            # Helper variables for speeding up source phase and amplitude fixing.
+            blocks = self._nearfield_blocks(unshifted)
 
-        for _ in iterations:
-            # 1) Nearfield -> farfield
-            # 1.1) Fix the relevant part of the nearfield amplitude to the source amplitude.
-            # Everything else is zero because power outside the SLM is assumed unreflected.
-            # This is optimized for when shape is much larger than slm_shape.
-            nearfield.fill(0)
-            nearfield[i0:i1, i2:i3] = self.amp * cp.exp(1j * self.phase)
+            for _ in iterations:
+                # 1) Nearfield -> farfield
+                # 1.1) Fix the relevant part of the nearfield amplitude to the source amplitude.
+                # Everything else is zero because power outside the SLM is assumed unreflected.
+                # This is optimized for when shape is much larger than slm_shape.
+                self._populate_nearfield(nearfield, blocks)
 
-            # 1.2) FFT to move to the farfield.
-            farfield = cp.fft.fftshift(cp.fft.fft2(cp.fft.fftshift(nearfield), norm="ortho"))
+                # 1.2) FFT to move to the farfield.
+                farfield = fft.fft2(shift=not unshifted)
 
-            # 2) Midloop: caching, prep
-            # 2.1) Before callback(), cleanup such that it can access updated amp_ff and images.
-            self._midloop_cleaning(farfield)
+                # 2) Midloop: caching, prep
+                # 2.1) Before callback(), cleanup such that it can access updated amp_ff and images.
+                self._midloop_cleaning(farfield)
 
-            # 2.2) Run step function if present and check termination conditions.
-            if callback is not None:
-                if callback(self):
+                # 2.2) Run step function if present and check termination conditions.
+                if callback is not None:
+                    if callback(self):
+                        break
+
+                if self._check_convergence():
                     break
 
-            # 2.3) Evaluate method-specific routines, stats, etc.
-            # If you want to add new functionality to GS, do so here to keep the main loop clean.
-            self._GS_farfield_routines(farfield, mraf_variables)
+                # 2.3) Evaluate method-specific routines, stats, etc.
+                # If you want to add new functionality to GS, do so here to keep the main loop clean.
+                self._GS_farfield_routines(farfield, mraf_variables)
 
-            # 3) Farfield -> nearfield.
-            nearfield = cp.fft.ifftshift(cp.fft.ifft2(cp.fft.ifftshift(farfield), norm="ortho"))
+                # 3) Farfield -> nearfield.
+                nearfield = fft.ifft2(shift=not unshifted)
 
-            # 3.1) Grab the phase from the complex nearfield.
-            # Use arctan2() directly instead of angle() for in-place operations (out=).
-            self.phase = cp.arctan2(
-                nearfield.imag[i0:i1, i2:i3],
-                nearfield.real[i0:i1, i2:i3],
-                out=self.phase,
-            )
+                # 3.1) Grab the phase from the complex nearfield.
+                # Use arctan2() directly instead of angle() for in-place operations (out=).
+                for (dst, src) in blocks:
+                    cp.arctan2(nearfield.imag[dst], nearfield.real[dst], out=self.phase[src])
 
-            # 3.2) Increment iteration.
-            self.iter += 1
+                # 3.2) Increment iteration.
+                self.iter += 1
+        finally:
+            # Return far-field data to the standard basis, even upon interruption.
+            self._set_fft_basis(False)
+
+            # Retrieve the last batch of statistics.
+            self._resolve_stats()
 
         # Update the final far-field
-        nearfield.fill(0)
-        nearfield[i0:i1, i2:i3] = self.amp * cp.exp(1j * self.phase)
-        farfield = cp.fft.fftshift(cp.fft.fft2(cp.fft.fftshift(nearfield), norm="ortho"))
+        self._populate_nearfield(nearfield, self._nearfield_blocks(False))
+        farfield = fft.fft2()
         self.amp_ff = cp.abs(farfield)
         self.phase_ff = cp.angle(farfield)
 
+    def _get_fft_engine(self):
+        """
+        Returns the planned FFT engine for :attr:`shape`, only (re)planning if the
+        shape, datatype, or the ``"fft_backend"`` and ``"fft_workers"`` flags changed.
+        """
+        dtype_complex = type(1j * self.dtype(1))
+        backend = self.flags.get("fft_backend", None)
+        workers = self.flags.get("fft_workers", None)
+
+        engine = getattr(self, "_fft_engine", None)
+        if engine is None or not engine.matches(self.shape, dtype_complex, backend, workers):
+            engine = self._fft_engine = _FFTEngine(self.shape, dtype_complex, backend, workers)
+
+        return engine
+
+    def _nearfield_blocks(self, unshifted=False):
+        """
+        Returns the list of ``(destination, source)`` slice pairs which map the
+        :attr:`slm_shape` near-field data into the padded near-field of shape :attr:`shape`.
+
+        In the standard basis, the SLM occupies a single centered block (see
+        :meth:`~slmsuite.holography.toolbox.unpad()`). In the unshifted basis, the SLM
+        is instead stored as ``fftshift()`` would place it, wrapping around the edges of
+        the padded near-field in up to four blocks.
+        """
+        (i0, i1, i2, i3) = toolbox.unpad(self.shape, self.slm_shape)
+
+        if not unshifted:
+            return [((slice(i0, i1), slice(i2, i3)), (slice(None), slice(None)))]
+
+        # For each axis, split the shifted region into the parts before and after wrapping.
+        segments = []
+        for (start, stop, n) in [(i0, i1, self.shape[0]), (i2, i3, self.shape[1])]:
+            length = stop - start
+            start = (start + n // 2) % n
+
+            if start + length <= n:
+                segments.append([(slice(start, start + length), slice(0, length))])
+            else:
+                split = n - start
+                segments.append([
+                    (slice(start, n), slice(0, split)),
+                    (slice(0, length - split), slice(split, length)),
+                ])
+
+        return [
+            ((dst_y, dst_x), (src_y, src_x))
+            for (dst_y, src_y) in segments[0]
+            for (dst_x, src_x) in segments[1]
+        ]
+
+    def _populate_nearfield(self, nearfield, blocks):
+        """
+        Fills ``nearfield`` with zeros, except for the SLM region (see
+        :meth:`._nearfield_blocks()`) which is set to
+        ``amp * exp(1j * phase)`` without allocating temporary arrays.
+        """
+        nearfield.fill(0)
+
+        for (dst, src) in blocks:
+            cp.cos(self.phase[src], out=nearfield.real[dst])
+            cp.sin(self.phase[src], out=nearfield.imag[dst])
+
+            if isinstance(self.amp, REAL_TYPES):
+                nearfield[dst] *= self.amp
+            else:
+                nearfield[dst] *= self.amp[src]
+
+    def _fft_basis_attributes(self):
+        """
+        Returns the names of the far-field attributes of shape :attr:`shape` which
+        are moved between bases by :meth:`._set_fft_basis()`.
+        """
+        return ["target", "weights", "amp_ff", "phase_ff"]
+
+    def _set_fft_basis(self, unshifted=False):
+        """
+        Moves far-field data between the standard (centered) ``"knm"`` basis and the
+        unshifted basis native to the FFT, where the zeroth order is at index ``(0, 0)``.
+        Arrays are permuted in-place, such that external references remain valid.
+
+        Parameters
+        ----------
+        unshifted : bool
+            Whether to move to the unshifted basis (``True``) or back to the
+            standard basis (``False``).
+        """
+        unshifted = bool(unshifted)
+        if unshifted == self._fft_unshifted:
+            return
+
+        shift = cp.fft.ifftshift if unshifted else cp.fft.fftshift
+
+        for attribute in self._fft_basis_attributes():
+            array = getattr(self, attribute, None)
+            if array is not None:
+                array[...] = shift(array)
+
+        self._fft_unshifted = unshifted
+
     def _mraf_helper_routines(self):
         # MRAF helper variables
         noise_region = cp.isnan(self.target)
@@ -960,46 +1425,67 @@ class Hologram:
 
     def _GS_farfield_routines(self, farfield, mraf_variables):
         # Update statistics
-        self.update_stats(self.flags["stat_groups"])
+        if self._stats_due():
+            self.update_stats(self.flags["stat_groups"])
 
         # Weight, if desired.
         if "WGS" in self.method:
             self._update_weights()
 
-            # Decide whether to fix phase.
-            if "Kim" in self.method:
-                was_not_fixed = not self.flags["fixed_phase"]
+        # Decide whether to fix phase.
+        self._update_fixed_phase(farfield)
+
+        # Fix amplitude, potentially also fixing the phase.
+        self._apply_farfield_constraint(farfield, mraf_variables)
+
+    def _update_fixed_phase(self, farfield):
+        """
+        Decides whether to fix the far-field phase, as mandated by ``"WGS-Kim"``,
+        and stores the phase of ``farfield`` in :attr:`phase_ff` if so.
+        """
+        # Count the contiguous iterations for which the phase was not fixed.
+        if self.flags.get("fixed_phase", False):
+            self._unfixed_iterations = 0
+        else:
+            self._unfixed_iterations += 1
+
+        if not "WGS" in self.method:
+            return
+
+        if "Kim" in self.method:
+            was_not_fixed = not self.flags["fixed_phase"]
 
-                # Enable based on efficiency.
-                if self.flags["fix_phase_efficiency"] is not None:
-                    stats = self.stats["stats"]
-                    groups = tuple(stats.keys())
+            # Enable based on efficiency.
+            if self.flags["fix_phase_efficiency"] is not None and was_not_fixed:
+                eff = self._latest_stat("efficiency")
 
-                    assert len(stats) > 0, "Must track statistics to fix phase based on efficiency!"
+                assert eff is not None, "Must track statistics to fix phase based on efficiency!"
 
-                    eff = stats[groups[-1]]["efficiency"][self.iter]
-                    if eff > self.flags["fix_phase_efficiency"]:
+                if eff > self.flags["fix_phase_efficiency"]:
+                    self.flags["fixed_phase"] = True
+
+            # Enable based on iterations.
+            if was_not_fixed:
+                if self.iter >= self.flags["fix_phase_iteration"] - 1:
+                    contiguous_falses = (
+                        self._unfixed_iterations >= self.flags["fix_phase_iteration"]
+                    )
+                    if contiguous_falses:
                         self.flags["fixed_phase"] = True
 
-                # Enable based on iterations.
-                if was_not_fixed:
-                    if self.iter >= self.flags["fix_phase_iteration"] - 1:
-                        previous = self.stats["flags"]["fixed_phase"]
-                        contiguous_falses = all(
-                            [not previous[-1-i] for i in range(self.flags["fix_phase_iteration"])]
-                        )
-                        if contiguous_falses:
-                            self.flags["fixed_phase"] = True
-
-                # Save the phase if we are going from unfixed to fixed.
-                if self.flags["fixed_phase"] and self.phase_ff is None or was_not_fixed:
-                    self.phase_ff = cp.angle(farfield)
-            else:
-                self.flags["fixed_phase"] = False
+            # Save the phase if we are going from unfixed to fixed.
+            if self.flags["fixed_phase"] and self.phase_ff is None or was_not_fixed:
+                self.phase_ff = cp.angle(farfield)
+        else:
+            self.flags["fixed_phase"] = False
 
+    def _apply_farfield_constraint(self, farfield, mraf_variables):
+        """
+        Sets the amplitude of ``farfield`` to :attr:`weights` in-place, potentially also
+        fixing the phase to :attr:`phase_ff` and attenuating MRAF noise regions.
+        """
         mraf_enabled = mraf_variables["mraf_enabled"]
 
-        # Fix amplitude, potentially also fixing the phase.
         if not mraf_enabled:
             if ("fixed_phase" in self.flags and self.flags["fixed_phase"]):
                 # Set the farfield to the stored phase and updated weights.
@@ -1115,16 +1601,17 @@ class Hologram:
         numpy.ndarray
             Current farfield computed by GS.
         """
-        nearfield = toolbox.pad(self.amp * cp.exp(1j * self.phase), self.shape)
-        farfield = cp.fft.fftshift(cp.fft.fft2(cp.fft.fftshift(nearfield), norm="ortho"))
+        fft = self._get_fft_engine()
+        self._populate_nearfield(fft.buffer, self._nearfield_blocks())
+        farfield = fft.fft2()
 
         if cp != np:
             return farfield.get()
-        return farfield
+        return farfield.copy()
 
     # Weighting functions.
     def _update_weights_generic(
-            self, weight_amp, feedback_amp, target_amp=None, mp=cp, nan_checks=True
+            self, weight_amp, feedback_amp, target_amp=None, mp=cp, nan_checks=True, axis=None
         ):
         """
         Helper function to process weight feedback according to the chosen weighting method.
@@ -1133,6 +1620,12 @@ class Hologram:
         ~~~~~~~
         ``weight_amp`` **is** modified in-place.
 
+        Note
+        ~~~~
+        For the common case of a non-uniform ``target_amp`` of the same shape with
+        ``nan_checks``, the allocation-free
+        :meth:`_update_weights_fused()` is used instead.
+
         Parameters
         ----------
         weight_amp : numpy.ndarray OR cupy.ndarray
@@ -1150,6 +1643,10 @@ class Hologram:
             for either. Defaults to :mod:`cupy`.
         nan_checks : bool
             Whether to enable checks to avoid division by zero or ``nan`` infiltration.
+        axis : int OR tuple of int OR None
+            Axes over which normalization is applied. If ``None``, normalizes over the
+            full array. Passing the last two axes ``(-2, -1)`` treats a stack of arrays
+            as independent holograms (see :class:`HologramBatch`).
 
         Returns
         -------
@@ -1159,12 +1656,25 @@ class Hologram:
         assert self.method[:4] == "WGS-", "For now, assume weighting is for WGS."
         method = self.method[4:]
 
+        # Use the allocation-free path where possible.
+        if (
+            nan_checks and axis is None and mp == cp and target_amp is not None
+            and any(name in method.lower() for name in ["leonardo", "kim", "nogrette"])
+            and all(
+                isinstance(array, cp.ndarray) and array.shape == weight_amp.shape
+                for array in [weight_amp, feedback_amp, target_amp]
+            )
+            and weight_amp.dtype == self.dtype and target_amp.dtype == self.dtype
+            and feedback_amp.dtype.kind == "f"
+        ):
+            return self._update_weights_fused(weight_amp, feedback_amp, target_amp)
+
         # Parse feedback_amp
         if target_amp is None:  # Uniform
             feedback_corrected = mp.array(feedback_amp, copy=True, dtype=self.dtype)
         else:  # Non-uniform
             feedback_corrected = mp.array(feedback_amp, copy=True, dtype=self.dtype)
-            feedback_corrected *= 1 / Hologram._norm(feedback_corrected, mp=mp)
+            feedback_corrected *= 1 / Hologram._norm(feedback_corrected, mp=mp, axis=axis)
 
             mp.divide(feedback_corrected, mp.array(target_amp, copy=False), out=feedback_corrected)
 
@@ -1180,7 +1690,9 @@ class Hologram:
             mp.power(feedback_corrected, -self.flags["feedback_exponent"], out=feedback_corrected)
         elif "nogrette" in method.lower():
             # Taylor expand 1/(1-g(1-x)) -> 1 + g(1-x) + (g(1-x))^2 ~ 1 + g(1-x)
-            feedback_corrected *= -(1 / mp.nanmean(feedback_corrected))
+            feedback_corrected *= -(
+                1 / mp.nanmean(feedback_corrected, axis=axis, keepdims=axis is not None)
+            )
             feedback_corrected += 1
             feedback_corrected *= -self.flags["feedback_factor"]
             feedback_corrected += 1
@@ -1203,11 +1715,107 @@ class Hologram:
             weight_amp[weight_amp == np.inf] = 1
 
         # Normalize amp, as methods may have broken conservation.
-        norm = Hologram._norm(weight_amp, mp=mp)
+        norm = Hologram._norm(weight_amp, mp=mp, axis=axis)
         weight_amp *= 1 / norm
 
         return weight_amp
 
+    def _get_weights_workspace(self, shape):
+        """
+        Returns the preallocated ``(values, mask)`` workspace of the given ``shape``
+        used by :meth:`_update_weights_fused()` on the CPU, only allocating upon the
+        first call or if the shape changed.
+        """
+        workspace = getattr(self, "_weights_workspace", None)
+
+        if workspace is None or workspace[0].shape != tuple(shape):
+            workspace = self._weights_workspace = (
+                np.empty(shape, dtype=self.dtype),
+                np.empty(shape, dtype=bool)
+            )
+
+        return workspace
+
+    def _update_weights_fused(self, weight_amp, feedback_amp, target_amp):
+        """
+        Allocation-free counterpart to :meth:`_update_weights_generic()` for a
+        non-uniform ``target_amp`` with ``nan_checks``, returning the same result.
+
+        Instead of copying ``feedback_amp`` and building masks for every check, the
+        correction for each WGS method is applied to ``weight_amp`` in a single fused
+        pass, preceded and followed by normalizing reductions. On the GPU, this
+        pass is a :mod:`cupy` ``ElementwiseKernel``. On the CPU, in-place :mod:`numpy`
+        operations act on a preallocated workspace (see :meth:`_get_weights_workspace()`).
+
+        Parameters
+        ----------
+        weight_amp, feedback_amp, target_amp : numpy.ndarray OR cupy.ndarray
+            See :meth:`_update_weights_generic()`. Must share the same shape.
+            ``weight_amp`` and ``target_amp`` must be of type :attr:`dtype`, while
+            ``feedback_amp`` can be any real floating type.
+
+        Returns
+        -------
+        numpy.ndarray OR cupy.ndarray
+            The updated ``weight_amp``.
+        """
+        method = self.method[4:].lower()
+        nogrette = "nogrette" in method
+        exponent = self.dtype(0 if nogrette else self.flags["feedback_exponent"])
+        factor = self.dtype(self.flags["feedback_factor"] if nogrette else 0)
+        wmax = self.dtype(np.finfo(self.dtype).max)
+
+        # GPU: Reductions and weighting stay on the device without synchronizing.
+        if cp != np:
+            scale = (1 / cp.sqrt(_nansumsq(feedback_amp))).astype(self.dtype)
+
+            if nogrette:
+                mean = _wgs_ratio_sum_kernel(feedback_amp, target_amp, scale) / target_amp.size
+            else:
+                mean = scale
+
+            _wgs_weights_kernel(
+                feedback_amp, target_amp, scale, exponent, factor, mean, wmax, nogrette,
+                weight_amp
+            )
+
+            weight_amp *= 1 / cp.sqrt(_nansumsq(weight_amp))
+
+            return weight_amp
+
+        # CPU: Compute the correction in the workspace, then apply it.
+        (values, mask) = self._get_weights_workspace(weight_amp.shape)
+
+        with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+            scale = self.dtype(1 / np.sqrt(_nansumsq(feedback_amp)))
+
+            np.multiply(feedback_amp, scale, out=values)
+            np.divide(values, target_amp, out=values)
+
+            np.less(values, np.inf, out=mask)
+            np.copyto(values, 1, where=np.logical_not(mask, out=mask))
+
+            if nogrette:
+                values *= -(1 / values.mean())
+                values += 1
+                values *= -factor
+                values += 1
+                np.reciprocal(values, out=values)
+            else:
+                np.power(values, -exponent, out=values)
+
+            np.copyto(values, 1, where=np.equal(values, np.inf, out=mask))
+
+            weight_amp *= values
+
+            np.copyto(weight_amp, .0001, where=np.isnan(weight_amp, out=mask))
+            np.copyto(weight_amp, wmax, where=np.equal(weight_amp, np.inf, out=mask))
+            np.copyto(weight_amp, -wmax, where=np.equal(weight_amp, -np.inf, out=mask))
+
+            weight_amp *= 1 / np.sqrt(_nansumsq(weight_amp))
+
+        return weight_amp
+
     def _update_weights(self):
         """
         Change :attr:`weights` to optimize towards the :attr:`target` using feedback from
@@ -1252,6 +1860,13 @@ class Hologram:
             Passes the ``"raw_stats"`` flag. If ``True``, stores the
             raw feedback and raw feedback-target ratio for each pixel or spot instead of
             only the derived statistics.
+
+        Returns
+        -------
+        dict
+            Derived statistics. If ``mp`` is :mod:`cupy`, these are zero-dimensional
+            arrays kept on the GPU (see :meth:`_update_stats_dictionary()`). Otherwise,
+            these are floats.
         """
         # Downgrade to numpy if necessary
         if mp == np and (hasattr(feedback_amp, "get") or hasattr(target_amp, "get")):
@@ -1271,7 +1886,7 @@ class Hologram:
         target_pwr = mp.square(target_amp)
 
         if total is not None:
-            efficiency = float(mp.sum(feedback_pwr)) / total
+            efficiency = mp.sum(feedback_pwr).astype(np.float64) / total
 
         # Normalize.
         feedback_pwr_sum = mp.sum(feedback_pwr)
@@ -1284,7 +1899,7 @@ class Hologram:
 
         if total is None:
             # Efficiency overlap integral.
-            efficiency = np.square(float(mp.sum(mp.multiply(target_amp, feedback_amp))))
+            efficiency = mp.square(mp.sum(mp.multiply(target_amp, feedback_amp)).astype(np.float64))
             if efficiency_compensation:
                 feedback_pwr *= 1 / efficiency
 
@@ -1298,20 +1913,25 @@ class Hologram:
         pwr_err = target_pwr_masked - feedback_pwr_masked
 
         # Compute the remaining stats.
-        rmin = float(mp.amin(ratio_pwr))
-        rmax = float(mp.amax(ratio_pwr))
+        rmin = mp.amin(ratio_pwr).astype(np.float64)
+        rmax = mp.amax(ratio_pwr).astype(np.float64)
         uniformity = 1 - (rmax - rmin) / (rmax + rmin)
 
-        pkpk_err = pwr_err.size * float(mp.amax(pwr_err) - mp.amin(pwr_err))
-        std_err = pwr_err.size * float(mp.std(pwr_err))
+        pkpk_err = pwr_err.size * (mp.amax(pwr_err) - mp.amin(pwr_err)).astype(np.float64)
+        std_err = pwr_err.size * mp.std(pwr_err).astype(np.float64)
 
         final_stats = {
-            "efficiency": float(efficiency),
-            "uniformity": float(uniformity),
-            "pkpk_err": float(pkpk_err),
-            "std_err": float(std_err),
+            "efficiency": efficiency,
+            "uniformity": uniformity,
+            "pkpk_err": pkpk_err,
+            "std_err": std_err,
         }
 
+        # Keep stats on the GPU, such that they can be transferred lazily in one batch.
+        for key in final_stats.keys():
+            if mp == np or not hasattr(final_stats[key], "get"):
+                final_stats[key] = float(final_stats[key])
+
         if raw:
             ratio_pwr_full = np.full_like(target_pwr, np.nan)
 
@@ -1338,85 +1958,290 @@ class Hologram:
                 raw="raw_stats" in self.flags and self.flags["raw_stats"]
             )
 
+    def _stats_due(self):
+        """
+        Whether statistics should be recorded on this iteration, according to the
+        ``"stats_every"`` flag (see :meth:`.optimize()`).
+        """
+        return self.iter % max(1, int(self.flags.get("stats_every", 1))) == 0
+
     def _update_stats_dictionary(self, stats):
         """
         Helper function to manage additions to the :attr:`stats`.
 
+        Statistics computed on the GPU (zero-dimensional :mod:`cupy` arrays, see
+        :meth:`_calculate_stats()`) are not transferred immediately, which would
+        synchronize the device for each value. Instead, all such values are stacked
+        and copied to the host asynchronously in a single batch, and the record is
+        only added to :attr:`stats` when the next record is made or when
+        :meth:`_resolve_stats()` is called (e.g. at the end of :meth:`.optimize()`).
+
         Parameters
         ----------
         stats : dict of dicts
             Dictionary of groups, each group containing a dictionary of stats.
         """
-        # Update methods
-        M = len(self.stats["method"])
-        diff = self.iter + 1 - M
-        if diff > 0:  # Extend methods
-            self.stats["method"].extend(["" for _ in range(diff)])
-            M = self.iter + 1
-        self.stats["method"][self.iter] = self.method  # Update method
-
-        # Update flags
-        flaglist = set(self.flags.keys()).union(set(self.stats["flags"].keys()))
-        for flag in flaglist:
-            # Extend flag
+        # Finish the previous batch, which has been transferring in the meantime.
+        self._resolve_stats()
+
+        record = (self.iter, self.method, dict(self.flags), stats, self._calculate_convergence())
+
+        # Find the values which are still on the GPU.
+        keys = [
+            (values, key)
+            for values in list(stats.values()) + [record[4]]
+            for key in values.keys()
+            if hasattr(values[key], "get") and values[key].ndim == 0
+        ]
+
+        if len(keys) == 0:
+            self._append_stats_record(*record)
+            return
+
+        # Start the asynchronous transfer of all values in one batch.
+        values = cp.stack([values[key] for (values, key) in keys]).astype(np.float64)
+        host = cupyx.empty_pinned(values.shape, dtype=values.dtype)
+        stream = cp.cuda.get_current_stream()
+        cp.cuda.runtime.memcpyAsync(
+            host.ctypes.data, values.data.ptr, values.nbytes,
+            cp.cuda.runtime.memcpyDeviceToHost, stream.ptr
+        )
+
+        self._stats_pending = (record, keys, values, host, stream.record())
+
+    def _resolve_stats(self):
+        """
+        Waits for the pending batch of statistics (if any) to arrive on the host, and adds
+        the corresponding record to :attr:`stats`. See :meth:`_update_stats_dictionary()`.
+        """
+        pending = getattr(self, "_stats_pending", None)
+        if pending is None:
+            return
+
+        (record, keys, _, host, event) = pending
+        self._stats_pending = None
+
+        event.synchronize()
+
+        for ((values, key), value) in zip(keys, host):
+            values[key] = float(value)
+
+        self._append_stats_record(*record)
+
+    def _append_stats_record(self, iteration, method, flags, stats, convergence={}):
+        """
+        Adds the statistics of a single iteration to the lists in :attr:`stats`.
+        A record of the same iteration as the last record replaces it.
+        If the ``"stats_history"`` flag is set, only this many of the latest records are kept.
+        Afterward, convergence is evaluated (see :meth:`_evaluate_convergence()`).
+        """
+        if len(self.stats["iter"]) > 0 and self.stats["iter"][-1] == iteration:
+            self._drop_stats_records(slice(-1, None))
+
+        M = len(self.stats["iter"])
+
+        # Update iteration and method.
+        self.stats["iter"].append(iteration)
+        self.stats["method"].append(method)
+
+        # Update flags. Flags which are undefined for this record are stored as nan.
+        for flag in set(flags.keys()).union(set(self.stats["flags"].keys())):
             if not flag in self.stats["flags"]:
                 self.stats["flags"][flag] = [np.nan for _ in range(M)]
-            else:
-                diff = self.iter + 1 - len(self.stats["flags"][flag])
-                if diff > 0:
-                    self.stats["flags"][flag].extend([np.nan for _ in range(diff)])
 
-            # Update flag
-            if flag in self.flags:
-                self.stats["flags"][flag][self.iter] = self.flags[flag]
+            self.stats["flags"][flag].append(flags[flag] if flag in flags else np.nan)
 
-        # Update stats
+        # Update stats. Each group tracks every stat, which is nan if undefined.
         grouplist = set(stats.keys()).union(set(self.stats["stats"].keys()))
-        if len(grouplist) > 0:
-            statlists = [set(stats[group].keys()) for group in stats.keys()]
-            if len(self.stats["stats"].keys()) > 0:
-                key = next(iter(self.stats["stats"]))
-                statlists.append(set(self.stats["stats"][key].keys()))
-            statlist = set.union(*statlists)
-
-            for group in grouplist:
-                # Check this group
-                if not group in self.stats["stats"]:
-                    self.stats["stats"][group] = {}
-
-                if len(statlist) > 0:
-                    for stat in statlist:
-                        # Extend stat
-                        if not stat in self.stats["stats"][group]:
-                            self.stats["stats"][group][stat] = [
-                                np.nan for _ in range(M)
-                            ]
-                        else:
-                            diff = self.iter + 1 - len(self.stats["stats"][group][stat])
-                            if diff > 0:
-                                self.stats["stats"][group][stat].extend(
-                                    [np.nan for _ in range(diff)]
-                                )
-
-                        # Update stat
-                        if group in stats.keys():
-                            if stat in stats[group].keys():
-                                self.stats["stats"][group][stat][self.iter] = stats[group][
-                                    stat
-                                ]
+        statlist = set()
+        for group in self.stats["stats"].values():
+            statlist.update(group.keys())
+        for group in stats.values():
+            statlist.update(group.keys())
+
+        for group in grouplist:
+            if not group in self.stats["stats"]:
+                self.stats["stats"][group] = {}
+
+            for stat in statlist:
+                if not stat in self.stats["stats"][group]:
+                    self.stats["stats"][group][stat] = [np.nan for _ in range(M)]
+
+                if group in stats and stat in stats[group]:
+                    value = stats[group][stat]
+                    if hasattr(value, "get"):
+                        value = value.get()
+                    self.stats["stats"][group][stat].append(value)
+                else:
+                    self.stats["stats"][group][stat].append(np.nan)
 
-    def update_stats(self, stat_groups=[]):
+        # Update convergence metrics.
+        if not "convergence" in self.stats:
+            self.stats["convergence"] = {}
+        for metric in set(convergence.keys()).union(set(self.stats["convergence"].keys())):
+            if not metric in self.stats["convergence"]:
+                self.stats["convergence"][metric] = [np.nan for _ in range(M)]
+
+            self.stats["convergence"][metric].append(
+                float(convergence[metric]) if metric in convergence else np.nan
+            )
+
+        # Trim the history to a ring of the latest records.
+        history = flags.get("stats_history", None)
+        if history is not None and len(self.stats["iter"]) > history:
+            excess = len(self.stats["iter"]) - int(history)
+            self._drop_stats_records(slice(None, excess))
+
+        self._evaluate_convergence(flags)
+
+    def _drop_stats_records(self, records):
+        """Deletes the ``records`` (a slice) from every list in :attr:`stats`."""
+        del self.stats["iter"][records]
+        del self.stats["method"][records]
+        for values in self.stats["flags"].values():
+            del values[records]
+        for group in self.stats["stats"].values():
+            for values in group.values():
+                del values[records]
+        for values in self.stats.get("convergence", {}).values():
+            del values[records]
+
+    def _calculate_convergence(self):
         """
-        Calculate statistics corresponding to the desired ``stat_groups``.
+        Computes the change in :attr:`weights` (relative norm) and :attr:`phase`
+        (root-mean-square, ignoring a global offset) since the previous record,
+        for the ``"tol_weights"`` and ``"tol_phase"`` flags (see :meth:`.optimize()`).
+        Values are kept on the GPU, if applicable.
 
-        Parameters
-        ----------
-        stat_groups : list of str
-            Which groups or types of statistics to analyze.
+        Returns
+        -------
+        dict
+            Metrics ``"delta_weights"`` and ``"delta_phase"``, if requested and
+            a previous record exists.
         """
-        stats = {}
+        convergence = {}
+        previous = self._convergence_previous
+
+        for (flag, metric, array) in [
+            ("tol_weights", "delta_weights", self.weights),
+            ("tol_phase", "delta_phase", self.phase),
+        ]:
+            if self.flags.get(flag, None) is None or array is None:
+                continue
+
+            if metric in previous and previous[metric].shape == array.shape:
+                if metric == "delta_weights":
+                    convergence[metric] = (
+                        Hologram._norm(array - previous[metric]) / Hologram._norm(previous[metric])
+                    )
+                else:
+                    difference = array - previous[metric]
+                    difference -= cp.angle(cp.mean(cp.exp(1j * difference)))
+                    difference = cp.mod(difference + np.pi, 2 * np.pi) - np.pi
+                    convergence[metric] = cp.sqrt(cp.mean(cp.square(difference)))
 
-        self._calculate_stats_computational(stats, stat_groups)
+                previous[metric][...] = array
+            else:
+                previous[metric] = array.copy()
+
+        return convergence
+
+    def _evaluate_convergence(self, flags):
+        """
+        Checks the convergence criteria set in ``flags`` against the latest records in
+        :attr:`stats`, storing the reason for convergence (if any) in
+        ``stats["converged"]``. See :meth:`.optimize()`.
+        """
+        window = max(1, int(flags.get("tol_window", 3)))
+        reasons = []
+
+        # Plateaus and targets of the stats of the last stat group.
+        if len(self.stats["stats"]) > 0:
+            group = self.stats["stats"][tuple(self.stats["stats"].keys())[-1]]
+
+            for stat in ["efficiency", "uniformity"]:
+                tol = flags.get("tol_" + stat, None)
+                values = group[stat][-(window+1):]
+
+                if tol is not None and len(values) == window + 1 and not np.any(np.isnan(values)):
+                    if np.amax(values) - np.amin(values) <= tol:
+                        reasons.append("{} changed by at most {} over {} records".format(stat, tol, window))
+
+            target = flags.get("target_std_err", None)
+            if target is not None and len(group["std_err"]) > 0 and group["std_err"][-1] <= target:
+                reasons.append("std_err reached {}".format(target))
+
+        # Changes in weights and phase.
+        for metric in ["weights", "phase"]:
+            tol = flags.get("tol_" + metric, None)
+            values = self.stats["convergence"].get("delta_" + metric, [])[-window:]
+
+            if tol is not None and len(values) == window and np.all(np.array(values) <= tol):
+                reasons.append("{} changed by at most {} over {} records".format(metric, tol, window))
+
+        if len(reasons) > 0 and not self.stats.get("converged", ""):
+            self.stats["converged"] = "; ".join(reasons)
+
+    def _start_convergence(self):
+        """
+        Resets the convergence criteria at the start of :meth:`.optimize()`.
+        """
+        self.stats["converged"] = ""
+        self._convergence_previous = {}
+        self._convergence_start = time.perf_counter()
+
+    def _check_convergence(self):
+        """
+        Whether optimization should terminate, either due to convergence or due
+        to the wall-clock budget of the ``"timeout_s"`` flag.
+        This check does not synchronize the GPU.
+        """
+        if self.stats.get("converged", ""):
+            return True
+
+        timeout = self.flags.get("timeout_s", None)
+        if timeout is not None and time.perf_counter() - self._convergence_start > timeout:
+            self.stats["converged"] = "timeout of {} s".format(timeout)
+            return True
+
+        return False
+
+    def _latest_stat(self, stat):
+        """
+        Returns the most recent value of the given ``stat`` from the last stat group,
+        or ``None`` if no statistics have been recorded.
+
+        To avoid synchronizing the GPU on every iteration, a pending batch of statistics
+        (see :meth:`_update_stats_dictionary()`) is only waited for if no record has
+        been resolved yet. Otherwise, it is used only if its transfer already finished,
+        such that the returned value may lag by one record.
+        """
+        pending = getattr(self, "_stats_pending", None)
+        if pending is not None and (len(self.stats["iter"]) == 0 or pending[4].done):
+            self._resolve_stats()
+
+        stats = self.stats["stats"]
+        if len(stats) == 0:
+            return None
+
+        values = stats[tuple(stats.keys())[-1]][stat]
+        if len(values) == 0:
+            return None
+
+        return values[-1]
+
+    def update_stats(self, stat_groups=[]):
+        """
+        Calculate statistics corresponding to the desired ``stat_groups``.
+
+        Parameters
+        ----------
+        stat_groups : list of str
+            Which groups or types of statistics to analyze.
+        """
+        stats = {}
+
+        self._calculate_stats_computational(stats, stat_groups)
 
         self._update_stats_dictionary(stats)
 
@@ -1458,6 +2283,7 @@ class Hologram:
             to_save = {}
 
         # Save stats.
+        self._resolve_stats()
         to_save["stats"] = self.stats
 
         write_h5(file_path, to_save)
@@ -1499,8 +2325,13 @@ class Hologram:
                         setattr(self, key, from_save[key])
 
         # Overwrite stats
+        self._stats_pending = None
         self.stats = from_save["stats"]
 
+        # Older stats were recorded on every iteration.
+        if not "iter" in self.stats:
+            self.stats["iter"] = list(range(len(self.stats["method"])))
+
     # Visualization helper functions.
     @staticmethod
     def _compute_limits(source, epsilon=0, limit_padding=0.1):
@@ -1877,6 +2708,7 @@ class Hologram:
             If ``None``, the default y limits are used.
         """
         if stats_dict is None:
+            self._resolve_stats()
             stats_dict = self.stats
 
         _, ax = plt.subplots(1, 1, figsize=(6,4))
@@ -1885,7 +2717,11 @@ class Hologram:
         markers = ["o", "o", "s", "D"]
         legendstats = ["inefficiency", "nonuniformity", "pkpk_err", "std_err"]
 
-        niter = np.arange(0, len(stats_dict["method"]))
+        # Iterations at which stats were recorded (every iteration for older stats).
+        if "iter" in stats_dict:
+            niter = np.array(stats_dict["iter"], dtype=float)
+        else:
+            niter = np.arange(0, len(stats_dict["method"]))
 
         if stat_groups is None or len(stat_groups) == 0:
             stat_keys = list(stats_dict["stats"].keys())
@@ -1939,10 +2775,12 @@ class Hologram:
                 [stats_dict["flags"]["fixed_phase"][0]],
                 stats_dict["flags"]["fixed_phase"]
             ))
-            niter_fp = np.arange(0, len(stats_dict["method"]) + 1)
+            niter_fp = np.concatenate((
+                [niter[0] - .5], (niter[:-1] + niter[1:]) / 2, [niter[-1] + .5]
+            ))
 
             ylim = ax.get_ylim()
-            poly = ax.fill_between(niter_fp - .5, ylim[0], ylim[1], where=fp,
+            poly = ax.fill_between(niter_fp, ylim[0], ylim[1], where=fp,
                                    alpha=0.1, color='b', zorder=-np.inf)
             ax.set_ylim(ylim)
 
@@ -1952,7 +2790,8 @@ class Hologram:
         # Make the color/linestyle legend.
         plt.legend(dummylines_modes + dummylines_keys, stat_keys + legendstats, loc="lower left")
 
-        ax.set_xlim([-.75, len(stats_dict["method"]) - .25])
+        if len(niter) > 0:
+            ax.set_xlim([niter[0] - .75, niter[-1] + .75])
 
         plt.show()
 
@@ -2014,7 +2853,7 @@ class Hologram:
             return mempool.get_limit()
 
     @staticmethod
-    def _norm(matrix, mp=cp):
+    def _norm(matrix, mp=cp, axis=None):
         r"""
         Computes the root of the sum of squares of the given ``matrix``. Implements:
 
@@ -2027,16 +2866,20 @@ class Hologram:
         mp : module
             This function is used by both :mod:`cupy` and :mod:`numpy`, so we have the option
             for either. Defaults to :mod:`cupy`.
+        axis : int OR tuple of int OR None
+            Axes to sum over. If not ``None``, these axes are kept with length one
+            such that the result broadcasts against ``matrix``.
 
         Returns
         -------
-        float
+        float OR numpy.ndarray OR cupy.ndarray
             The result.
         """
+        keepdims = axis is not None
         if mp.iscomplexobj(matrix):
-            return mp.sqrt(mp.nansum(mp.square(mp.abs(matrix))))
+            return mp.sqrt(mp.nansum(mp.square(mp.abs(matrix)), axis=axis, keepdims=keepdims))
         else:
-            return mp.sqrt(mp.nansum(mp.square(matrix)))
+            return mp.sqrt(mp.nansum(mp.square(matrix), axis=axis, keepdims=keepdims))
 
 
 class FeedbackHologram(Hologram):
@@ -2270,13 +3113,17 @@ class FeedbackHologram(Hologram):
             ``"knm"`` basis if :attr:`img_knm` is not needed.
         """
         if self.img_ij is None:
-            self.cameraslm.slm.write(self.extract_phase(), settle=True)
-            self.cameraslm.cam.flush()
-            self.img_ij = np.array(self.cameraslm.cam.get_image(), copy=False, dtype=self.dtype)
+            # Hand the phase to the SLM without leaving the GPU (see SLM.write()).
+            # This is equivalent to extract_phase(), which copies to the host.
+            # The frame is paired with the write (see CameraSLM.write_and_get_image()).
+            img = self.cameraslm.write_and_get_image(self.phase + np.pi)
+            self.img_ij = np.array(img, copy=False, dtype=self.dtype)
 
             if basis == "knm":  # Compute the knm basis image.
                 self.img_knm = self.ijcam_to_knmslm(self.img_ij, out=self.img_knm)
                 cp.sqrt(self.img_knm, out=self.img_knm)
+                if self._fft_unshifted:
+                    self.img_knm[...] = cp.fft.ifftshift(self.img_knm)
             else:  # The old image is outdated, erase it. FUTURE: memory concerns?
                 self.img_knm = None
 
@@ -2287,6 +3134,15 @@ class FeedbackHologram(Hologram):
             if self.img_knm is None:
                 self.img_knm = self.ijcam_to_knmslm(np.square(self.img_ij), out=self.img_knm)
                 cp.sqrt(self.img_knm, out=self.img_knm)
+                if self._fft_unshifted:
+                    self.img_knm[...] = cp.fft.ifftshift(self.img_knm)
+
+    def _fft_basis_attributes(self):
+        """
+        Extends :meth:`Hologram._fft_basis_attributes()` with the
+        ``"knm"`` basis image :attr:`img_knm`.
+        """
+        return super()._fft_basis_attributes() + ["img_knm"]
 
     def refine_offset(self, img, basis="kxy"):
         """
@@ -2696,6 +3552,12 @@ class SpotHologram(FeedbackHologram):
         # Set the external amp variable to be perfect by default.
         self.external_spot_amp = np.copy(self.spot_amp)
 
+        # Direct DFT variables, only populated during optimization with the "spot_dft" flag.
+        self._spot_dft = None
+
+        # Cached pixel patches around each spot, only populated for subpixel targets.
+        self._subpixel_patches = None
+
         # Decide the null_radius (if necessary)
         if self.null_knm is not None:
             if self.null_radius_knm is None:
@@ -2902,28 +3764,23 @@ class SpotHologram(FeedbackHologram):
                 self.spot_knm_rounded[1, :], self.spot_knm_rounded[0, :]
             ] = self.spot_amp
         else:   # Otherwise, make a target consisting of imprinted gaussians (subpixel enabled)
-            grid = np.meshgrid(np.arange(self.target.shape[1]), np.arange(self.target.shape[0]))
-
-            for spot_idx in range(len(self)):
-                toolbox.imprint(
-                    matrix=self.target,
-                    window=(
-                        self.spot_knm[0, spot_idx], 4*np.ceil(self.subpixel_beamradius_knm)+1,
-                        self.spot_knm[1, spot_idx], 4*np.ceil(self.subpixel_beamradius_knm)+1
-                    ),
-                    function=gaussian2d,
-                    grid=grid,
-                    imprint_operation="replace",
-                    centered=True,
-                    circular=True,
-                    clip=True,                      # End of imprint parameters
-                    x0=self.spot_knm[0, spot_idx],  # Start of gaussian2d parameters
-                    y0=self.spot_knm[1, spot_idx],
-                    a=self.spot_amp[spot_idx],
-                    c=0,
-                    wx=self.subpixel_beamradius_knm,
-                    wy=self.subpixel_beamradius_knm,
-                )
+            patches = self._get_subpixel_patches()
+
+            # Evaluate all Gaussians at once on their local patches, then sum
+            # overlapping contributions into the patch pixels of the target.
+            values = gaussian2d(
+                (patches["x"], patches["y"]),
+                x0=patches["x0"],
+                y0=patches["y0"],
+                a=patches["a"],
+                c=0,
+                wx=self.subpixel_beamradius_knm,
+                wy=self.subpixel_beamradius_knm,
+            )
+
+            self.target.ravel()[patches["pixels"]] = cp.bincount(
+                patches["inverse"], weights=values, minlength=len(patches["pixels"])
+            )
 
         self.target /= Hologram._norm(self.target)
 
@@ -3056,6 +3913,249 @@ class SpotHologram(FeedbackHologram):
 
         return shift_vectors
 
+    def GS(self, iterations, callback):
+        r"""
+        Extends :meth:`Hologram.GS()` with an optional direct discrete Fourier transform
+        (DFT) engine, enabled by the ``"spot_dft"`` flag.
+
+        Spot arrays only need the far-field at the :math:`K` spots, yet the FFT computes
+        (and pads the near-field to) the full :attr:`shape`. With ``"spot_dft"``, the
+        far-field is instead evaluated at only the spots as a matrix product of the
+        unpadded :attr:`slm_shape` near-field with precomputed per-spot phase ramps,
+        and the adjoint of this product projects the constrained spot amplitudes back
+        to the near-field. The ramps are separable, so memory scales as
+        :math:`K(h + w)` rather than with the padded :attr:`shape`, and compute scales
+        as :math:`Khw`. This is faster than the FFT for few spots or heavy padding.
+
+        The ramps are evaluated at :attr:`spot_knm_rounded`, so the result is
+        equivalent to the FFT loop (with zero target outside the spots). With ``subpixel``
+        enabled, this is :attr:`spot_knm` itself, and spots are placed at exactly
+        their subpixel positions instead of being approximated by Gaussian targets.
+
+        Note
+        ~~~~
+        As there is no far-field image, ``"computational"`` feedback is equivalent to
+        ``"computational_spot"``, and the ``"computational"`` and ``"experimental"``
+        options are not supported for feedback or stat groups. Spot statistics use the
+        value at each spot rather than an integrated window, and efficiency is
+        relative to the peak power of a single spot focusing all light. MRAF noise
+        and null regions have no effect. The spot weights are read from and written back
+        to :attr:`weights`, and :attr:`amp_ff` and :attr:`phase_ff` are set to
+        ``None`` after optimization; use :meth:`extract_farfield()` to compute the full
+        far-field.
+
+        Parameters
+        ----------
+        iterations : iterable
+            Number of loop iterations to run. Is an iterable to pass a :mod:`tqdm` iterable.
+        callback : callable OR None
+            See :meth:`.optimize()`.
+        """
+        if not self.flags.get("spot_dft", False):
+            super().GS(iterations, callback)
+            return
+
+        # Check that the requested feedback does not need the full far-field.
+        unsupported = ["computational", "experimental"]
+        if self.flags["feedback"] == "experimental":
+            raise ValueError(
+                "algorithms.py: feedback 'experimental' is not supported with the 'spot_dft' flag."
+            )
+        for group in self.flags["stat_groups"]:
+            if group in unsupported:
+                raise ValueError(
+                    "algorithms.py: stat group '{}' is not supported with the 'spot_dft' flag.".format(group)
+                )
+        if bool(cp.any(cp.isnan(self.target))):
+            warnings.warn(
+                "algorithms.py: MRAF noise regions are ignored with the 'spot_dft' flag."
+            )
+
+        # A fixed phase is stored per spot rather than in the far-field of shape self.shape.
+        self.phase_ff = None
+
+        try:
+            self._spot_dft = self._spot_dft_setup()
+
+            nearfield = self._spot_dft["nearfield"]
+            farfield = self._spot_dft["farfield"]
+            blocks = [((slice(None), slice(None)), (slice(None), slice(None)))]
+
+            for _ in iterations:
+                # 1) Nearfield -> farfield at the spots.
+                self._populate_nearfield(nearfield, blocks)
+                self._spot_dft_forward()
+
+                # 2) Midloop: erase images from the past loop.
+                if hasattr(self, "img_ij"):     self.img_ij = None
+                if hasattr(self, "img_knm"):    self.img_knm = None
+
+                if callback is not None:
+                    if callback(self):
+                        break
+
+                if self._check_convergence():
+                    break
+
+                # 2.1) Stats, weighting, and fixing the far-field amplitude.
+                if self._stats_due():
+                    self.update_stats(self.flags["stat_groups"])
+
+                if "WGS" in self.method:
+                    self._update_weights()
+
+                self._update_fixed_phase(farfield)
+
+                if self.flags["fixed_phase"]:
+                    cp.exp(1j * self.phase_ff, out=farfield)
+                else:
+                    cp.divide(farfield, cp.abs(farfield), out=farfield)
+                    cp.nan_to_num(farfield, copy=False, nan=0)
+                cp.multiply(farfield, self._spot_dft["weights"], out=farfield)
+
+                # 3) Spots -> nearfield via the adjoint.
+                self._spot_dft_adjoint()
+                cp.arctan2(nearfield.imag, nearfield.real, out=self.phase)
+
+                self.iter += 1
+        finally:
+            if self._spot_dft is not None:
+                self._spot_dft_teardown()
+            self._spot_dft = None
+            self._resolve_stats()
+
+        # There is no full far-field to return.
+        self.amp_ff = None
+        self.phase_ff = None
+
+    def _spot_dft_setup(self):
+        """
+        Precomputes the separable phase ramps and buffers for the ``"spot_dft"`` engine.
+        See :meth:`GS()`.
+        """
+        dtype_complex = type(1j * self.dtype(1))
+        (i0, _, i2, _) = toolbox.unpad(self.shape, self.slm_shape)
+        (H, W) = self.shape
+        (h, w) = self.slm_shape
+
+        # Centered coordinates, matching fftshift(fft2(fftshift(.))) of the padded nearfield.
+        x = cp.arange(i2 - W // 2, i2 - W // 2 + w, dtype=self.dtype)
+        y = cp.arange(i0 - H // 2, i0 - H // 2 + h, dtype=self.dtype)
+        kx = cp.array(self.spot_knm_rounded[0] - W // 2, dtype=self.dtype)
+        ky = cp.array(self.spot_knm_rounded[1] - H // 2, dtype=self.dtype)
+
+        # Ramps of shape (w, K) and (h, K), with the orthonormal factor folded in.
+        norm = 1 / np.sqrt(H * W)
+        ramp_x = cp.exp(-2j * np.pi / W * cp.outer(x, kx)).astype(dtype_complex)
+        ramp_y = cp.exp(-2j * np.pi / H * cp.outer(y, ky)).astype(dtype_complex)
+        ramp_y *= norm
+
+        # Initial weights for each spot, read from the weights of shape self.shape.
+        if self.subpixel_beamradius_knm is None:
+            weights = self.weights[
+                self.spot_knm_rounded[1, :], self.spot_knm_rounded[0, :]
+            ].astype(self.dtype)
+        else:
+            weights = cp.sqrt(analysis.take(
+                cp.square(self.weights),
+                self.spot_knm,
+                int(4*np.ceil(self.subpixel_beamradius_knm)+1),
+                centered=True,
+                integrate=True,
+                mp=cp
+            )).astype(self.dtype)
+        weights *= 1 / Hologram._norm(weights)
+
+        # Reference power for efficiency statistics: the peak pixel power of a single
+        # spot focusing all light. This is the total power if the nearfield is unpadded.
+        if isinstance(self.amp, REAL_TYPES):
+            power = float(self.amp * h * w) ** 2 / (H * W)
+        else:
+            power = float(cp.sum(self.amp)) ** 2 / (H * W)
+
+        return {
+            "ramp_x": ramp_x,
+            "ramp_y": ramp_y,
+            "ramp_x_adjoint": cp.ascontiguousarray(cp.conj(ramp_x).T),
+            "ramp_y_adjoint": cp.conj(ramp_y),
+            "nearfield": cp.zeros(self.slm_shape, dtype=dtype_complex),
+            "farfield": cp.zeros(len(self), dtype=dtype_complex),
+            "workspace": cp.zeros((h, len(self)), dtype=dtype_complex),
+            "weights": weights,
+            "weights_initial": weights.copy(),
+            "power": power,
+        }
+
+    def _spot_dft_forward(self):
+        """
+        Evaluates the far-field at the spots from the near-field, in-place.
+        See :meth:`GS()`.
+        """
+        dft = self._spot_dft
+        workspace = dft["workspace"]
+
+        cp.matmul(dft["nearfield"], dft["ramp_x"], out=workspace)
+        workspace *= dft["ramp_y"]
+        cp.sum(workspace, axis=0, out=dft["farfield"])
+
+    def _spot_dft_adjoint(self):
+        """
+        Projects the far-field at the spots back to the near-field, in-place.
+        See :meth:`GS()`.
+        """
+        dft = self._spot_dft
+        workspace = dft["workspace"]
+
+        cp.multiply(dft["ramp_y_adjoint"], dft["farfield"], out=workspace)
+        cp.matmul(workspace, dft["ramp_x_adjoint"], out=dft["nearfield"])
+
+    def _spot_dft_teardown(self):
+        """
+        Writes the spot weights of the ``"spot_dft"`` engine back to :attr:`weights`.
+        """
+        weights = self._spot_dft["weights"]
+
+        if self.subpixel_beamradius_knm is None:
+            self.weights[self.spot_knm_rounded[1, :], self.spot_knm_rounded[0, :]] = weights
+        else:
+            factors = weights / self._spot_dft["weights_initial"]
+            if hasattr(factors, "get"):
+                factors = factors.get()
+            self._scale_spot_weights(np.nan_to_num(factors, nan=1))
+
+    def _set_fft_basis(self, unshifted=False):
+        """
+        Extends :meth:`Hologram._set_fft_basis()` to also move the spot positions
+        :attr:`spot_knm` and :attr:`spot_knm_rounded`.
+        Subpixel targets are not supported in the unshifted basis,
+        in which case the standard basis is kept.
+        """
+        unshifted = bool(unshifted)
+        if unshifted == self._fft_unshifted:
+            return
+
+        if unshifted and self.subpixel_beamradius_knm is not None:
+            warnings.warn(
+                "algorithms.py: the 'fft_unshifted' flag is not supported for subpixel "
+                "targets. Optimizing in the standard basis instead."
+            )
+            return
+
+        if unshifted:
+            # Keep the standard vectors such that they are restored exactly.
+            self._spot_knm_standard = (self.spot_knm, self.spot_knm_rounded)
+
+            half = np.array([[self.shape[1] // 2], [self.shape[0] // 2]])
+            modulus = np.array([[self.shape[1]], [self.shape[0]]])
+
+            self.spot_knm = np.mod(self.spot_knm - half, modulus)
+            self.spot_knm_rounded = np.mod(self.spot_knm_rounded - half, modulus)
+        else:
+            (self.spot_knm, self.spot_knm_rounded) = self._spot_knm_standard
+            self._spot_knm_standard = None
+
+        super()._set_fft_basis(unshifted)
+
     def _update_weights(self):
         """
         Change :attr:`weights` to optimize towards the :attr:`target` using feedback from
@@ -3068,18 +4168,22 @@ class SpotHologram(FeedbackHologram):
             feedback = self.flags["feedback"] = "computational_spot"
 
         # Weighting strategy depends on the chosen feedback method.
-        if feedback == "computational":
+        if feedback == "computational" and self._spot_dft is None:
             # Pixel-by-pixel weighting
             self._update_weights_generic(self.weights, self.amp_ff, self.target, nan_checks=True)
         else:
             # Integrate a window around each spot, with feedback from respective sources.
-            if feedback == "computational_spot":
+            if self._spot_dft is not None and feedback in ["computational", "computational_spot"]:
+                # The direct DFT evaluates exactly the spots (see GS()).
+                amp_feedback = cp.abs(self._spot_dft["farfield"])
+            elif feedback == "computational_spot":
                 amp_feedback = cp.sqrt(analysis.take(
                     cp.square(self.amp_ff),
                     self.spot_knm_rounded,
                     self.spot_integration_width_knm,
                     centered=True,
                     integrate=True,
+                    wrap=self._fft_unshifted,
                     mp=cp
                 ))
             elif feedback == "experimental_spot":
@@ -3097,7 +4201,15 @@ class SpotHologram(FeedbackHologram):
             else:
                 raise ValueError("algorithms.py: Feedback '{}' not recognized.".format(feedback))
 
-            if self.subpixel_beamradius_knm is None:
+            if self._spot_dft is not None:
+                # Direct DFT mode: weights are stored per spot.
+                self._update_weights_generic(
+                    self._spot_dft["weights"],
+                    cp.array(amp_feedback, copy=False, dtype=self.dtype),
+                    self.spot_amp,
+                    nan_checks=True
+                )
+            elif self.subpixel_beamradius_knm is None:
                 # Default mode: no subpixel stuff. We update single pixels.
                 self.weights[self.spot_knm_rounded[1, :], self.spot_knm_rounded[0, :]] = (
                     self._update_weights_generic(
@@ -3123,17 +4235,105 @@ class SpotHologram(FeedbackHologram):
                 )
 
                 # Update each Gaussian with each respective multiplication factor.
-                for spot_idx in range(len(self)):
-                    window = toolbox.window_slice(
-                        window=(
-                            self.spot_knm[0, spot_idx], 4*np.ceil(self.subpixel_beamradius_knm)+1,
-                            self.spot_knm[1, spot_idx], 4*np.ceil(self.subpixel_beamradius_knm)+1
-                        ),
-                        shape=None,
-                        centered=True,
-                        circular=True
-                    )
-                    self.weights[window] *= dummy_weights[spot_idx]
+                self._scale_spot_weights(dummy_weights)
+
+    def _get_subpixel_patches(self):
+        """
+        Returns the pixels of the circular window around each spot (in the style of
+        :meth:`~slmsuite.holography.toolbox.window_slice()`) used for ``subpixel``
+        targets, computed for all spots at once.
+
+        The patch offsets are cached for the window width, and the patches themselves
+        until :attr:`spot_knm`, :attr:`spot_amp`, or :attr:`shape` change.
+
+        Returns
+        -------
+        dict
+            Patch data, on the GPU if :mod:`cupy` is used:
+
+            - ``"pixels"``, the unique flattened indices covered by any patch,
+            - ``"inverse"``, for every patch pixel of every spot, the index into ``"pixels"``,
+            - ``"spot"``, for every patch pixel of every spot, the index of the spot,
+            - ``"x"``, ``"y"``, the coordinates of every patch pixel of every spot,
+            - ``"x0"``, ``"y0"``, ``"a"``, the position and amplitude of the respective spot.
+        """
+        w = int(4*np.ceil(self.subpixel_beamradius_knm)+1)
+        key = (w, tuple(self.shape))
+
+        cache = self._subpixel_patches
+        if (
+            cache is not None
+            and cache["key"] == key
+            and np.array_equal(cache["spot_knm"], self.spot_knm)
+            and np.array_equal(cache["spot_amp"], self.spot_amp)
+        ):
+            return cache
+
+        # Offsets of the circular window relative to its center, independent of the spots.
+        if cache is not None and cache["key"][0] == w:
+            (dx, dy) = (cache["dx"], cache["dy"])
+        else:
+            grid = np.arange(w) - (w - 1) // 2
+            (dx, dy) = np.meshgrid(grid, grid)
+            mask = np.square(dx) + np.square(dy) <= w * w / 4.
+            (dx, dy) = (dx[mask], dy[mask])
+
+        # Window centers, rounded as toolbox.window_slice() does.
+        xc = (self.spot_knm[0] - (w - 2) / 2).astype(int) + (w - 1) // 2
+        yc = (self.spot_knm[1] - (w - 2) / 2).astype(int) + (w - 1) // 2
+
+        x = xc[:, np.newaxis] + dx[np.newaxis, :]
+        y = yc[:, np.newaxis] + dy[np.newaxis, :]
+        spot = np.repeat(np.arange(len(self)), len(dx)).reshape(x.shape)
+
+        # Patches are clipped at the edges of the farfield.
+        valid = (x >= 0) & (x < self.shape[1]) & (y >= 0) & (y < self.shape[0])
+        (x, y, spot) = (x[valid], y[valid], spot[valid])
+
+        (pixels, inverse) = np.unique(y * self.shape[1] + x, return_inverse=True)
+
+        self._subpixel_patches = {
+            "key": key,
+            "spot_knm": np.copy(self.spot_knm),
+            "spot_amp": np.copy(self.spot_amp),
+            "dx": dx,
+            "dy": dy,
+            "pixels": cp.array(pixels),
+            "inverse": cp.array(inverse.ravel()),
+            "spot": cp.array(spot),
+            "x": cp.array(x, dtype=self.dtype),
+            "y": cp.array(y, dtype=self.dtype),
+            "x0": cp.array(self.spot_knm[0][spot], dtype=self.dtype),
+            "y0": cp.array(self.spot_knm[1][spot], dtype=self.dtype),
+            "a": cp.array(self.spot_amp[spot], dtype=self.dtype),
+        }
+
+        return self._subpixel_patches
+
+    def _scale_spot_weights(self, factors):
+        """
+        Multiplies the Gaussian pattern of each spot in :attr:`weights` by the
+        respective factor, for ``subpixel`` targets.
+        Pixels shared by overlapping spots are scaled by the product of the factors.
+
+        Parameters
+        ----------
+        factors : numpy.ndarray
+            Multiplication factor for each spot.
+        """
+        patches = self._get_subpixel_patches()
+
+        # Products of factors over overlapping patches are sums of logarithms.
+        with np.errstate(divide="ignore"):
+            log_factors = cp.array(np.log(factors), dtype=self.dtype)
+
+        scale = cp.exp(cp.bincount(
+            patches["inverse"],
+            weights=log_factors[patches["spot"]],
+            minlength=len(patches["pixels"])
+        ))
+
+        self.weights.ravel()[patches["pixels"]] *= scale.astype(self.weights.dtype)
 
     def _calculate_stats_spots(self, stats, stat_groups=[]):
         """
@@ -3141,7 +4341,16 @@ class SpotHologram(FeedbackHologram):
         """
 
         if "computational_spot" in stat_groups:
-            if self.shape == self.slm_shape:
+            if self._spot_dft is not None:
+                # The direct DFT evaluates exactly the spots (see GS()).
+                stats["computational_spot"] = self._calculate_stats(
+                    cp.abs(self._spot_dft["farfield"]),
+                    self.spot_amp,
+                    efficiency_compensation=False,
+                    total=self._spot_dft["power"],
+                    raw="raw_stats" in self.flags and self.flags["raw_stats"]
+                )
+            elif self.shape == self.slm_shape:
                 # Spot size is one pixel wide: no integration required.
                 stats["computational_spot"] = self._calculate_stats(
                     self.amp_ff[self.spot_knm_rounded[1, :], self.spot_knm_rounded[0, :]],
@@ -3160,6 +4369,7 @@ class SpotHologram(FeedbackHologram):
                         self.spot_integration_width_knm,
                         centered=True,
                         integrate=True,
+                        wrap=self._fft_unshifted,
                         mp=cp
                     )
 
@@ -3178,7 +4388,8 @@ class SpotHologram(FeedbackHologram):
                         self.spot_knm,
                         self.spot_integration_width_knm,
                         centered=True,
-                        integrate=True
+                        integrate=True,
+                        wrap=self._fft_unshifted
                     )
 
                     stats["computational_spot"] = self._calculate_stats(
@@ -3239,3 +4450,634 @@ class SpotHologram(FeedbackHologram):
         self._calculate_stats_spots(stats, stat_groups)
 
         self._update_stats_dictionary(stats)
+
+
+class HologramBatch:
+    r"""
+    Simultaneous optimization of many holograms of the same :attr:`~Hologram.shape`.
+
+    Small holograms underuse FFT hardware, especially GPUs. A :class:`HologramBatch`
+    stacks the near-field :attr:`phase` and far-field :attr:`target`, :attr:`weights`,
+    and :attr:`amp_ff` of ``N`` holograms into arrays of shape ``(N, h, w)`` and runs
+    :meth:`Hologram.GS()`-type iterations with a single batched FFT over the last
+    two axes. Pixel-wise ``"computational"`` weighting is likewise vectorized over the
+    batch (see :meth:`Hologram._update_weights_generic()`), while spot-specific feedback
+    and statistics are handled by each hologram individually.
+
+    The holograms remain usable as usual. Their :attr:`~Hologram.phase`,
+    :attr:`~Hologram.target`, :attr:`~Hologram.weights`, and :attr:`~Hologram.amp_ff`
+    become views into the stacked arrays, and each hologram keeps its own
+    :attr:`~Hologram.flags`, :attr:`~Hologram.stats`, and :attr:`~Hologram.iter`.
+
+    Caution
+    ~~~~~~~
+    The stacked arrays are gathered from the holograms at the start of each call to
+    :meth:`optimize()`, so changes made to a hologram inbetween optimizations
+    (e.g. :meth:`Hologram.update_target()`) are respected. However, changes made
+    during optimization (e.g. in a ``callback``) must be made in-place.
+
+    Attributes
+    ----------
+    holograms : list of Hologram
+        The holograms (or subclasses thereof) to optimize.
+    shape : (int, int)
+        The computational shape shared by all :attr:`holograms`.
+    slm_shape : (int, int)
+        The near-field shape shared by all :attr:`holograms`.
+    dtype : type
+        The datatype shared by all :attr:`holograms`.
+    phase : numpy.ndarray OR cupy.ndarray
+        Stacked **near-field** phases of shape ``(N,) + slm_shape``.
+    amp : float OR numpy.ndarray OR cupy.ndarray
+        **Near-field** source amplitude. A scalar if all :attr:`holograms` share the
+        same uniform amplitude, otherwise stacked with shape ``(N,) + slm_shape``.
+    target, weights, amp_ff : numpy.ndarray OR cupy.ndarray
+        Stacked **far-field** arrays of shape ``(N,) + shape``.
+    method : str
+        The last-used optimization method.
+    """
+
+    def __init__(self, holograms):
+        """
+        Stacks the data of the given holograms.
+
+        Parameters
+        ----------
+        holograms : list of Hologram
+            See :attr:`holograms`. All must share the same
+            :attr:`~Hologram.shape`, :attr:`~Hologram.slm_shape`, and :attr:`~Hologram.dtype`.
+        """
+        self.holograms = list(holograms)
+
+        if len(self.holograms) == 0:
+            raise ValueError("algorithms.py: HologramBatch requires at least one hologram.")
+
+        reference = self.holograms[0]
+        self.shape = tuple(reference.shape)
+        self.slm_shape = tuple(reference.slm_shape)
+        self.dtype = reference.dtype
+
+        for hologram in self.holograms:
+            if (
+                tuple(hologram.shape) != self.shape or
+                tuple(hologram.slm_shape) != self.slm_shape or
+                hologram.dtype != self.dtype
+            ):
+                raise ValueError(
+                    "algorithms.py: All holograms in a HologramBatch must share the same "
+                    "shape, slm_shape, and dtype."
+                )
+
+        # Allocate the stacked arrays.
+        N = len(self.holograms)
+        self.phase = cp.zeros((N,) + self.slm_shape, dtype=self.dtype)
+        self.target = cp.zeros((N,) + self.shape, dtype=self.dtype)
+        self.weights = cp.zeros((N,) + self.shape, dtype=self.dtype)
+        self.amp_ff = cp.zeros((N,) + self.shape, dtype=self.dtype)
+        self.amp = None
+
+        self.method = ""
+
+        self._gather()
+
+    def __len__(self):
+        """
+        Overloads len() to return the number of :attr:`holograms`.
+
+        Returns
+        -------
+        int
+            The length of :attr:`holograms`.
+        """
+        return len(self.holograms)
+
+    def __getitem__(self, index):
+        return self.holograms[index]
+
+    def _gather(self):
+        """
+        Copies the data of each hologram into the stacked arrays and replaces
+        the hologram attributes with views into these arrays.
+        """
+        for (i, hologram) in enumerate(self.holograms):
+            for attribute in ["phase", "target", "weights", "amp_ff"]:
+                stack = getattr(self, attribute)
+                array = getattr(hologram, attribute)
+
+                if array is not None:
+                    stack[i] = array
+                setattr(hologram, attribute, stack[i])
+
+        # Use a scalar amplitude if possible.
+        amps = [hologram.amp for hologram in self.holograms]
+        if all(isinstance(amp, REAL_TYPES) for amp in amps) and len(set(amps)) == 1:
+            self.amp = amps[0]
+        else:
+            self.amp = cp.zeros((len(self),) + self.slm_shape, dtype=self.dtype)
+            for (i, amp) in enumerate(amps):
+                self.amp[i] = amp
+
+    def optimize(
+        self,
+        method="GS",
+        maxiter=20,
+        verbose=True,
+        callback=None,
+        feedback=None,
+        stat_groups=[],
+        **kwargs
+    ):
+        """
+        Optimizes all :attr:`holograms` simultaneously.
+        Parameters are identical to :meth:`Hologram.optimize()`, and are applied to
+        every hologram, except that ``callback`` is passed the :class:`HologramBatch`.
+        """
+        # 0-1) Check and record method, parse flags for each hologram.
+        for hologram in self.holograms:
+            hologram._optimize_setup(method, feedback, stat_groups, kwargs)
+        self.method = method
+
+        if verbose > 1:
+            print("Optimizing {} holograms with '{}' using the following method-specific flags:".format(
+                len(self), self.method
+            ))
+            pprint.pprint({
+                key:value for (key, value) in self.holograms[0].flags.items()
+                if key in ALGORITHM_DEFAULTS[method]
+            })
+            print("", end="", flush=True)   # Prevent tqdm conflicts.
+
+        # 1.5) Collect the data of each hologram.
+        self._gather()
+
+        # 2) Prepare the iterations iterable.
+        iterations = range(maxiter)
+
+        if verbose and maxiter > 1:
+            iterations = tqdm(iterations)
+
+        # 3) Switch between optimization methods (currently only GS- or WGS-type is supported).
+        if "GS" in method:
+            self.GS(iterations, callback)
+
+    def GS(self, iterations, callback):
+        """
+        Batched counterpart to :meth:`Hologram.GS()`.
+
+        Parameters
+        ----------
+        iterations : iterable
+            Number of loop iterations to run. Is an iterable to pass a :mod:`tqdm` iterable.
+        callback : callable OR None
+            See :meth:`optimize()`.
+        """
+        fft = self._get_fft_engine()
+        nearfield = fft.buffer
+
+        # Move far-field data to the unshifted basis of the FFT, if desired and supported by all.
+        unshifted = bool(self.holograms[0].flags.get("fft_unshifted", False))
+        for hologram in self.holograms:
+            hologram._set_fft_basis(unshifted)
+        unshifted = all(hologram._fft_unshifted for hologram in self.holograms)
+
+        try:
+            if not unshifted:
+                for hologram in self.holograms:
+                    hologram._set_fft_basis(False)
+
+            # Precompute helper variables.
+            mraf_variables = [hologram._mraf_helper_routines() for hologram in self.holograms]
+            blocks = self._nearfield_blocks(unshifted)
+
+            # Pixel-wise weighting can be vectorized over the batch.
+            batched_weights = all(
+                hologram.flags["feedback"] == "computational" and
+                getattr(hologram, "subpixel_beamradius_knm", None) is None
+                for hologram in self.holograms
+            )
+
+            for _ in iterations:
+                # 1) Nearfield -> farfield
+                self._populate_nearfield(nearfield, blocks)
+                farfield = fft.fft2(shift=not unshifted)
+
+                # 2) Midloop: caching, prep
+                for (i, hologram) in enumerate(self.holograms):
+                    hologram._midloop_cleaning(farfield[i])
+
+                if callback is not None:
+                    if callback(self):
+                        break
+
+                # Stop once every hologram has converged.
+                if all([hologram._check_convergence() for hologram in self.holograms]):
+                    break
+
+                self._GS_farfield_routines(farfield, mraf_variables, batched_weights)
+
+                # 3) Farfield -> nearfield.
+                nearfield = fft.ifft2(shift=not unshifted)
+
+                for (dst, src) in blocks:
+                    cp.arctan2(nearfield.imag[dst], nearfield.real[dst], out=self.phase[src])
+
+                for hologram in self.holograms:
+                    hologram.iter += 1
+        finally:
+            for hologram in self.holograms:
+                hologram._set_fft_basis(False)
+                hologram._resolve_stats()
+
+        # Update the final far-field
+        self._populate_nearfield(nearfield, self._nearfield_blocks(False))
+        farfield = fft.fft2()
+        cp.abs(farfield, out=self.amp_ff)
+
+        for (i, hologram) in enumerate(self.holograms):
+            hologram.amp_ff = self.amp_ff[i]
+            hologram.phase_ff = cp.angle(farfield[i])
+
+    def _get_fft_engine(self):
+        """
+        Returns the planned FFT engine for the batch, following :meth:`Hologram._get_fft_engine()`.
+        """
+        flags = self.holograms[0].flags
+        shape = (len(self),) + self.shape
+        dtype_complex = type(1j * self.dtype(1))
+        backend = flags.get("fft_backend", None)
+        workers = flags.get("fft_workers", None)
+
+        engine = getattr(self, "_fft_engine", None)
+        if engine is None or not engine.matches(shape, dtype_complex, backend, workers):
+            engine = self._fft_engine = _FFTEngine(shape, dtype_complex, backend, workers)
+
+        return engine
+
+    def _nearfield_blocks(self, unshifted=False):
+        """
+        Batched counterpart to :meth:`Hologram._nearfield_blocks()`.
+        """
+        return [
+            ((slice(None),) + dst, (slice(None),) + src)
+            for (dst, src) in self.holograms[0]._nearfield_blocks(unshifted)
+        ]
+
+    def _populate_nearfield(self, nearfield, blocks):
+        """
+        Batched counterpart to :meth:`Hologram._populate_nearfield()`.
+        """
+        nearfield.fill(0)
+
+        for (dst, src) in blocks:
+            cp.cos(self.phase[src], out=nearfield.real[dst])
+            cp.sin(self.phase[src], out=nearfield.imag[dst])
+
+            if isinstance(self.amp, REAL_TYPES):
+                nearfield[dst] *= self.amp
+            else:
+                nearfield[dst] *= self.amp[src]
+
+    def _GS_farfield_routines(self, farfield, mraf_variables, batched_weights):
+        # Update statistics for each hologram.
+        for hologram in self.holograms:
+            if hologram._stats_due():
+                hologram.update_stats(hologram.flags["stat_groups"])
+
+        # Weight, if desired.
+        if "WGS" in self.method:
+            if batched_weights:
+                self.holograms[0]._update_weights_generic(
+                    self.weights, self.amp_ff, self.target, axis=(-2, -1)
+                )
+            else:
+                for hologram in self.holograms:
+                    hologram._update_weights()
+
+        # Decide whether to fix phase.
+        for (i, hologram) in enumerate(self.holograms):
+            hologram._update_fixed_phase(farfield[i])
+
+        # Fix amplitude, in a batch if possible.
+        if any(
+            variables["mraf_enabled"] or hologram.flags["fixed_phase"]
+            for (hologram, variables) in zip(self.holograms, mraf_variables)
+        ):
+            for (i, hologram) in enumerate(self.holograms):
+                hologram._apply_farfield_constraint(farfield[i], mraf_variables[i])
+        else:
+            cp.divide(farfield, cp.abs(farfield), out=farfield)
+            cp.multiply(farfield, self.weights, out=farfield)
+            cp.nan_to_num(farfield, copy=False, nan=0)
+
+    def extract_phase(self):
+        r"""
+        Collects the current nearfield phases from the GPU, shifted to :math:`[0, 2\pi]`.
+        See :meth:`Hologram.extract_phase()`.
+
+        Returns
+        -------
+        numpy.ndarray
+            Current nearfield phases of shape ``(N,) + slm_shape``.
+        """
+        if cp != np:
+            return self.phase.get() + np.pi
+        return self.phase + np.pi
+
+
+class WarmStartCache:
+    """
+    Cache of optimized :class:`SpotHologram` solutions, used to warm-start the
+    optimization of new spot configurations.
+
+    Small changes to a target (e.g. moving a few spots) have solutions close to the
+    original. Rather than re-optimizing from a random :meth:`~Hologram.reset_phase()`,
+    a new :class:`SpotHologram` can be seeded (:meth:`seed()`) with the cached
+    :attr:`~Hologram.phase` and :attr:`~Hologram.weights` of the same configuration or,
+    failing that, with the far-field phases and weights of the spots of the nearest
+    cached spot configuration, requiring only a handful of iterations to re-converge.
+    Solutions are added with :meth:`store()`.
+
+    Entries are keyed by a hash of :attr:`~Hologram.shape`, :attr:`~Hologram.slm_shape`,
+    :attr:`~SpotHologram.spot_knm`, and :attr:`~SpotHologram.spot_amp`. At most
+    :attr:`maxsize` entries are kept in memory, evicting the least recently used.
+    If :attr:`path` is given, evicted entries are written to disk with
+    :meth:`~slmsuite.misc.files.write_h5()` instead of being discarded, and are reloaded
+    when used. Entries already on disk (e.g. from a previous session) are indexed
+    upon initialization.
+
+    Attributes
+    ----------
+    maxsize : int
+        Maximum number of entries kept in memory.
+    path : str OR None
+        Directory of the on-disk tier. If ``None``, evicted entries are discarded.
+    max_distance : float OR None
+        Largest mean spot distance (in ``"knm"`` pixels) for a configuration to count as
+        nearest. If ``None``, any configuration of the same shape is accepted.
+    """
+
+    def __init__(self, maxsize=16, path=None, max_distance=None):
+        """
+        Initializes an empty cache.
+
+        Parameters
+        ----------
+        maxsize : int
+            See :attr:`maxsize`.
+        path : str OR None
+            See :attr:`path`. Created if it does not exist, otherwise scanned for entries.
+        max_distance : float OR None
+            See :attr:`max_distance`.
+        """
+        self.maxsize = int(maxsize)
+        self.path = path
+        self.max_distance = max_distance
+
+        # Full entries in memory, and the spot configurations of entries on disk.
+        self._memory = OrderedDict()
+        self._disk = OrderedDict()
+
+        if self.path is not None:
+            os.makedirs(self.path, exist_ok=True)
+            self._scan()
+
+    def _scan(self):
+        """
+        Indexes the entries on disk, oldest first, reading only their spot configurations.
+        Files which are not cache entries are ignored.
+        """
+        files = []
+        for name in os.listdir(self.path):
+            (key, extension) = os.path.splitext(name)
+            if extension == ".h5" and len(key) == 40:
+                files.append((os.path.getmtime(self._file_path(key)), key))
+
+        for (_, key) in sorted(files):
+            try:
+                with h5py.File(self._file_path(key), "r") as file_:
+                    self._disk[key] = {
+                        "shape": file_["shape"][()],
+                        "spot_knm": file_["spot_knm"][()],
+                    }
+            except (OSError, KeyError):
+                continue
+
+    def __len__(self):
+        """
+        Overloads len() to return the number of entries in memory and on disk.
+
+        Returns
+        -------
+        int
+            The number of entries.
+        """
+        return len(self._memory) + len(self._disk)
+
+    @staticmethod
+    def key(hologram):
+        """
+        Hashes the configuration of a :class:`SpotHologram`.
+
+        Parameters
+        ----------
+        hologram : SpotHologram
+            The hologram to hash.
+
+        Returns
+        -------
+        str
+            Hexadecimal hash of the shapes, spot positions, and spot amplitudes.
+        """
+        digest = hashlib.sha1()
+
+        for data in [
+            hologram.shape,
+            hologram.slm_shape,
+            hologram.spot_knm,
+            hologram.spot_amp,
+        ]:
+            array = np.ascontiguousarray(data, dtype=np.float64)
+            digest.update(str(array.shape).encode())
+            digest.update(array.tobytes())
+
+        return digest.hexdigest()
+
+    def _file_path(self, key):
+        return os.path.join(self.path, "{}.h5".format(key))
+
+    def store(self, hologram):
+        """
+        Adds the current solution of ``hologram`` to the cache, overwriting any
+        previous entry of the same configuration.
+
+        Parameters
+        ----------
+        hologram : SpotHologram
+            The (optimized) hologram to store.
+
+        Returns
+        -------
+        str
+            The key of the entry.
+        """
+        key = self.key(hologram)
+
+        phase = hologram.phase
+        weights = hologram.weights
+        if hasattr(phase, "get"):   phase = phase.get()
+        if hasattr(weights, "get"): weights = weights.get()
+
+        spot_knm_rounded = np.array(hologram.spot_knm_rounded).astype(int)
+
+        entry = {
+            "shape": np.array(hologram.shape),
+            "spot_knm": np.array(hologram.spot_knm, dtype=float),
+            "spot_amp": np.array(hologram.spot_amp, dtype=float),
+            "phase": np.array(phase, copy=True),
+            "weights": np.array(weights, copy=True),
+            "spot_weights": np.array(weights[spot_knm_rounded[1], spot_knm_rounded[0]]),
+            "spot_phase": np.angle(
+                hologram.extract_farfield()[spot_knm_rounded[1], spot_knm_rounded[0]]
+            ),
+        }
+
+        self._disk.pop(key, None)
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+
+        self._evict()
+
+        return key
+
+    def _evict(self):
+        """
+        Moves the least recently used entries beyond :attr:`maxsize` to disk (or discards them).
+        """
+        while len(self._memory) > self.maxsize:
+            (key, entry) = self._memory.popitem(last=False)
+
+            if self.path is not None:
+                write_h5(self._file_path(key), entry)
+                self._disk[key] = {
+                    "shape": entry["shape"],
+                    "spot_knm": entry["spot_knm"],
+                }
+
+    def _load(self, key):
+        """
+        Returns the entry for ``key``, promoting it from disk if necessary,
+        or ``None`` if there is no such entry.
+        """
+        if key in self._memory:
+            self._memory.move_to_end(key)
+            return self._memory[key]
+
+        if self.path is not None and os.path.isfile(self._file_path(key)):
+            entry = read_h5(self._file_path(key))
+
+            self._disk.pop(key, None)
+            self._memory[key] = entry
+            self._evict()
+
+            return entry
+
+        return None
+
+    def _nearest(self, hologram):
+        """
+        Finds the key of the cached configuration of the same shape with the
+        smallest mean distance between spots, matching each spot to the nearest
+        spot of the other configuration (in both directions).
+        """
+        best = (np.inf, None)
+        spots = np.array(hologram.spot_knm, dtype=float)
+
+        for tier in [self._memory, self._disk]:
+            for (key, entry) in tier.items():
+                if tuple(entry["shape"]) != tuple(hologram.shape):
+                    continue
+
+                distance = np.sqrt(np.sum(np.square(
+                    spots[:, :, np.newaxis] - entry["spot_knm"][:, np.newaxis, :]
+                ), axis=0))
+                distance = (
+                    np.mean(np.amin(distance, axis=1)) + np.mean(np.amin(distance, axis=0))
+                ) / 2
+
+                if distance < best[0]:
+                    best = (distance, key)
+
+        if self.max_distance is not None and best[0] > self.max_distance:
+            return None
+
+        return best[1]
+
+    def seed(self, hologram):
+        """
+        Seeds the :attr:`~Hologram.phase` and :attr:`~Hologram.weights` of ``hologram``
+        from the cache.
+
+        For an exact hit, the cached phase and weights are restored. Otherwise, the
+        nearest cached configuration (see :attr:`max_distance`) is used: each spot takes
+        the far-field phase and weight of the nearest cached spot, and the phase is
+        propagated back to the SLM. The cached phase pattern itself is not reused, as it
+        only suits spots which stay put.
+        Weights are not seeded for ``subpixel`` targets.
+        If nothing matches, ``hologram`` is left untouched.
+
+        Parameters
+        ----------
+        hologram : SpotHologram
+            The hologram to seed, typically before :meth:`~Hologram.optimize()`.
+
+        Returns
+        -------
+        str OR None
+            ``"exact"``, ``"nearest"``, or ``None`` if the cache missed.
+        """
+        key = self.key(hologram)
+        entry = self._load(key)
+
+        if entry is not None:
+            hologram.reset_phase(np.array(entry["phase"], copy=True))
+            hologram.weights = cp.array(entry["weights"], dtype=hologram.dtype)
+            return "exact"
+
+        key = self._nearest(hologram)
+        if key is None:
+            return None
+        entry = self._load(key)
+
+        if tuple(np.shape(entry["phase"])) != tuple(hologram.slm_shape):
+            return None
+
+        # Match each new spot to the nearest cached spot.
+        spots = np.array(hologram.spot_knm, dtype=float)
+        match = np.argmin(np.sum(np.square(
+            spots[:, :, np.newaxis] - entry["spot_knm"][:, np.newaxis, :]
+        ), axis=0), axis=1)
+        spot_knm_rounded = np.array(hologram.spot_knm_rounded).astype(int)
+
+        # The cached phase pattern is only a good guess if the spots stay put. Instead,
+        # transfer the far-field phase of each matched spot and propagate back to the SLM.
+        fft = hologram._get_fft_engine()
+        farfield = fft.buffer
+        farfield.fill(0)
+        farfield[spot_knm_rounded[1], spot_knm_rounded[0]] = (
+            hologram.target[spot_knm_rounded[1], spot_knm_rounded[0]]
+            * cp.exp(1j * cp.array(entry["spot_phase"][match]))
+        )
+        nearfield = fft.ifft2()
+
+        for (dst, src) in hologram._nearfield_blocks():
+            cp.arctan2(nearfield.imag[dst], nearfield.real[dst], out=hologram.phase[src])
+
+        if hologram.subpixel_beamradius_knm is None:
+            hologram.reset_weights()
+            hologram.weights[spot_knm_rounded[1], spot_knm_rounded[0]] = cp.array(
+                np.array(entry["spot_weights"])[match], dtype=hologram.dtype
+            )
+            hologram.weights *= 1 / Hologram._norm(hologram.weights)
+
+        return "nearest"
+
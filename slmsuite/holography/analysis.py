@@ -14,7 +14,7 @@ from slmsuite.misc.fitfunctions import gaussian2d
 
 def take(
         images, vectors, size,
-        centered=True, integrate=False, clip=False,
+        centered=True, integrate=False, clip=False, wrap=False,
         return_mask=False, plot=False, mp=np
     ):
     """
@@ -47,6 +47,11 @@ def take(
         the valid area, setting the invalid region to ``np.nan``
         (or zero if the array datatype does not support ``np.nan``).
         ``False`` throws an error upon out of range. Defaults to ``False``.
+    wrap : bool
+        Whether to treat ``images`` as periodic, such that out-of-range integration
+        regions wrap around the edges. This is useful for data in the unshifted basis
+        of the FFT, where regions around the zeroth order are split across the corners.
+        Takes precedence over ``clip``. Defaults to ``False``.
     return_mask : bool
         If ``True``, returns a boolean mask corresponding to the regions which are taken
         from. Defaults to ``False``. The average user will ignore this.
@@ -56,8 +61,9 @@ def take(
         If ``images`` are :mod:`cupy` objects, then :mod:`cupy` must be passed as
         ``mp``. Very useful to minimize the cost of moving data between the GPU and CPU.
         Defaults to :mod:`numpy`.
-        Indexing variables inside `:meth:`take` still use :mod:`numpy` for speed, no
-        matter what module is used.
+        Indexing variables inside :meth:`take` are computed with :mod:`numpy`, and then
+        cached on the device of ``mp`` for reuse by subsequent calls with the same
+        ``vectors``, ``size``, and image shape.
 
     Returns
     -------
@@ -71,45 +77,22 @@ def take(
     # Clean variables.
     if isinstance(size, REAL_TYPES):
         size = (size, size)
+    size = (int(size[0]), int(size[1]))
 
     vectors = format_2vectors(vectors)
 
-    # Prepare helper variables. Future: consider caching for speed, if not negligible.
-    edge_x = np.arange(size[0]) - ((int(size[0] - 1) / 2) if centered else 0)
-    edge_y = np.arange(size[1]) - ((int(size[1] - 1) / 2) if centered else 0)
-
-    region_x, region_y = np.meshgrid(edge_x, edge_y)
-
-    # Get the lists for the integration regions.
-    integration_x = np.around(np.add(
-        region_x.ravel()[:, np.newaxis].T, vectors[:][0][:, np.newaxis]
-    )).astype(int)
-    integration_y = np.around(np.add(
-        region_y.ravel()[:, np.newaxis].T, vectors[:][1][:, np.newaxis]
-    )).astype(int)
-
     images = mp.array(images, copy=False)
     shape = mp.shape(images)
 
-    if clip:  # Prevent out-of-range errors by clipping.
-        mask = (
-            (integration_x < 0) | (integration_x >= shape[-1]) |
-            (integration_y < 0) | (integration_y >= shape[-2])
-        )
+    if len(shape) not in [2, 3]:
+        raise RuntimeError("Unexpected shape for images: {}".format(shape))
 
-        if np.any(mask):
-            # Clip these indices to prevent errors.
-            np.clip(integration_x, 0, shape[-1] - 1, out=integration_x)
-            np.clip(integration_y, 0, shape[-2] - 1, out=integration_y)
-        else:
-            # No clipping needed.
-            clip = False
-    else:
-        pass  # Don't prevent out-of-range errors.
+    # Get the (cached) flattened indices for the integration regions.
+    (index, mask) = _take_indices(vectors, size, shape[-2:], centered, clip, wrap, mp)
 
     if return_mask:
-        canvas = np.zeros(shape[:2], dtype=bool)
-        canvas[integration_y, integration_x] = True
+        canvas = np.zeros(shape[-2:], dtype=bool)
+        canvas.ravel()[index.get() if hasattr(index, "get") else index] = True
 
         if plot:
             plt.imshow(canvas)
@@ -119,19 +102,17 @@ def take(
     else:
         # Take the data, depending on the shape of the images.
         if len(shape) == 2:
-            result = images[np.newaxis, integration_y, integration_x]
-        elif len(shape) == 3:
-            result = images[:, integration_y, integration_x]
+            result = mp.take(images.reshape(-1), index)[np.newaxis, :]
         else:
-            raise RuntimeError("Unexpected shape for images: {}".format(shape))
+            result = mp.take(images.reshape(shape[0], -1), index, axis=1)
 
-        if clip:  # Set values that were out of range to nan instead of erroring.
+        result = result.reshape(result.shape[0], vectors.shape[1], size[0] * size[1])
+
+        if mask is not None:  # Set values that were out of range to nan instead of erroring.
             try:  # If the datatype of result is incompatible with nan, set to zero instead.
                 result[:, mask] = np.nan
             except:
                 result[:, mask] = 0
-        else:
-            pass
 
         if integrate:  # Sum over the integration axis.
             return mp.squeeze(mp.sum(result, axis=-1))
@@ -139,6 +120,80 @@ def take(
             return mp.reshape(result, (vectors.shape[1], size[1], size[0]))
 
 
+_take_cache = {}
+_take_cache_size = 32
+
+def _take_indices(vectors, size, shape, centered, clip, wrap, mp):
+    """
+    Returns the flattened indices of the integration regions of :meth:`take()` into an
+    image of 2D ``shape``, along with a mask of the out-of-range indices (or ``None``
+    if there are none or ``clip`` is ``False``). Both are on the device of ``mp``.
+
+    The indices only depend on the geometry of the regions, so they are cached between
+    calls; :meth:`take()` is frequently called with the same regions, e.g. in every
+    iteration of spot-based feedback.
+    """
+    key = (
+        vectors.tobytes(), vectors.shape, vectors.dtype.str,
+        size, tuple(shape), bool(centered), bool(clip), bool(wrap), mp.__name__
+    )
+
+    if key in _take_cache:
+        return _take_cache[key]
+
+    # Prepare helper variables.
+    edge_x = np.arange(size[0]) - ((int(size[0] - 1) / 2) if centered else 0)
+    edge_y = np.arange(size[1]) - ((int(size[1] - 1) / 2) if centered else 0)
+
+    region_x, region_y = np.meshgrid(edge_x, edge_y)
+
+    # Get the lists for the integration regions.
+    integration_x = np.around(np.add(
+        region_x.ravel()[:, np.newaxis].T, vectors[:][0][:, np.newaxis]
+    )).astype(int)
+    integration_y = np.around(np.add(
+        region_y.ravel()[:, np.newaxis].T, vectors[:][1][:, np.newaxis]
+    )).astype(int)
+
+    mask = None
+
+    if wrap:  # Prevent out-of-range errors by wrapping.
+        np.mod(integration_x, shape[-1], out=integration_x)
+        np.mod(integration_y, shape[-2], out=integration_y)
+    else:
+        out_of_range = (
+            (integration_x < 0) | (integration_x >= shape[-1]) |
+            (integration_y < 0) | (integration_y >= shape[-2])
+        )
+
+        if clip and np.any(out_of_range):  # Prevent out-of-range errors by clipping.
+            np.clip(integration_x, 0, shape[-1] - 1, out=integration_x)
+            np.clip(integration_y, 0, shape[-2] - 1, out=integration_y)
+            mask = mp.array(out_of_range)
+        elif np.any(out_of_range):  # Mimic numpy indexing, which wraps negative indices.
+            if (
+                np.any(integration_x >= shape[-1]) or np.any(integration_x < -shape[-1]) or
+                np.any(integration_y >= shape[-2]) or np.any(integration_y < -shape[-2])
+            ):
+                raise IndexError(
+                    "analysis.py: take() integration regions are out of range "
+                    "of the images of shape {}.".format(tuple(shape))
+                )
+
+            np.mod(integration_x, shape[-1], out=integration_x)
+            np.mod(integration_y, shape[-2], out=integration_y)
+
+    index = mp.array(np.ravel(integration_y * shape[-1] + integration_x))
+
+    # Evict the oldest entry if the cache is full.
+    if len(_take_cache) >= _take_cache_size:
+        _take_cache.pop(next(iter(_take_cache)))
+
+    _take_cache[key] = (index, mask)
+
+    return (index, mask)
+
+
 def take_plot(images):
     """
     Plots non-integrated results of :meth:`.take()` in a square array of subplots.
@@ -863,6 +918,62 @@ def fit_affine(x, y, guess_affine=None, plot=False):
     return {"M":M, "b":b}
 
 
+def fit_phase_steps(intensities, axis=-1):
+    r"""
+    Fits intensities measured at equally spaced phase steps
+    :math:`\phi_n = 2\pi n / N` to the offset sinusoid of
+    :meth:`~slmsuite.misc.fitfunctions.cos`,
+
+    .. math:: y(\phi) = c + \frac{a}{2} \left[1+\cos(\phi - b) \right].
+
+    Rather than iterative least squares, the fit is computed in closed form from the
+    first Fourier coefficient :math:`S = \langle y_n e^{-i\phi_n} \rangle = \frac{a}{4}e^{-ib}`,
+    which is the exact least squares solution for equally spaced steps. Thus
+    :math:`a = 4|S|`, :math:`b = \arg(S^*)`, and :math:`c = \langle y_n \rangle - a/2`.
+    The coefficient of determination is likewise analytic:
+    :math:`R^2 = \frac{N a^2 / 8}{\sum_n (y_n - \langle y_n \rangle)^2}`.
+    All traces are fit at once, and the fit never fails, which is useful for
+    low-contrast data.
+
+    Parameters
+    ----------
+    intensities : array_like
+        Intensity traces, with the ``N >= 3`` phase steps along ``axis``.
+    axis : int
+        Axis of the phase steps.
+
+    Returns
+    -------
+    dict
+        A dictionary with fields ``"phase"`` (:math:`b`, in :math:`[0, 2\pi)`, the
+        phase of maximum intensity), ``"amp"`` (:math:`a`), ``"offset"`` (:math:`c`),
+        ``"contrast"`` (:math:`a / (a + c)`), and ``"r2"``, each with ``axis`` removed.
+        Traces without variation have zero ``"r2"``.
+    """
+    intensities = np.moveaxis(np.asarray(intensities, dtype=float), axis, -1)
+    N = intensities.shape[-1]
+
+    if N < 3:
+        raise ValueError("analysis.py: At least three phase steps are required for a fit.")
+
+    phases = 2 * np.pi * np.arange(N) / N
+
+    mean = np.mean(intensities, axis=-1)
+    S = np.tensordot(intensities, np.exp(-1j * phases), axes=(-1, 0)) / N
+
+    amp = 4 * np.abs(S)
+    phase = np.mod(np.angle(np.conj(S)), 2 * np.pi)
+    offset = mean - amp / 2
+
+    ss_tot = np.sum(np.square(intensities - mean[..., np.newaxis]), axis=-1)
+    ss_fit = N * np.square(amp) / 8
+
+    r2 = np.divide(ss_fit, ss_tot, out=np.zeros_like(ss_tot), where=ss_tot > 0)
+    contrast = np.divide(amp, amp + offset, out=np.zeros_like(amp), where=(amp + offset) != 0)
+
+    return {"phase":phase, "amp":amp, "offset":offset, "contrast":contrast, "r2":r2}
+
+
 def blob_detect(
     img,
     filter=None,
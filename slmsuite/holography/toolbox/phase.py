@@ -221,10 +221,12 @@ def zernike_sum(grid, weights, aperture=None):
         corresponding to SLM pixels, in ``(x_grid, y_grid)`` form.
         These are precalculated and stored in any :class:`~slmsuite.hardware.slms.slm.SLM`, so
         such a class can be passed instead of the grids directly.
-    weights : list of ((int, int), float)
+    weights : list of ((int, int), float) OR numpy.ndarray of shape ``(K, 3)``
         Which Zernike polynomials to sum. The ``(int, int)`` is the index ``(n, m)``, 
         which correspond to the azimuthal degree and order of the polynomial.
         The ``float`` is the weight for the given index.
+        An array of ``(n, m, weight)`` rows, as returned by :meth:`.zernike_fit()`,
+        is also accepted.
     aperture : {"circular", "elliptical", "cropped"} OR (float, float) OR None
         How to scale the polynomials relative to the grid shape. This is relative
         to the :math:`R = 1` edge of a standard Zernike pupil.
@@ -250,29 +252,15 @@ def zernike_sum(grid, weights, aperture=None):
     """
     # Parse passed values
     (x_grid, y_grid) = _process_grid(grid)
+    (x_scale, y_scale) = _zernike_aperture(x_grid, y_grid, aperture)
 
-    if aperture is None:
-        aperture = "circular"
-
-    if isinstance(aperture, str):
-        if aperture == "elliptical":
-            x_scale = 1 / np.nanmax(x_grid)
-            y_scale = 1 / np.nanmax(y_grid)
-        elif aperture == "circular":
-            x_scale = y_scale = 1 / np.amin([np.nanmax(x_grid), np.nanmax(y_grid)])
-        elif aperture == "cropped":
-            x_scale = y_scale = 1 / np.sqrt(np.nanmax(np.square(x_grid) + np.square(y_grid)))
-        else:
-            raise ValueError("NotImplemented")
-    elif isinstance(aperture, (list, tuple)) and len(aperture) == 2:
-        x_scale = aperture[0]
-        y_scale = aperture[1]
-    else:
-        raise ValueError("Type {} not recognized.".format(type(aperture)))
+    if isinstance(weights, np.ndarray):
+        weights = [((int(n), int(m)), weight) for (n, m, weight) in weights]
 
     # At the end, we're going to set the values outside the aperture to zero.
-    # Make a mask for this if it's necessary.
-    mask = np.square(x_grid * x_scale) + np.square(y_grid * y_scale) <= 1
+    # Make a mask for this if it's necessary. Allow for rounding such that the corners
+    # of the grid are kept for the "cropped" aperture.
+    mask = np.square(x_grid * x_scale) + np.square(y_grid * y_scale) <= 1 + 1e-9
     use_mask = np.any(mask == 0)
 
     if use_mask:
@@ -315,6 +303,155 @@ def zernike_sum(grid, weights, aperture=None):
 
     return canvas
 
+def zernike_fit(
+    grid,
+    points,
+    gradients,
+    phases=None,
+    weights=None,
+    order=6,
+    aperture="cropped",
+    iterations=2
+):
+    r"""
+    Fits a :meth:`.zernike_sum()` to samples of the gradient, and optionally the value,
+    of a phase at scattered ``points`` by weighted linear least squares.
+
+    The gradients determine every polynomial except the piston :math:`Z_{00}`,
+    free of :math:`2\pi` ambiguity. If ``phases`` are given, they are unwrapped against
+    the current fit, and the fit is redone with gradients and phases together, for
+    ``iterations`` rounds. The gradients are then weighed against the phases by the
+    typical spacing between ``points``, i.e. as the phase difference between neighbors.
+
+    Tip
+    ~~~
+    The returned weights describe the phase independently of the sampling of ``grid``,
+    so the phase can be regenerated for any resolution with :meth:`.zernike_sum()`
+    with the same ``aperture``. This is a compact way to store a phase.
+
+    Parameters
+    ----------
+    grid : (array_like, array_like) OR :class:`~slmsuite.hardware.slms.slm.SLM`
+        Meshgrids of normalized :math:`\frac{x}{\lambda}` coordinates
+        corresponding to SLM pixels, in ``(x_grid, y_grid)`` form.
+        Only used to scale the ``aperture``.
+    points : array_like of shape ``(2, N)``
+        Positions of the samples in the normalized coordinates of ``grid``.
+    gradients : array_like of shape ``(2, N)``
+        Derivatives of the phase along :math:`x` and :math:`y` at each point,
+        in radians per normalized unit. For instance :math:`2\pi \vec{k}` for a
+        :meth:`blaze()` of vector :math:`\vec{k}`.
+    phases : array_like of shape ``(N,)`` OR None
+        Phase at each point, possibly wrapped. If ``None``, only the gradients are fit
+        and the piston is zero.
+    weights : array_like of shape ``(N,)`` OR None
+        Confidence in each sample. Samples with zero weight or non-finite data are
+        ignored. Defaults to uniform.
+    order : int
+        Highest degree :math:`n` to fit. All indices :math:`0 \le m \le n \le` ``order``
+        are fit.
+    aperture : {"circular", "elliptical", "cropped"} OR (float, float) OR None
+        See :meth:`.zernike_sum()`. Defaults to ``"cropped"`` such that the whole
+        ``grid`` is within the pupil.
+    iterations : int
+        Number of rounds of unwrapping ``phases`` and refitting.
+
+    Returns
+    -------
+    numpy.ndarray
+        Array of shape ``(K, 3)`` with rows ``(n, m, weight)``, accepted as the
+        ``weights`` of :meth:`.zernike_sum()`.
+    """
+    (x_grid, y_grid) = _process_grid(grid)
+    (x_scale, y_scale) = _zernike_aperture(x_grid, y_grid, aperture)
+
+    points = np.array(points, dtype=float)
+    gradients = np.array(gradients, dtype=float)
+    if weights is None:
+        weights = np.ones(points.shape[1])
+    weights = np.array(weights, dtype=float)
+
+    # Ignore samples without weight or with undefined data.
+    valid = np.isfinite(weights) & (weights > 0)
+    valid &= np.all(np.isfinite(points), axis=0) & np.all(np.isfinite(gradients), axis=0)
+    if phases is not None:
+        phases = np.array(phases, dtype=float)
+        valid &= np.isfinite(phases)
+        phases = phases[valid]
+
+    points = points[:, valid]
+    gradients = gradients[:, valid]
+    weights = np.sqrt(weights[valid])
+
+    # Evaluate each polynomial and its derivatives at the points, term by term.
+    indices = [(n, m) for n in range(order + 1) for m in range(n + 1)]
+
+    x = points[0] * x_scale
+    y = points[1] * y_scale
+
+    basis = np.zeros((len(x), len(indices)))
+    basis_x = np.zeros_like(basis)
+    basis_y = np.zeros_like(basis)
+
+    for (k, (n, m)) in enumerate(indices):
+        for ((a, b), factor) in _zernike_coefficients(n, m).items():
+            basis[:, k] += factor * np.power(x, a) * np.power(y, b)
+            if a > 0:
+                basis_x[:, k] += factor * a * x_scale * np.power(x, a - 1) * np.power(y, b)
+            if b > 0:
+                basis_y[:, k] += factor * b * y_scale * np.power(x, a) * np.power(y, b - 1)
+
+    def solve(matrices, targets):
+        matrix = np.vstack([weights[:, np.newaxis] * matrix for matrix in matrices])
+        target = np.hstack([weights * target for target in targets])
+        return np.linalg.lstsq(matrix, target, rcond=None)[0]
+
+    # Fit the gradients, which do not constrain the piston.
+    coefficients = solve((basis_x, basis_y), gradients)
+
+    if phases is not None and len(phases):
+        piston = indices.index((0, 0))
+        spacing = np.sqrt(np.prod(np.ptp(points, axis=1)) / len(phases))
+
+        for _ in range(iterations):
+            residual = np.angle(np.exp(1j * (phases - basis @ coefficients)))
+            coefficients[piston] += np.angle(np.sum(np.square(weights) * np.exp(1j * residual)))
+
+            unwrapped = basis @ coefficients + np.angle(np.exp(1j * (phases - basis @ coefficients)))
+
+            coefficients = solve(
+                (basis, spacing * basis_x, spacing * basis_y),
+                (unwrapped, spacing * gradients[0], spacing * gradients[1])
+            )
+
+    return np.column_stack((np.array(indices), coefficients))
+
+def _zernike_aperture(x_grid, y_grid, aperture):
+    """
+    Returns the ``(x_scale, y_scale)`` which map the grid to the unit pupil for the
+    given ``aperture``. See :meth:`.zernike_sum()`.
+    """
+    if aperture is None:
+        aperture = "circular"
+
+    if isinstance(aperture, str):
+        if aperture == "elliptical":
+            x_scale = 1 / np.nanmax(x_grid)
+            y_scale = 1 / np.nanmax(y_grid)
+        elif aperture == "circular":
+            x_scale = y_scale = 1 / np.amin([np.nanmax(x_grid), np.nanmax(y_grid)])
+        elif aperture == "cropped":
+            x_scale = y_scale = 1 / np.sqrt(np.nanmax(np.square(x_grid) + np.square(y_grid)))
+        else:
+            raise ValueError("NotImplemented")
+    elif isinstance(aperture, (list, tuple)) and len(aperture) == 2:
+        x_scale = aperture[0]
+        y_scale = aperture[1]
+    else:
+        raise ValueError("Type {} not recognized.".format(type(aperture)))
+
+    return (x_scale, y_scale)
+
 _zernike_cache = {}
 
 def _zernike_coefficients(n, m):
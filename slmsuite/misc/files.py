@@ -264,3 +264,74 @@ def write_h5(file_path, data, mode="w"):
 
     with h5py.File(file_path, mode) as file_:
         recurse(file_, data)
+
+
+def append_h5(file_path, data, chunk_size=64):
+    """
+    Append a record to resizable datasets in an `h5 file
+    <https://docs.h5py.org/en/stable/high/file.html#opening-creating-files>`_,
+    creating the file and datasets as needed. This is useful for incremental
+    persistence (checkpointing) of long measurements, as each record is on disk
+    once this function returns.
+
+    Each value of ``data`` is one record. The corresponding dataset has an extra leading
+    axis which grows by one with every call, such that :meth:`read_h5()` returns
+    arrays of shape ``(record_count, ...)``. Datasets are chunked along this axis.
+
+    Parameters
+    ----------
+    file_path : str
+        Full path to the file to append the data to.
+    data : dict
+        Dictionary of data to append, with the same restrictions as :meth:`write_h5()`.
+        The shape and type of each value must be the same in every call.
+        Nested dictionaries are appended to the corresponding h5 groups.
+    chunk_size : int
+        Number of records per chunk, when a dataset is created.
+
+    Returns
+    -------
+    int
+        The number of records in the file after appending, as counted by the
+        first dataset of ``data``.
+    """
+    def recurse(group, data):
+        count = None
+
+        for key in data.keys():
+            if isinstance(data[key], dict):
+                count_ = recurse(group.require_group(key), data[key])
+            else:
+                if isinstance(data[key], str):
+                    array = np.array(bytes(data[key], 'utf-8'))
+                elif data[key] is None:
+                    array = np.array(False)
+                else:
+                    array = np.array(data[key])
+
+                if array.dtype.char == "U":
+                    array = np.vectorize(str.encode)(array)
+
+                if key not in group:
+                    group.create_dataset(
+                        key,
+                        shape=(0,) + array.shape,
+                        maxshape=(None,) + array.shape,
+                        chunks=(chunk_size,) + array.shape,
+                        dtype=array.dtype,
+                    )
+
+                dataset = group[key]
+                count_ = dataset.shape[0] + 1
+                dataset.resize(count_, axis=0)
+                dataset[count_ - 1] = array
+
+            if count is None:
+                count = count_
+
+        return count
+
+    with h5py.File(file_path, "a") as file_:
+        count = recurse(file_, data)
+
+    return count
@@ -0,0 +1,79 @@
+"""
+Tests that frames paired with an SLM write are never exposed before the write.
+"""
+import time
+
+import numpy as np
+import pytest
+
+from slmsuite.hardware.slms.virtual import VirtualSLM
+from slmsuite.hardware.cameras.simulated import SimulatedCamera
+from slmsuite.holography import toolbox
+
+EXPOSURE_S = 0.005
+LATENCY_S = 0.02
+
+
+def make_camera(hardware_timestamps):
+    """Simulated camera with a readout delay, optionally without hardware timestamps."""
+    slm = VirtualSLM(32, 32)
+    cam = SimulatedCamera(
+        slm, pad=2, exposure_s=EXPOSURE_S, latency_s=LATENCY_S, gain=2 ** 8 / EXPOSURE_S
+    )
+    if not hardware_timestamps:
+        cam._get_image_timestamp = lambda: None
+    return slm, cam
+
+
+def patterns(slm):
+    """Two phase patterns whose farfield spots are far apart on the camera."""
+    return [
+        toolbox.phase.blaze(grid=slm, vector=(0.1, 0)),
+        toolbox.phase.blaze(grid=slm, vector=(-0.1, 0)),
+    ]
+
+
+def spot(image):
+    """Column of the brightest pixel, which distinguishes the two patterns."""
+    return np.unravel_index(np.argmax(image), image.shape)[1]
+
+
+def reference_spots(slm, cam):
+    spots = []
+    for phase in patterns(slm):
+        slm.write(phase, settle=False)
+        spots.append(spot(cam.get_image()))
+    assert spots[0] != spots[1]
+    return spots
+
+
+@pytest.mark.parametrize("hardware_timestamps", [True, False])
+def test_get_image_after_without_engine(hardware_timestamps):
+    slm, cam = make_camera(hardware_timestamps)
+    spots = reference_spots(slm, cam)
+
+    for i in range(4):
+        slm.write(patterns(slm)[i % 2], settle=False)
+        image = cam.get_image_after(time.perf_counter())
+        assert spot(image) == spots[i % 2]
+
+
+@pytest.mark.parametrize("hardware_timestamps", [True, False])
+@pytest.mark.parametrize("latency_s", [None, 0])
+def test_next_after_rejects_stale_frames(hardware_timestamps, latency_s):
+    slm, cam = make_camera(hardware_timestamps)
+    spots = reference_spots(slm, cam)
+
+    # latency_s=0 underestimates the readout delay; the guard must still hold.
+    cam.start_acquisition(frame_count=4, latency_s=latency_s)
+    try:
+        for i in range(8):
+            # Land the write at varying phases of the frame in flight.
+            time.sleep((i % 4) * (EXPOSURE_S + LATENCY_S) / 4)
+            slm.write(patterns(slm)[i % 2], settle=False)
+            t = time.perf_counter()
+            image, _, start = cam.next_after(t, return_metadata=True)
+            assert start >= t
+            assert spot(image) == spots[i % 2]
+    finally:
+        cam.stop_acquisition()
@@ -0,0 +1,62 @@
+"""
+Tests that adaptive wavefront calibration refines curved wavefronts as finely as
+a uniform calibration.
+"""
+import warnings
+
+import numpy as np
+
+from slmsuite.hardware.slms.virtual import VirtualSLM
+from slmsuite.hardware.cameras.simulated import SimulatedCamera
+from slmsuite.hardware.cameraslms import FourierSLM
+
+SIZE = 64
+PAD = 4
+
+
+def make_fourierslm(aberration):
+    """Fourier-calibrated simulated setup with the given SLM aberration."""
+    slm = VirtualSLM(SIZE, SIZE, dx_um=8, dy_um=8, wav_um=0.8)
+    cam = SimulatedCamera(
+        slm, pad=PAD, aberration=aberration, exposure_s=1, gain=2 ** 16 * 8000, bitdepth=16
+    )
+    fs = FourierSLM(cam, slm)
+    fs.fourier_calibration = {"M": cam.M, "b": cam.b, "a": np.zeros((2, 1))}
+    return fs
+
+
+def residual(fs, truth):
+    """RMS of the processed correction against ``truth``, up to a piston."""
+    correction = fs.process_wavefront_calibration(smooth=False, apply=False)
+    error = np.angle(np.exp(1j * (correction["phase_correction"] - truth)))
+    error = np.angle(np.exp(1j * (error - np.angle(np.mean(np.exp(1j * error))))))
+    return np.std(error)
+
+
+def test_refine_defocus():
+    # Defocus, for which neighboring corrections match where they meet.
+    (y, x) = np.mgrid[-1:1:SIZE * 1j, -1:1:SIZE * 1j]
+    aberration = 3 * (x ** 2 + y ** 2) + 1.5 * x ** 3
+    fs = make_fourierslm(aberration)
+
+    center = np.array(fs.cam.b).ravel()
+    scale = SIZE * PAD / 512
+    kwargs = dict(
+        interference_point=[center[0] + 100 * scale, center[1] + 60 * scale],
+        field_point=[center[0] - 200 * scale, center[1]],
+        superpixel_size=8,
+        phase_steps=6,
+        plot=-1,
+    )
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+
+        fs.wavefront_calibrate(**kwargs)
+        uniform = residual(fs, -aberration)
+
+        fs.wavefront_calibrate(refine=2, refine_tolerance=0.3, **kwargs)
+        refined = residual(fs, -aberration)
+
+    assert uniform < 0.2
+    assert refined < uniform + 0.05
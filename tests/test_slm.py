@@ -0,0 +1,79 @@
+"""
+Tests that SLM.write_async() displays every pattern, in order, and leaves phase and
+display describing the last one, and that SLM.preload_sequence() streams patterns.
+"""
+import time
+
+import numpy as np
+import pytest
+
+from slmsuite.hardware.slms.virtual import VirtualSLM
+
+N_WRITES = 300
+
+
+class SlowSLM(VirtualSLM):
+    """
+    Virtual SLM whose hardware write takes a millisecond, about as long as the
+    conversion of the next pattern, such that the two overlap.
+    """
+
+    def _write_hw(self, display):
+        time.sleep(0.001)
+        super()._write_hw(display)
+
+
+def test_write_async_stress():
+    slm = SlowSLM(512, 512, record=True)
+    reference = VirtualSLM(512, 512)
+
+    rng = np.random.default_rng(0)
+    phases = rng.uniform(0, 2 * np.pi, size=(N_WRITES,) + slm.shape)
+
+    expected_display = []
+    for phase in phases:
+        reference.write(phase, settle=False)
+        expected_display.append(reference.display.copy())
+
+    slm.history.clear()     # Drop the frame written on startup.
+    try:
+        for phase in phases:
+            slm.write_async(phase)
+        slm._wait_async()
+
+        assert len(slm.history) == N_WRITES
+        wrong = [
+            i for (i, (_, frame)) in enumerate(slm.history)
+            if not np.array_equal(frame, expected_display[i])
+        ]
+        assert wrong == []
+
+        np.testing.assert_array_equal(slm.display, expected_display[-1])
+        np.testing.assert_allclose(slm.phase, reference.phase)
+    finally:
+        slm.close()
+
+
+def test_preload_sequence_streams(tmp_path):
+    slm = VirtualSLM(16, 16)
+
+    rng = np.random.default_rng(0)
+    phases = rng.uniform(0, 2 * np.pi, size=(20,) + slm.shape)
+
+    expected = slm.preload_sequence(phases).copy()
+    displayed = slm.phase.copy()
+
+    # Generators are converted as they yield, growing the sequence if needed.
+    np.testing.assert_array_equal(slm.preload_sequence(p for p in phases), expected)
+    np.testing.assert_array_equal(
+        slm.preload_sequence((p for p in phases), n_frames=len(phases)), expected
+    )
+    memmap = str(tmp_path / "sequence.npy")
+    slm.preload_sequence((p for p in phases), memmap=memmap, n_frames=len(phases))
+    np.testing.assert_array_equal(np.load(memmap, mmap_mode="r"), expected)
+    np.testing.assert_array_equal(slm.phase, displayed)
+
+    with pytest.raises(ValueError):
+        slm.preload_sequence((p for p in phases), n_frames=len(phases) - 1)
+    with pytest.raises(ValueError):
+        slm.preload_sequence((p for p in phases), memmap=memmap)
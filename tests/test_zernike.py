@@ -0,0 +1,49 @@
+"""
+Tests that toolbox.phase.zernike_fit() recovers the phase of a zernike_sum().
+"""
+import numpy as np
+import pytest
+
+from slmsuite.hardware.slms.virtual import VirtualSLM
+from slmsuite.holography import toolbox
+
+# (n, m, weight) rows, as returned by zernike_fit(). The phase spans several 2pi.
+WEIGHTS = np.array([
+    [0, 0, 0.4],
+    [2, 0, 4.0],
+    [2, 1, -2.0],
+    [3, 1, 1.2],
+    [4, 2, 0.8],
+])
+
+
+@pytest.mark.parametrize("with_phases", [True, False])
+def test_zernike_fit_round_trip(with_phases):
+    slm = VirtualSLM(64, 64)
+    (x_grid, y_grid) = (slm.x_grid, slm.y_grid)
+
+    truth = toolbox.phase.zernike_sum(slm, WEIGHTS, aperture="cropped")
+
+    # Sample the gradient and the wrapped phase at the centers of 8x8 superpixels.
+    gradient_y = np.gradient(truth, y_grid[:, 0], axis=0)
+    gradient_x = np.gradient(truth, x_grid[0, :], axis=1)
+    (iy, ix) = np.meshgrid(np.arange(4, 64, 8), np.arange(4, 64, 8), indexing="ij")
+    (iy, ix) = (iy.ravel(), ix.ravel())
+
+    fit = toolbox.phase.zernike_fit(
+        slm,
+        points=(x_grid[iy, ix], y_grid[iy, ix]),
+        gradients=(gradient_x[iy, ix], gradient_y[iy, ix]),
+        phases=np.mod(truth[iy, ix], 2 * np.pi) if with_phases else None,
+        order=4,
+        aperture="cropped",
+    )
+    assert fit.shape == (15, 3)
+
+    recovered = toolbox.phase.zernike_sum(slm, fit, aperture="cropped")
+    error = recovered - truth
+    if not with_phases:
+        error -= np.mean(error)     # The piston is unknown without phases.
+
+    assert np.ptp(truth) > 2 * np.pi
+    assert np.sqrt(np.mean(np.square(error))) < 0.01